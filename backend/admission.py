@@ -0,0 +1,135 @@
+# backend/admission.py
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict
+
+from backend.job_store import JobStore
+from backend.models import STAGES
+from backend.scheduler import PRIORITY_CLASSES
+
+# Priors used until a stage has real observations (seconds)
+DEFAULT_STAGE_LATENCIES = {
+    "research": 60.0,
+    "critical_analysis": 40.0,
+    "mvp_plan": 20.0,
+    "pitch": 15.0,
+}
+
+
+@dataclass
+class AdmissionDecision:
+    admitted: bool
+    estimated_wait: float
+    retry_after: int = 0
+    reason: str = ""
+
+
+class AdmissionController:
+    """Concurrency governor in front of the job queue.
+
+    Estimates how long a new workflow would wait before starting, from the
+    work already queued or running and the stage latencies recently observed
+    in the job store. Each stage is charged to the LLM provider that serves it,
+    and each provider drains at its own concurrency, so a saturated local
+    Ollama is detected even when worker processes are idle. Requests whose
+    estimated wait exceeds the SLO are rejected up front instead of timing out.
+    """
+
+    def __init__(self, store: JobStore, worker_slots: int, max_wait_seconds: float,
+                 stage_providers: Dict[str, str], provider_concurrency: Dict[str, int],
+                 refresh_seconds: float = 5.0):
+        self.store = store
+        self.worker_slots = max(worker_slots, 1)
+        self.max_wait_seconds = max_wait_seconds
+        self.stage_providers = stage_providers
+        self.provider_concurrency = provider_concurrency
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, float] = dict(DEFAULT_STAGE_LATENCIES)
+        self._latencies_at = 0.0
+
+    def stage_latencies(self) -> Dict[str, float]:
+        """Observed per-stage latencies (cached briefly; every request asks)"""
+        with self._lock:
+            if time.time() - self._latencies_at > self.refresh_seconds:
+                self._latencies = {**DEFAULT_STAGE_LATENCIES, **self.store.recent_stage_latencies()}
+                self._latencies_at = time.time()
+            return dict(self._latencies)
+
+    def snapshot(self, priority: str = "interactive", jobs: int = 1) -> Dict[str, Any]:
+        """Queue depth, in-flight work per provider and the resulting wait estimate
+
+        Queued jobs of a lower priority class than `priority` are not counted:
+        the scheduler will run the new job ahead of them. With `jobs` > 1 the
+        estimate is for the last of that many new workflows, which queue
+        behind the other `jobs - 1`.
+        """
+        latencies = self.stage_latencies()
+        rank = PRIORITY_CLASSES.index(priority)
+        active = [
+            job for job in self.store.active_jobs()
+            if job["status"] == "running" or PRIORITY_CLASSES.index(job["priority"]) <= rank
+        ]
+
+        provider_backlog: Dict[str, float] = {provider: 0.0 for provider in self.provider_concurrency}
+        provider_in_flight: Dict[str, int] = {provider: 0 for provider in self.provider_concurrency}
+        total_backlog = 0.0
+
+        for job in active:
+            remaining = [stage for stage in STAGES if stage not in job["completed_stages"]]
+            if job["status"] == "running" and remaining:
+                provider_in_flight[self.stage_providers[remaining[0]]] += 1
+            for stage in remaining:
+                provider_backlog[self.stage_providers[stage]] += latencies[stage]
+                total_backlog += latencies[stage]
+        ahead = max(jobs, 1) - 1
+        for stage in STAGES:
+            provider_backlog[self.stage_providers[stage]] += latencies[stage] * ahead
+            total_backlog += latencies[stage] * ahead
+
+        # A new job starts once either the worker slots or the busiest provider frees up
+        worker_wait = total_backlog / self.worker_slots
+        provider_waits = {
+            provider: backlog / max(self.provider_concurrency[provider], 1)
+            for provider, backlog in provider_backlog.items()
+        }
+        estimated_wait = max([worker_wait, *provider_waits.values()])
+
+        return {
+            "queued": sum(job["status"] == "queued" for job in active),
+            "running": sum(job["status"] == "running" for job in active),
+            "in_flight_by_provider": provider_in_flight,
+            "backlog_seconds_by_provider": provider_waits,
+            "stage_latencies": latencies,
+            "estimated_workflow_seconds": sum(latencies[stage] for stage in STAGES),
+            "estimated_wait_seconds": estimated_wait,
+            "max_wait_seconds": self.max_wait_seconds,
+        }
+
+    def check(self, priority: str = "interactive", jobs: int = 1) -> AdmissionDecision:
+        """Admit `jobs` new workflows (all or none), or say how long to back off"""
+        snapshot = self.snapshot(priority, jobs)
+        estimated_wait = snapshot["estimated_wait_seconds"]
+        if estimated_wait <= self.max_wait_seconds:
+            return AdmissionDecision(admitted=True, estimated_wait=estimated_wait)
+
+        # Come back once enough backlog has drained to fit under the SLO
+        retry_after = max(1, math.ceil(estimated_wait - self.max_wait_seconds))
+        busiest = max(snapshot["backlog_seconds_by_provider"].items(), key=lambda item: item[1])[0]
+        return AdmissionDecision(
+            admitted=False,
+            estimated_wait=estimated_wait,
+            retry_after=retry_after,
+            reason=f"Queue wait ~{estimated_wait:.0f}s exceeds {self.max_wait_seconds:.0f}s SLO ({busiest} saturated)"
+        )
+
+
+def default_stage_providers(groq_available: bool) -> Dict[str, str]:
+    """Which provider serves each stage (mirrors AIStrategistOrchestrator's LLM wiring)"""
+    remote = "groq" if groq_available else "ollama"
+    return {"research": "ollama", "critical_analysis": "ollama", "mvp_plan": remote, "pitch": remote}
+
+
+__all__ = ['AdmissionController', 'AdmissionDecision', 'default_stage_providers']
@@ -1,5 +1,4 @@
 # backend/agents/architect_agent.py
-from crewai import Agent
 from textwrap import dedent
 
 class SolutionArchitectAgents:
@@ -7,8 +6,10 @@ class SolutionArchitectAgents:
     
     def enhanced_solution_architect_with_team_focus(self, llm, team_strength: str, hackathon_duration: int):
         """Create a simplified team-focused solution architect agent"""
+        from crewai import Agent
         
-        # Define team-specific focus areas
+        # Define team-specific focus areas; the time constraint is bucketed so the
+        # system prompt stays identical for every request in the same bucket
         team_focus = self._get_team_focus(team_strength)
         time_constraint = self._get_time_constraint(hackathon_duration)
         
@@ -16,7 +17,7 @@ class SolutionArchitectAgents:
             role=f'{team_strength} Solution Architect',
             goal=dedent(f"""
                 Design a practical MVP architecture that maximizes {team_strength} team strengths 
-                within {hackathon_duration} hours, focusing on {team_focus['priority']} and ensuring 
+                within the hackathon duration given in the task, focusing on {team_focus['priority']} and ensuring 
                 {team_focus['delivery']}.
             """),
             backstory=dedent(f"""
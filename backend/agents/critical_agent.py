@@ -1,15 +1,6 @@
 # backend/agents/critical_agent.py
-from crewai import Agent
-from crewai_tools import SerperDevTool
 from typing import Dict, List
-
-# Enhanced search tool for risk analysis
-search_tool = SerperDevTool(
-    n_results=6,
-    country="us",
-    locale="en", 
-    timeout=10
-)
+from backend.tools import get_search_tool
 
 class CriticalAgents:
     """Enhanced critical analysis agents with hackathon failure prediction"""
@@ -127,6 +118,8 @@ class CriticalAgents:
 
     # MODIFICATION: Added `hackathon_duration` parameter
     def critical_agent(self, llm, hackathon_duration: int):
+        from crewai import Agent
+
         return Agent(
             role='Hackathon Risk Assessment Expert',
             # MODIFICATION: Goal now explicitly mentions hackathon duration
@@ -175,7 +168,7 @@ class CriticalAgents:
             
             verbose=True,
             allow_delegation=False,
-            tools=[search_tool],
+            tools=[get_search_tool("critical")],
             llm=llm,
             agent_executor_kwargs={
                 "handle_parsing_errors": True,
@@ -187,18 +180,18 @@ class CriticalAgents:
     # MODIFICATION: Added `hackathon_duration` parameter
     def enhanced_critical_agent_with_team_focus(self, llm, team_strength: str, hackathon_duration: int):
         """Create a critical agent specifically tuned to team strength failure patterns"""
+        from crewai import Agent
         
         risk_patterns = self.get_team_risk_patterns(team_strength)
         common_failures = ", ".join(risk_patterns["scope_creep_risks"][:2])
         
         return Agent(
             role=f'{team_strength} Team Risk Assessment Specialist',
-            # MODIFICATION: Goal now explicitly mentions hackathon duration
+            # Duration-free so the system prompt stays a stable cache prefix; the task carries it
             goal=f'''Identify and prevent the most common failure modes that specifically plague 
-                    {team_strength} teams in a {hackathon_duration}-hour hackathon environment. Provide team-specific risk 
+                    {team_strength} teams in a time-boxed hackathon environment. Provide team-specific risk 
                     mitigation strategies based on {team_strength} team behavioral patterns.''',
             
-            # MODIFICATION: Backstory now references hackathon duration
             backstory=f'''You are the world's leading expert on {team_strength} team failures in hackathon 
                          environments. You have analyzed hundreds of {team_strength} team projects and 
                          identified the specific patterns that lead to their success or failure.
@@ -223,7 +216,7 @@ class CriticalAgents:
                          RISK PREDICTION METHODOLOGY:
                          1. Search for recent {team_strength} team hackathon failures and lessons learned
                          2. Analyze technical complexity vs. {team_strength} team typical capabilities
-                         3. Evaluate scope realism based on {team_strength} team time allocation patterns for a {hackathon_duration}-hour project
+                         3. Evaluate scope realism based on {team_strength} team time allocation patterns for the duration given in the task
                          4. Predict demo risks specific to {team_strength} team presentation styles
                          5. Assess competitive threats that {team_strength} teams often miss
                          
@@ -236,7 +229,7 @@ class CriticalAgents:
             
             verbose=True,
             allow_delegation=False,
-            tools=[search_tool],
+            tools=[get_search_tool("critical")],
             llm=llm,
             agent_executor_kwargs={
                 "handle_parsing_errors": True,
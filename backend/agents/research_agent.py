@@ -1,15 +1,6 @@
 # backend/agents/research_agent.py
-from crewai import Agent
-from crewai_tools import SerperDevTool
 from typing import Dict, List
-import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-# Initialize search tool with proper configuration
-search_tool = SerperDevTool()
+from backend.tools import get_search_tool
 
 class ResearchAgents:
     """Enhanced research agents with hackathon-specific intelligence"""
@@ -82,6 +73,8 @@ class ResearchAgents:
         return strategies.get(team_strength, strategies["Full-Stack"])
 
     def research_agent(self, llm, hackathon_duration: int):
+        from crewai import Agent
+
         return Agent(
             role='Hackathon Market Intelligence Specialist',
             goal=f'''Execute comprehensive market research that provides actionable intelligence 
@@ -114,15 +107,20 @@ class ResearchAgents:
             
             verbose=True,
             allow_delegation=False,
-            tools=[search_tool],
+            tools=[get_search_tool("research")],
             llm=llm,
-            max_iter=3,
-            memory=True
+            max_iter=3
         )
     
     def enhanced_research_agent_with_team_focus(self, llm, team_strength: str, hackathon_duration: int):
-        """Create a research agent specifically optimized for a team's strength"""
+        """Create a research agent specifically optimized for a team's strength
+
+        Role/goal/backstory only depend on the team so the system prompt is a
+        stable cache prefix; the duration reaches the model via the task.
+        """
         
+        from crewai import Agent
+
         strategy = self.get_team_search_strategy(team_strength)
         focus_areas = ", ".join(strategy["focus_areas"])
         
@@ -130,7 +128,7 @@ class ResearchAgents:
             role=f'{team_strength} Team Market Research Specialist',
             goal=f'''Provide hyper-targeted market research for {team_strength} teams, focusing on 
                     {focus_areas} and identifying opportunities that maximize {team_strength} capabilities 
-                    in a {hackathon_duration}-hour environment.
+                    within the hackathon duration given in the task.
                     
                     MANDATORY: USE SEARCH TOOL FOR ALL INFORMATION. NO TRAINING DATA ALLOWED.''',
             
@@ -152,14 +150,13 @@ class ResearchAgents:
                          3. Market gaps that require {team_strength} expertise
                          4. Recent {team_strength} hackathon winning projects
                          
-                         Time limit: {hackathon_duration} hours - all solutions must be rapid to implement.
+                         Time limit: the hackathon duration given in the task - all solutions must be rapid to implement.
                          
                          FAILURE TO SEARCH = FAILURE TO DO YOUR JOB.''',
             
             verbose=True,
             allow_delegation=False,
-            tools=[search_tool],
+            tools=[get_search_tool("research")],
             llm=llm,
-            max_iter=4,
-            memory=True
+            max_iter=4
         )
\ No newline at end of file
@@ -2,13 +2,88 @@
 # backend/api.py - FastAPI Integration
 # ===================================
 
-from fastapi import FastAPI, HTTPException
+import asyncio
+import hashlib
+import time
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
-from backend.orchestrator import AIStrategistOrchestrator
-import uvicorn
+from fastapi.middleware.gzip import GZipMiddleware
+from backend.admission import AdmissionController, default_stage_providers
+from backend.config import get_settings
+from backend.models import STAGE_ALIASES, STAGES, VALID_STRENGTHS
+from backend.refinement import diff_ideas
+from backend.result_store import create_result_store
+from backend.scheduler import PRIORITY_CLASSES
+from backend.search_index import SEARCH_MODES
+from backend.warmup import ModelWarmup
+from backend.worker_pool import create_worker_pool
+
+worker_pool = None
+admission = None
+warmup = None
+result_store = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the orchestrator workers with the app and stop them on shutdown"""
+    global worker_pool, admission, warmup, result_store
+    settings = get_settings()
+    worker_pool = create_worker_pool(settings.worker_count)
+    result_store = create_result_store()
+    admission = AdmissionController(
+        worker_pool.store,
+        worker_slots=max(settings.worker_count, 1),
+        max_wait_seconds=settings.max_queue_wait_seconds,
+        stage_providers=default_stage_providers(settings.groq_available),
+        provider_concurrency={"ollama": settings.ollama_slots, "groq": settings.groq_concurrency}
+    )
+    worker_pool.start()
+    # Workers only keyword-index finished runs; embed them for semantic search here
+    if result_store.index is not None:
+        result_store.index.start_embedder()
+
+    # Prime the models in the background: /health answers immediately, /ready once warm
+    warmup = ModelWarmup(settings)
+    warmup_task = asyncio.create_task(asyncio.to_thread(warmup.run)) if settings.warmup_enabled else None
+    yield
+    warmup.stop()
+    if warmup_task is not None:
+        warmup_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup_task
+    if result_store.index is not None:
+        result_store.index.stop_embedder()
+    worker_pool.shutdown()
 
-app = FastAPI(title="AI Strategist API", version="1.0.0")
+try:
+    # orjson serializes the large markdown strings several times faster than json
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
+app = FastAPI(title="AI Strategist API", version="1.0.0", lifespan=lifespan,
+              default_response_class=DefaultResponse)
+
+def add_compression(app: FastAPI) -> None:
+    """Compress responses above a size threshold: brotli (gzip for older clients) or gzip"""
+    settings = get_settings()
+    if settings.response_compression == "brotli":
+        try:
+            from brotli_asgi import BrotliMiddleware
+            app.add_middleware(BrotliMiddleware, minimum_size=settings.compression_min_bytes, gzip_fallback=True)
+            return
+        except ImportError:
+            print("⚠️ brotli-asgi not installed, compressing responses with gzip")
+    if settings.response_compression != "off":
+        app.add_middleware(GZipMiddleware, minimum_size=settings.compression_min_bytes)
+
+add_compression(app)
 
 # Add CORS middleware for frontend
 app.add_middleware(
@@ -36,60 +111,339 @@ class StrategyResponse(BaseModel):
     team_strength: str = ""
     hackathon_duration: int = 0 # <-- NEW FIELD
     error: str = ""
+    summary: Dict[str, Any] = {}
+    llm_config: Dict[str, str] = {}
+
+class RefineRequest(BaseModel):
+    idea: str
+
+class BatchStrategyRequest(BaseModel):
+    items: List[StrategyRequest]
+
+class JobResponse(BaseModel):
+    job_id: str
+    status: str
+    priority: str = "interactive"
+    submitted_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    attempts: int = 0
+    stages: Dict[str, str] = {}
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    estimated_wait_seconds: Optional[float] = None
+    idea_delta: Optional[Dict[str, Any]] = None
+
+class BatchJobResponse(BaseModel):
+    job_ids: List[str]
+    priority: str = "batch"
+
+class StrategySummary(BaseModel):
+    strategy_id: str
+    theme: str
+    idea: str
+    team_strength: str
+    hackathon_duration: int
+    success: bool
+    created_at: float
+    execution_time: Optional[float] = None
+
+class StrategyListResponse(BaseModel):
+    items: List[StrategySummary]
+    total: int
+    limit: int
+    offset: int
+    next_offset: Optional[int] = None
+
+class StrategySearchHit(StrategySummary):
+    score: float
+    snippet: Optional[str] = None
+
+class StrategySearchResponse(BaseModel):
+    query: str
+    mode: str
+    items: List[StrategySearchHit]
+    took_ms: float
+
+class StrategyDetail(StrategySummary):
+    stage_timings: Dict[str, float] = {}
+    run_config: Dict[str, Any] = {}
+    result: Dict[str, Any]
+
+MAX_BATCH_SIZE = 500
+
+# `fields=research,pitch` limits which stage outputs a response carries
+FIELDS_QUERY = Query(None, description=f"Comma-separated stage outputs to return ({', '.join(STAGES)}); default all")
+
+def parse_fields(fields: Optional[str]) -> Optional[set]:
+    if not fields:
+        return None
+    wanted = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = wanted - set(STAGES)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields {sorted(unknown)}. Must be among: {STAGES}")
+    return wanted
+
+def select_stages(payload: Optional[Dict[str, Any]], wanted: Optional[set]) -> Optional[Dict[str, Any]]:
+    """Drop the stage outputs the client didn't ask for; everything else is kept"""
+    if payload is None or wanted is None:
+        return payload
+    return {key: value for key, value in payload.items() if key not in STAGES or key in wanted}
+
+def validate_request(request: StrategyRequest) -> None:
+    """Reject invalid inputs before they reach a worker"""
+    if request.team_strength not in VALID_STRENGTHS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid team_strength. Must be one of: {VALID_STRENGTHS}"
+        )
+
+    # MODIFICATION: Add validation for hackathon duration
+    if request.hackathon_duration <= 0:
+        raise HTTPException(
+            status_code=400,
+            detail="Hackathon duration must be a positive number."
+        )
+
+def client_key(http_request: Request) -> str:
+    """Fair-share key: API key (hashed), explicit client id, or caller address"""
+    api_key = http_request.headers.get("x-api-key")
+    if api_key:
+        return "key:" + hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+    client_id = http_request.headers.get("x-client-id")
+    if client_id:
+        return "client:" + client_id
+    return "addr:" + (http_request.client.host if http_request.client else "unknown")
 
-# Initialize orchestrator globally
-orchestrator = AIStrategistOrchestrator()
+def admit_request(priority: str = "interactive", jobs: int = 1) -> float:
+    """Apply backpressure: 429 + Retry-After when the estimated queue wait breaks the SLO"""
+    decision = admission.check(priority, jobs)
+    if not decision.admitted:
+        print(f"🚦 Rejected: {decision.reason}")
+        raise HTTPException(
+            status_code=429,
+            detail={"error": decision.reason, "estimated_wait_seconds": round(decision.estimated_wait, 1)},
+            headers={"Retry-After": str(decision.retry_after)}
+        )
+    return decision.estimated_wait
 
 @app.get("/")
 async def root():
     return {"message": "AI Strategist API is running!"}
 
 # MODIFICATION: Updated endpoint to accept the new request model
-@app.post("/generate-strategy", response_model=StrategyResponse)
-async def generate_strategy(request: StrategyRequest):
+@app.post("/generate-strategy", response_model=StrategyResponse, response_model_exclude_unset=True)
+async def generate_strategy(request: StrategyRequest, http_request: Request, fields: Optional[str] = FIELDS_QUERY):
     """
     Generate a personalized strategy based on team strength and hackathon duration.
     """
+    validate_request(request)
+    wanted = parse_fields(fields)
+    admit_request()
     try:
-        # Validate team strength
-        valid_strengths = ["Frontend", "Backend", "AI/ML", "Full-Stack"]
-        if request.team_strength not in valid_strengths:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Invalid team_strength. Must be one of: {valid_strengths}"
-            )
-        
-        # MODIFICATION: Add validation for hackathon duration
-        if request.hackathon_duration <= 0:
-            raise HTTPException(
-                status_code=400,
-                detail="Hackathon duration must be a positive number."
-            )
-
         print(f"🎯 Generating strategy for {request.team_strength} team for {request.hackathon_duration} hours")
         print(f"Theme: {request.theme}")
         print(f"Idea: {request.idea}")
 
-        # MODIFICATION: Pass hackathon_duration to the orchestrator
-        result = orchestrator.run_strategy_workflow(
-            theme=request.theme,
-            idea=request.idea,
-            team_strength=request.team_strength,
-            hackathon_duration=request.hackathon_duration # <-- NEW PARAMETER
-        )
+        # Run on a worker process; awaiting keeps the event loop free for other requests
+        job_id = worker_pool.submit(request.dict(), client_id=client_key(http_request))
+        result = await worker_pool.wait(job_id)
 
-        return StrategyResponse(**result)
+        return StrategyResponse(**select_stages(result, wanted))
 
     except Exception as e:
         print(f"❌ API Error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/jobs", response_model=JobResponse, status_code=202)
+async def submit_job(request: StrategyRequest, http_request: Request, priority: str = "interactive"):
+    """Queue a strategy workflow and return immediately with its job id"""
+    validate_request(request)
+    if priority not in PRIORITY_CLASSES:
+        raise HTTPException(status_code=400, detail=f"Invalid priority. Must be one of: {PRIORITY_CLASSES}")
+    estimated_wait = admit_request(priority)
+    job_id = worker_pool.submit(request.dict(), priority=priority, client_id=client_key(http_request))
+    return JobResponse(**worker_pool.get(job_id), estimated_wait_seconds=round(estimated_wait, 1))
+
+@app.post("/jobs/batch", response_model=BatchJobResponse, status_code=202)
+async def submit_batch(batch: BatchStrategyRequest, http_request: Request):
+    """Queue many workflows at batch priority; they never delay interactive requests"""
+    if len(batch.items) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"Batch too large (max {MAX_BATCH_SIZE} items)")
+    for request in batch.items:
+        validate_request(request)
+    # One decision for the whole batch, counting its own workflows: every item is queued or none is
+    admit_request("batch", jobs=len(batch.items))
+
+    client_id = client_key(http_request)
+    job_ids = [
+        worker_pool.submit(request.dict(), priority="batch", client_id=client_id)
+        for request in batch.items
+    ]
+    print(f"📦 Queued batch of {len(job_ids)} jobs for {client_id}")
+    return BatchJobResponse(job_ids=job_ids)
+
+@app.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str, fields: Optional[str] = FIELDS_QUERY):
+    """Poll a queued workflow; `stages` fills in as each stage lands, `result` once it completes"""
+    wanted = parse_fields(fields)
+    job = worker_pool.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    job["stages"] = select_stages(job["stages"], wanted)
+    job["result"] = select_stages(job["result"], wanted)
+    return JobResponse(**job)
+
+def parse_date(value: Optional[str], name: str, end_of_day: bool = False) -> Optional[float]:
+    """ISO date or datetime -> timestamp; a bare `until` date includes that whole day"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name} date '{value}' (use ISO 8601)")
+    if end_of_day and len(value) == 10:
+        parsed += timedelta(days=1)
+    return parsed.timestamp()
+
+@app.get("/strategies", response_model=StrategyListResponse)
+async def list_strategies(team_strength: Optional[str] = None, theme: Optional[str] = None,
+                          since: Optional[str] = None, until: Optional[str] = None,
+                          limit: int = Query(20, ge=1, le=100), offset: int = Query(0, ge=0)):
+    """Past strategy runs, newest first, filterable by team, theme (case-insensitive) and date"""
+    items, total = result_store.list(
+        team_strength=team_strength,
+        theme=theme,
+        since=parse_date(since, "since"),
+        until=parse_date(until, "until", end_of_day=True),
+        limit=limit,
+        offset=offset
+    )
+    next_offset = offset + len(items) if offset + len(items) < total else None
+    return StrategyListResponse(items=items, total=total, limit=limit, offset=offset, next_offset=next_offset)
+
+# Declared before /strategies/{strategy_id} so "search" isn't taken for an id
+@app.get("/strategies/search", response_model=StrategySearchResponse)
+async def search_strategies(q: str = Query(..., min_length=1), mode: str = "keyword",
+                            limit: int = Query(20, ge=1, le=100)):
+    """Keyword (FTS5), semantic (embeddings) or hybrid search over stored strategies"""
+    if mode not in SEARCH_MODES:
+        raise HTTPException(status_code=400, detail=f"Invalid mode. Must be one of: {SEARCH_MODES}")
+    index = result_store.index
+
+    def run_search():
+        # Loading the model and encoding the query both block; keep them off the event loop
+        if mode != "keyword" and not index.semantic_enabled:
+            return None
+        return index.search(q, mode, limit)
+
+    start = time.perf_counter()
+    hits = await asyncio.to_thread(run_search)
+    if hits is None:
+        raise HTTPException(status_code=501, detail="Semantic search is not available (no embedding model)")
+    summaries = result_store.summaries([hit["strategy_id"] for hit in hits])
+    items = [{**summaries[hit["strategy_id"]], **hit} for hit in hits if hit["strategy_id"] in summaries]
+    took_ms = (time.perf_counter() - start) * 1000
+    return StrategySearchResponse(query=q, mode=mode, items=items, took_ms=round(took_ms, 2))
+
+@app.get("/strategies/{strategy_id}", response_model=StrategyDetail)
+async def get_strategy(strategy_id: str, fields: Optional[str] = FIELDS_QUERY):
+    """A stored strategy with its stage outputs; no regeneration involved"""
+    wanted = parse_fields(fields)
+    record = result_store.get(strategy_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Strategy {strategy_id} not found")
+    record["result"] = select_stages(record["result"], wanted)
+    return StrategyDetail(**record)
+
+@app.post("/strategies/{strategy_id}/regenerate", response_model=JobResponse, status_code=202)
+async def regenerate_stage(strategy_id: str, http_request: Request, stage: str = "pitch"):
+    """Rerun one stage and the stages after it, reusing the stored upstream outputs.
+
+    Returns a new job; once it completes, its job id is the regenerated strategy's id.
+    """
+    stage = STAGE_ALIASES.get(stage, stage)
+    if stage not in STAGES:
+        raise HTTPException(status_code=400,
+                            detail=f"Invalid stage. Must be one of: {STAGES + list(STAGE_ALIASES)}")
+    record = result_store.get(strategy_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Strategy {strategy_id} not found")
+
+    upstream = {name: record["result"].get(name) for name in STAGES[:STAGES.index(stage)]}
+    missing = [name for name, output in upstream.items() if not output]
+    if missing:
+        raise HTTPException(status_code=409, detail=f"Strategy {strategy_id} has no stored output for {missing}")
+
+    estimated_wait = admit_request()
+    payload = {key: record[key] for key in ("theme", "idea", "team_strength", "hackathon_duration")}
+    job_id = worker_pool.submit(payload, client_id=client_key(http_request), completed_stages=upstream)
+    print(f"🔁 Regenerating {stage} of {strategy_id} as job {job_id}")
+    return JobResponse(**worker_pool.get(job_id), estimated_wait_seconds=round(estimated_wait, 1))
+
+@app.post("/strategies/{strategy_id}/refine", response_model=JobResponse, status_code=202)
+async def refine_strategy(strategy_id: str, request: RefineRequest, http_request: Request):
+    """Adapt a stored strategy to an edited idea: each stage edits its previous output.
+
+    The edit is diffed against the old idea first (by embedding when the search
+    model is available); an edit that changes too much runs the full workflow.
+    """
+    record = result_store.get(strategy_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Strategy {strategy_id} not found")
+    previous_outputs = {stage: record["result"].get(stage) for stage in STAGES}
+    if not record["success"] or not all(previous_outputs.values()):
+        raise HTTPException(status_code=409, detail=f"Strategy {strategy_id} did not complete; generate it again")
+
+    index = result_store.index
+
+    def diff():
+        # Loading the model and encoding both block; keep them off the event loop
+        encode = index.encode if index is not None and index.semantic_enabled else None
+        return diff_ideas(record["idea"], request.idea, encode)
+
+    delta = await asyncio.to_thread(diff)
+    if delta.unchanged:
+        raise HTTPException(status_code=400, detail="The idea is unchanged")
+
+    estimated_wait = admit_request()
+    payload = {key: record[key] for key in ("theme", "team_strength", "hackathon_duration")}
+    payload["idea"] = request.idea
+    if not delta.needs_rewrite:
+        payload["refinement"] = {
+            "previous_strategy_id": strategy_id,
+            "previous_outputs": previous_outputs,
+            "delta": delta.to_dict(),
+        }
+    job_id = worker_pool.submit(payload, client_id=client_key(http_request))
+    print(f"✏️ {'Refining' if 'refinement' in payload else 'Regenerating (large edit)'} {strategy_id} "
+          f"as job {job_id}, idea similarity {delta.similarity}")
+    return JobResponse(**worker_pool.get(job_id), estimated_wait_seconds=round(estimated_wait, 1),
+                       idea_delta=delta.to_dict())
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness: models warmed and at least one worker able to take jobs"""
+    ready = warmup.is_ready and worker_pool.ready_workers > 0
+    body = {
+        "ready": ready,
+        "warmup": warmup.report(),
+        "ready_workers": worker_pool.ready_workers
+    }
+    return JSONResponse(status_code=200 if ready else 503, content=body)
+
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy", "service": "AI Strategist"}
+    """Liveness check endpoint (see /ready for readiness)"""
+    return {
+        "status": "healthy",
+        "service": "AI Strategist",
+        "workers": worker_pool.stats(),
+        "admission": admission.snapshot()
+    }
 
 if __name__ == "__main__":
+    import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
 
 # ===================================
@@ -0,0 +1,83 @@
+# backend/architect_engine.py
+import time
+from typing import Any, Dict, Optional
+
+from backend.prompt_templates import architect_templates, duration_bucket
+from backend.quality_gate import REPAIR_INSTRUCTIONS, repair_sections
+from backend.sections import check_sections, completeness, stream_sections, template_sections
+
+VERIFY_INSTRUCTIONS = (REPAIR_INSTRUCTIONS + "\nCheck the draft's claims in those sections against the research "
+                       "and critical analysis while you rewrite them.")
+
+
+class DraftArchitectEngine:
+    """Architect stage drafted by the local model, verified by the larger one.
+
+    The local model fills in the whole OUTPUT TEMPLATE in one completion. Each
+    required section is then checked for presence, length, its bold fields
+    and leftover [placeholders] (backend.sections); sections that pass are
+    kept verbatim, and the larger model is asked to rewrite only the ones
+    that failed. A complete draft costs no large-model call at all.
+    """
+
+    def __init__(self, draft_llm, verify_llm, early_stop: bool = True):
+        self.draft_llm = draft_llm
+        self.verify_llm = verify_llm
+        self.early_stop = early_stop
+        self.last_stats: Dict[str, Any] = {}
+
+    def run(self, idea: str, research_output: str, critical_output: str,
+            team_strength: str, hackathon_duration: int, max_tokens: Optional[int] = None) -> str:
+        start = time.time()
+        templates = architect_templates(team_strength, duration_bucket(hackathon_duration))
+        required = template_sections(templates["description"].prefix)
+        system = (f"You are the Solution Architect of a {team_strength} hackathon team. Fill in every "
+                  "section of the OUTPUT TEMPLATE with specific content; never leave [brackets] in.")
+        prompt = "\n".join([
+            templates["description"].render(idea=idea, hackathon_duration=hackathon_duration,
+                                            research_result=research_output, critical_result=critical_output),
+            templates["expected_output"].render(),
+        ])
+        drafted = stream_sections(self.draft_llm, [("system", system), ("human", prompt)],
+                                  required if self.early_stop else (), max_tokens)
+        draft = drafted.text
+        draft_seconds = time.time() - start
+        draft_checks = check_sections(draft, required)
+        weak = [index for index, check in enumerate(draft_checks) if not check.ok]
+
+        output, verify_usage, fixed = draft, {}, 0
+        if weak:
+            request = templates["description"].suffix.format(
+                idea=idea, hackathon_duration=hackathon_duration,
+                research_result=research_output, critical_result=critical_output
+            )
+            output, fixed, verify_usage = repair_sections(
+                self.verify_llm, draft, required, weak, [draft_checks[index].describe() for index in weak],
+                context=request,
+                system=f"You are the lead Solution Architect reviewing a {team_strength} team's MVP draft.",
+                instructions=VERIFY_INSTRUCTIONS, max_tokens=max_tokens
+            )
+            if not fixed:
+                print("⚠️ Architect verification returned no usable sections, keeping the draft")
+
+        final_checks = check_sections(output, required)
+        self.last_stats = {
+            "sections": len(required),
+            "accepted": len(required) - len(weak),
+            "rewritten": fixed,
+            "weak_sections": [required[index].heading for index in weak],
+            "completeness_draft": round(completeness(draft_checks), 3),
+            "completeness_final": round(completeness(final_checks), 3),
+            "draft_seconds": round(draft_seconds, 2),
+            "verify_seconds": round(time.time() - start - draft_seconds, 2),
+            "draft_stopped_early": drafted.stopped_early,
+            "draft_usage": {"input_tokens": drafted.usage.get("input_tokens", 0),
+                            "output_tokens": drafted.usage.get("output_tokens", 0)},
+            "verify_usage": verify_usage,
+        }
+        print(f"📝 Architect draft: {self.last_stats['accepted']}/{len(required)} sections accepted, "
+              f"{fixed} rewritten by the verifier, completeness {self.last_stats['completeness_final']:.0%}")
+        return output
+
+
+__all__ = ['DraftArchitectEngine', 'VERIFY_INSTRUCTIONS']
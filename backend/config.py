@@ -0,0 +1,148 @@
+# backend/config.py
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Runtime settings read from the environment (and .env)"""
+
+    # Orchestrator worker processes; 0 runs workflows inside the API process
+    worker_count: int = 2
+    # Durable job queue (SQLite WAL); stale leases are reclaimed after a crash
+    job_db_path: str = "data/jobs.db"
+    job_lease_seconds: float = 60.0
+    job_max_attempts: int = 3
+    # History of finished strategy runs (GET /strategies)
+    result_db_path: str = "data/strategies.db"
+    # Compression of stored strategy bodies ("zstd" falls back to "zlib" without zstandard)
+    result_codec: str = "zstd"
+    # Append-only segment files for the bodies, read back via mmap (empty keeps them inline in SQLite)
+    result_segment_dir: Optional[str] = "data/strategy_segments"
+    # sentence-transformers model for GET /strategies/search?mode=semantic (empty disables it)
+    search_embedding_model: Optional[str] = "all-MiniLM-L6-v2"
+    # Admission control: reject new workflows whose estimated queue wait exceeds this
+    max_queue_wait_seconds: float = 300.0
+    ollama_concurrency: int = 1
+    groq_concurrency: int = 8
+    # Models: local Ollama for research/critical, Groq for architect/pitch
+    ollama_model: str = "gemma:2b"
+    ollama_base_url: str = "http://localhost:8080"
+    # Ollama servers behind the inference gateway (backend.inference_gateway) listening on
+    # ollama_base_url; empty when ollama_base_url is a single server. Also list the replicas the
+    # gateway spawns itself (--spawn prints them): slot counts and warm-up are derived from this
+    ollama_replicas: Tuple[str, ...] = ()
+    # How long Ollama keeps the model resident after a request; "-1" (the default) pins it
+    ollama_keep_alive: str = "-1"
+    # Local stages run on "ollama" (HTTP) or "embedded": a GGUF model loaded into each worker
+    # process with llama.cpp (backend.embedded_llm), weights mmap'd and shared between workers
+    local_backend: str = "ollama"
+    embedded_model_path: str = "data/models/gemma-2b-it.Q4_K_M.gguf"
+    # llama.cpp threads per worker; 0 splits the cores evenly between workers
+    embedded_threads: int = 0
+    embedded_context: int = 4096
+    groq_model: str = "gemma2-9b-it"
+    groq_base_url: str = "https://api.groq.com/openai/v1"
+    groq_api_key: Optional[str] = None
+    # Research stage engine: "agent" (CrewAI tool loop) or "retrieval" (search, then one completion)
+    research_mode: str = "agent"
+    serper_api_key: Optional[str] = None
+    # Multiplier on the per-stage max_tokens budgets (prompt_templates.STAGE_TOKEN_BUDGETS); 0 disables them
+    token_budget_scale: float = 1.0
+    # Stop streamed completions once the model moves on past the sections the template requires
+    early_stop: bool = True
+    # Quality gate: a stage whose structural score (backend.quality_gate) is below this gets its weak
+    # sections rewritten by a repair prompt, up to quality_repair_attempts times; 0 disables the gate
+    quality_threshold: float = 0.75
+    quality_repair_attempts: int = 1
+    # Architect stage: "direct" (Groq writes it) or "draft" (local model drafts, Groq rewrites weak sections)
+    architect_mode: str = "direct"
+    # CrewAI memory: "off", or "shared" = one persistent store reused by every crew
+    crew_memory: str = "off"
+    memory_dir: str = "data/crew_memory"
+    # Ollama embedding model used by the shared memory store
+    memory_embedding_model: str = "nomic-embed-text"
+    # HTTP response compression: "gzip", "brotli" (needs brotli-asgi) or "off"
+    response_compression: str = "gzip"
+    compression_min_bytes: int = 1024
+    # Prime every model on startup before reporting ready
+    warmup_enabled: bool = True
+    # JSONL file that every LLM request's messages are appended to (off when unset)
+    prompt_log_path: Optional[str] = None
+
+    @property
+    def groq_available(self) -> bool:
+        return bool(self.groq_api_key)
+
+    @property
+    def ollama_slots(self) -> int:
+        """Concurrent local completions across all replicas"""
+        if self.local_backend == "embedded":
+            return max(self.worker_count, 1)  # one model context per worker process
+        return self.ollama_concurrency * max(len(self.ollama_replicas), 1)
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            worker_count=_env_int("STRATEGIST_WORKERS", min(4, os.cpu_count() or 1)),
+            job_db_path=os.getenv("STRATEGIST_JOB_DB", "data/jobs.db"),
+            job_lease_seconds=float(os.getenv("STRATEGIST_JOB_LEASE_SECONDS", "60")),
+            job_max_attempts=_env_int("STRATEGIST_JOB_MAX_ATTEMPTS", 3),
+            result_db_path=os.getenv("STRATEGIST_RESULT_DB", "data/strategies.db"),
+            result_codec=os.getenv("STRATEGIST_RESULT_CODEC", "zstd"),
+            result_segment_dir=os.getenv("STRATEGIST_RESULT_SEGMENTS", "data/strategy_segments") or None,
+            search_embedding_model=os.getenv("STRATEGIST_EMBEDDING_MODEL", "all-MiniLM-L6-v2") or None,
+            max_queue_wait_seconds=float(os.getenv("STRATEGIST_MAX_QUEUE_WAIT_SECONDS", "300")),
+            ollama_concurrency=_env_int("OLLAMA_NUM_PARALLEL", 1),
+            groq_concurrency=_env_int("STRATEGIST_GROQ_CONCURRENCY", 8),
+            ollama_model=os.getenv("STRATEGIST_OLLAMA_MODEL", "gemma:2b"),
+            ollama_base_url=os.getenv("STRATEGIST_OLLAMA_BASE_URL", "http://localhost:8080"),
+            ollama_replicas=tuple(url.strip() for url in os.getenv("STRATEGIST_OLLAMA_REPLICAS", "").split(",")
+                                  if url.strip()),
+            ollama_keep_alive=os.getenv("STRATEGIST_OLLAMA_KEEP_ALIVE", "-1"),
+            local_backend=os.getenv("STRATEGIST_LOCAL_BACKEND", "ollama").strip().lower(),
+            embedded_model_path=os.getenv("STRATEGIST_EMBEDDED_MODEL", "data/models/gemma-2b-it.Q4_K_M.gguf"),
+            embedded_threads=_env_int("STRATEGIST_EMBEDDED_THREADS", 0),
+            embedded_context=_env_int("STRATEGIST_EMBEDDED_CONTEXT", 4096),
+            groq_model=os.getenv("STRATEGIST_GROQ_MODEL", "gemma2-9b-it"),
+            groq_api_key=os.getenv("GROQ_API_KEY") or None,
+            research_mode=os.getenv("STRATEGIST_RESEARCH_MODE", "agent").strip().lower(),
+            serper_api_key=os.getenv("SERPER_API_KEY") or None,
+            token_budget_scale=float(os.getenv("STRATEGIST_TOKEN_BUDGET_SCALE", "1.0")),
+            early_stop=_env_bool("STRATEGIST_EARLY_STOP", True),
+            quality_threshold=float(os.getenv("STRATEGIST_QUALITY_THRESHOLD", "0.75")),
+            quality_repair_attempts=_env_int("STRATEGIST_QUALITY_REPAIR_ATTEMPTS", 1),
+            architect_mode=os.getenv("STRATEGIST_ARCHITECT_MODE", "direct").strip().lower(),
+            crew_memory=os.getenv("STRATEGIST_CREW_MEMORY", "off").strip().lower(),
+            memory_dir=os.getenv("STRATEGIST_MEMORY_DIR", "data/crew_memory"),
+            memory_embedding_model=os.getenv("STRATEGIST_MEMORY_EMBEDDER", "nomic-embed-text"),
+            response_compression=os.getenv("STRATEGIST_RESPONSE_COMPRESSION", "gzip"),
+            compression_min_bytes=_env_int("STRATEGIST_COMPRESSION_MIN_BYTES", 1024),
+            warmup_enabled=_env_bool("STRATEGIST_WARMUP", True),
+            prompt_log_path=os.getenv("STRATEGIST_PROMPT_LOG") or None,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings once per process"""
+    from dotenv import load_dotenv
+    load_dotenv()
+    return Settings.from_env()
+
+
+__all__ = ['Settings', 'get_settings']
@@ -0,0 +1,128 @@
+# backend/embedded_llm.py
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from litellm import CustomLLM, Usage
+
+PROVIDER = "embedded"
+
+
+def default_threads(worker_count: int) -> int:
+    """Split the cores between worker processes; each runs its own copy of the model"""
+    return max(1, (os.cpu_count() or 1) // max(worker_count, 1))
+
+
+def _plain_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """llama.cpp chat templates want plain string content"""
+    plain = []
+    for message in messages:
+        content = message.get("content") or ""
+        if isinstance(content, list):
+            content = "".join(part.get("text", "") for part in content if isinstance(part, dict))
+        plain.append({"role": message.get("role", "user"), "content": content})
+    return plain
+
+
+def _generation_kwargs(optional_params: Dict[str, Any]) -> Dict[str, Any]:
+    kwargs = {key: optional_params[key] for key in ("temperature", "top_p", "stop", "seed")
+              if optional_params.get(key) is not None}
+    kwargs["max_tokens"] = optional_params.get("max_tokens") or optional_params.get("num_predict")
+    return kwargs
+
+
+class EmbeddedChatProvider(CustomLLM):
+    """LiteLLM provider that runs GGUF models in-process with llama.cpp.
+
+    Registered as `embedded/<model name>`, so ChatLiteLLM and CrewAI reach it
+    through the same litellm.completion() path as Ollama or Groq, without an
+    HTTP hop or a separate daemon. Weights are mmap'd read-only, so every
+    worker process on the host shares one copy in the page cache and only
+    adds its own KV cache. A llama.cpp context is not thread-safe; calls to
+    one model are serialized.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._models: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+
+    def load(self, model_path: str, n_ctx: int = 4096, n_threads: Optional[int] = None) -> str:
+        """Load a model file once per process; returns its litellm model string"""
+        from llama_cpp import Llama
+
+        name = os.path.splitext(os.path.basename(model_path))[0]
+        if name not in self._models:
+            start = time.time()
+            self._models[name] = Llama(model_path=model_path, n_ctx=n_ctx, n_threads=n_threads,
+                                       use_mmap=True, use_mlock=False, verbose=False)
+            self._locks[name] = threading.Lock()
+            print(f"🧠 Loaded {name} in-process ({time.time() - start:.1f}s, {n_threads or 'auto'} threads)")
+        return f"{PROVIDER}/{name}"
+
+    def completion(self, *args, **kwargs):
+        model, model_response = kwargs["model"], kwargs["model_response"]
+        with self._locks[model]:
+            output = self._models[model].create_chat_completion(
+                messages=_plain_messages(kwargs["messages"]),
+                **_generation_kwargs(kwargs.get("optional_params") or {})
+            )
+        choice = output["choices"][0]
+        model_response.choices[0].message.content = choice["message"]["content"]
+        model_response.choices[0].finish_reason = choice.get("finish_reason") or "stop"
+        model_response.model = f"{PROVIDER}/{model}"
+        usage = output.get("usage") or {}
+        setattr(model_response, "usage", Usage(
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+            total_tokens=usage.get("total_tokens", 0),
+        ))
+        return model_response
+
+    def streaming(self, *args, **kwargs) -> Iterator[Dict[str, Any]]:
+        model = kwargs["model"]
+        with self._locks[model]:
+            for chunk in self._models[model].create_chat_completion(
+                messages=_plain_messages(kwargs["messages"]), stream=True,
+                **_generation_kwargs(kwargs.get("optional_params") or {})
+            ):
+                choice = chunk["choices"][0]
+                yield {
+                    "text": choice.get("delta", {}).get("content") or "",
+                    "is_finished": choice.get("finish_reason") is not None,
+                    "finish_reason": choice.get("finish_reason") or "",
+                    "usage": None,
+                    "index": 0,
+                    "tool_use": None,
+                }
+
+    async def acompletion(self, *args, **kwargs):
+        return await asyncio.to_thread(self.completion, *args, **kwargs)
+
+
+_provider: Optional[EmbeddedChatProvider] = None
+
+
+def register_embedded_model(model_path: str, n_ctx: int = 4096, n_threads: Optional[int] = None) -> str:
+    """Load `model_path` into this process and route its litellm model string to it"""
+    import litellm
+
+    global _provider
+    try:
+        import llama_cpp  # noqa: F401
+    except ImportError as e:
+        raise ImportError("STRATEGIST_LOCAL_BACKEND=embedded needs llama-cpp-python: "
+                          "pip install -r requirements-embedded.txt") from e
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(f"Embedded model not found: {model_path} (set STRATEGIST_EMBEDDED_MODEL)")
+    if _provider is None:
+        _provider = EmbeddedChatProvider()
+        litellm.custom_provider_map = [
+            item for item in litellm.custom_provider_map if item["provider"] != PROVIDER
+        ] + [{"provider": PROVIDER, "custom_handler": _provider}]
+    return _provider.load(model_path, n_ctx=n_ctx, n_threads=n_threads)
+
+
+__all__ = ['EmbeddedChatProvider', 'register_embedded_model', 'default_threads', 'PROVIDER']
@@ -0,0 +1,436 @@
+# backend/inference_gateway.py
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+# Headers that describe one hop, not the message; never forwarded
+HOP_HEADERS = {"connection", "keep-alive", "transfer-encoding", "te", "trailer", "upgrade",
+               "proxy-authorization", "proxy-authenticate", "content-length", "host"}
+# Completion endpoints whose options can carry the replica's thread count
+COMPLETION_PATHS = ("/api/generate", "/api/chat")
+
+
+@dataclass
+class Replica:
+    """One model server and its load accounting"""
+    url: str
+    capacity: int = 1
+    threads: Optional[int] = None   # cores pinned to this replica, when the gateway spawned it
+    in_flight: int = 0
+    requests: int = 0
+    errors: int = 0
+    healthy: bool = True
+    busy_seconds: float = 0.0       # wall time with at least one request in flight
+    load_seconds: float = 0.0       # integral of in_flight over time
+    last_change: float = field(default_factory=time.time)
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        parsed = urlparse(self.url)
+        return parsed.hostname, parsed.port or 80
+
+    def account(self, now: float) -> None:
+        elapsed = now - self.last_change
+        if self.in_flight:
+            self.busy_seconds += elapsed
+            self.load_seconds += elapsed * self.in_flight
+        self.last_change = now
+
+
+class ReplicaPool:
+    """Least-loaded dispatch over model server replicas.
+
+    A request goes to the healthy replica with the lowest in-flight/capacity
+    ratio; when every replica is at capacity it waits here rather than in one
+    server's internal queue, so it starts on whichever replica frees up first.
+    Replicas that refuse connections are taken out and probed until they
+    answer again.
+    """
+
+    def __init__(self, replicas: List[Replica], probe_interval: float = 10.0):
+        if not replicas:
+            raise ValueError("At least one replica is required")
+        self.replicas = replicas
+        self.probe_interval = probe_interval
+        self.started_at = time.time()
+        self.waiting = 0
+        self.max_waiting = 0
+        self._cond = threading.Condition()
+        threading.Thread(target=self._probe_loop, name="replica-probe", daemon=True).start()
+
+    def acquire(self, exclude: Tuple[Replica, ...] = (), timeout: float = 600.0) -> Replica:
+        deadline = time.time() + timeout
+        with self._cond:
+            self.waiting += 1
+            self.max_waiting = max(self.max_waiting, self.waiting)
+            try:
+                while True:
+                    candidates = [r for r in self.replicas
+                                  if r.healthy and r not in exclude and r.in_flight < r.capacity]
+                    if candidates:
+                        replica = min(candidates, key=lambda r: (r.in_flight / r.capacity, r.requests))
+                        replica.account(time.time())
+                        replica.in_flight += 1
+                        replica.requests += 1
+                        return replica
+                    if not any(r.healthy and r not in exclude for r in self.replicas):
+                        raise ConnectionError("No healthy model server replica")
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        raise TimeoutError("Timed out waiting for a free replica")
+                    self._cond.wait(remaining)
+            finally:
+                self.waiting -= 1
+
+    def release(self, replica: Replica, failed: bool = False) -> None:
+        with self._cond:
+            replica.account(time.time())
+            replica.in_flight -= 1
+            if failed:
+                replica.errors += 1
+            self._cond.notify_all()
+
+    def mark_down(self, replica: Replica) -> None:
+        with self._cond:
+            if replica.healthy:
+                print(f"⚠️ Replica {replica.url} is down")
+            replica.healthy = False
+            self._cond.notify_all()
+
+    def _probe_loop(self) -> None:
+        while True:
+            time.sleep(self.probe_interval)
+            for replica in [r for r in self.replicas if not r.healthy]:
+                try:
+                    conn = http.client.HTTPConnection(*replica.address, timeout=5)
+                    conn.request("GET", "/api/version")
+                    if conn.getresponse().status == 200:
+                        with self._cond:
+                            replica.healthy = True
+                            self._cond.notify_all()
+                        print(f"✅ Replica {replica.url} is back")
+                    conn.close()
+                except OSError:
+                    pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            now = time.time()
+            uptime = max(now - self.started_at, 1e-9)
+            replicas = []
+            for replica in self.replicas:
+                replica.account(now)
+                replicas.append({
+                    "url": replica.url,
+                    "healthy": replica.healthy,
+                    "capacity": replica.capacity,
+                    "threads": replica.threads,
+                    "in_flight": replica.in_flight,
+                    "requests": replica.requests,
+                    "errors": replica.errors,
+                    # Share of wall time the replica had work, and its average concurrency
+                    "utilization": round(replica.busy_seconds / uptime, 3),
+                    "mean_concurrency": round(replica.load_seconds / uptime, 3),
+                })
+            return {"uptime_seconds": round(uptime, 1), "waiting": self.waiting,
+                    "max_waiting": self.max_waiting, "replicas": replicas}
+
+
+def forward(replica: Replica, method: str, path: str, headers: Dict[str, str], body: Optional[bytes],
+            timeout: float = 600.0) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+    conn = http.client.HTTPConnection(*replica.address, timeout=timeout)
+    conn.request(method, path, body=body, headers=headers)
+    return conn, conn.getresponse()
+
+
+class EmbedBatcher:
+    """Micro-batches /api/embed calls into one request per model.
+
+    Ollama's /api/embed takes a list of inputs, so embedding calls that
+    arrive within `max_wait` of each other (up to `max_batch` inputs) are
+    sent as one request and the embeddings are split back per caller.
+    Completions can't be merged this way; they are only load-balanced.
+    """
+
+    def __init__(self, pool: ReplicaPool, max_batch: int = 32, max_wait: float = 0.005, timeout: float = 600.0):
+        self.pool = pool
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.timeout = timeout  # how long a caller waits for its batch before giving up
+        self.batches = 0
+        self.batched_calls = 0
+        self._pending: Dict[str, List[Tuple[List[str], Future, float]]] = {}
+        self._cond = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=sum(r.capacity for r in pool.replicas) * 2,
+                                            thread_name_prefix="embed-batch")
+        threading.Thread(target=self._flush_loop, name="embed-batcher", daemon=True).start()
+
+    def submit(self, request: Dict[str, Any]) -> Future:
+        inputs = request.get("input", [])
+        inputs = [inputs] if isinstance(inputs, str) else list(inputs)
+        # Only calls with identical model and options can share a batch
+        key = json.dumps({k: v for k, v in request.items() if k != "input"}, sort_keys=True)
+        future: Future = Future()
+        with self._cond:
+            self._pending.setdefault(key, []).append((inputs, future, time.time()))
+            self._cond.notify()
+        return future
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                now = time.time()
+                ready = {key: calls for key, calls in self._pending.items()
+                         if sum(len(c[0]) for c in calls) >= self.max_batch or now - calls[0][2] >= self.max_wait}
+                if not ready:
+                    oldest = min(calls[0][2] for calls in self._pending.values())
+                    self._cond.wait(max(oldest + self.max_wait - now, 0.0005))
+                    continue
+                for key in ready:
+                    del self._pending[key]
+            for key, calls in ready.items():
+                self._executor.submit(self._send, json.loads(key), calls)
+
+    def _send(self, request: Dict[str, Any], calls: List[Tuple[List[str], Future, float]]) -> None:
+        try:
+            self._send_batch(request, calls)
+        except Exception as e:
+            # A malformed reply (not JSON, no "embeddings", ...) must still release every caller
+            for _, future, _ in calls:
+                if not future.done():
+                    future.set_exception(e)
+
+    def _send_batch(self, request: Dict[str, Any], calls: List[Tuple[List[str], Future, float]]) -> None:
+        self.batches += 1
+        self.batched_calls += len(calls)
+        body = json.dumps({**request, "input": [text for inputs, _, _ in calls for text in inputs]}).encode("utf-8")
+        tried: Tuple[Replica, ...] = ()
+        while True:
+            try:
+                replica = self.pool.acquire(exclude=tried)
+            except (ConnectionError, TimeoutError) as e:
+                for _, future, _ in calls:
+                    future.set_exception(e)
+                return
+            failed = False
+            try:
+                conn, response = forward(replica, "POST", "/api/embed", {"Content-Type": "application/json"}, body)
+                payload = response.read()
+                conn.close()
+                if response.status != 200:
+                    failed = True
+                    for _, future, _ in calls:
+                        future.set_result((response.status, payload))
+                    return
+                data = json.loads(payload)
+                offset = 0
+                for inputs, future, _ in calls:
+                    part = {**data, "embeddings": data["embeddings"][offset:offset + len(inputs)]}
+                    offset += len(inputs)
+                    future.set_result((200, json.dumps(part).encode("utf-8")))
+                return
+            except (ConnectionError, OSError):
+                failed = True
+                self.pool.mark_down(replica)
+                tried += (replica,)
+            finally:
+                self.pool.release(replica, failed=failed)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"batches": self.batches, "calls": self.batched_calls,
+                "mean_batch_calls": round(self.batched_calls / self.batches, 2) if self.batches else 0.0}
+
+
+class GatewayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    pool: ReplicaPool = None
+    batcher: Optional[EmbedBatcher] = None
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def _send_body(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path == "/gateway/stats":
+            stats = self.pool.stats()
+            if self.batcher is not None:
+                stats["embed_batching"] = self.batcher.stats()
+            return self._send_body(200, json.dumps(stats).encode("utf-8"))
+        self._proxy(None)
+
+    def do_HEAD(self) -> None:
+        self._proxy(None)
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path == "/api/embed" and self.batcher is not None:
+            try:
+                request = json.loads(body)
+            except ValueError as e:
+                return self._send_body(400, json.dumps({"error": f"Invalid JSON body: {e}"}).encode("utf-8"))
+            try:
+                status, payload = self.batcher.submit(request).result(timeout=self.batcher.timeout)
+            except (ConnectionError, TimeoutError) as e:
+                return self._send_body(503, json.dumps({"error": str(e) or "Embedding batch timed out"}).encode("utf-8"))
+            except Exception as e:
+                return self._send_body(502, json.dumps({"error": f"Bad replica response: {e}"}).encode("utf-8"))
+            return self._send_body(status, payload)
+        self._proxy(body)
+
+    def do_DELETE(self) -> None:
+        self._proxy(self.rfile.read(int(self.headers.get("Content-Length") or 0)))
+
+    def _proxy(self, body: Optional[bytes]) -> None:
+        headers = {k: v for k, v in self.headers.items() if k.lower() not in HOP_HEADERS}
+        tried: Tuple[Replica, ...] = ()
+        while True:
+            try:
+                replica = self.pool.acquire(exclude=tried)
+            except (ConnectionError, TimeoutError) as e:
+                return self._send_body(503, json.dumps({"error": str(e)}).encode("utf-8"))
+            failed = False
+            try:
+                payload = body
+                if body and replica.threads and self.path in COMPLETION_PATHS:
+                    request = json.loads(body)
+                    request.setdefault("options", {}).setdefault("num_thread", replica.threads)
+                    payload = json.dumps(request).encode("utf-8")
+                try:
+                    conn, response = forward(replica, self.command, self.path, headers, payload)
+                except (ConnectionError, OSError):
+                    # Nothing was sent to the client yet; try another replica
+                    failed = True
+                    self.pool.mark_down(replica)
+                    tried += (replica,)
+                    continue
+                self._relay(response)
+                conn.close()
+                failed = response.status >= 500
+                return
+            finally:
+                self.pool.release(replica, failed=failed)
+
+    def _relay(self, response: http.client.HTTPResponse) -> None:
+        """Stream the replica's response through (Ollama streams NDJSON by default)"""
+        self.send_response(response.status)
+        for key, value in response.getheaders():
+            if key.lower() not in HOP_HEADERS:
+                self.send_header(key, value)
+        if self.command == "HEAD":
+            self.send_header("Content-Length", response.getheader("Content-Length", "0"))
+            self.end_headers()
+            return
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        while True:
+            chunk = response.read1(65536)
+            if not chunk:
+                break
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+
+def split_cores(count: int) -> List[List[int]]:
+    """Divide this process's CPUs into `count` disjoint, contiguous sets"""
+    cores = sorted(os.sched_getaffinity(0))
+    size = max(len(cores) // count, 1)
+    return [cores[i * size:(i + 1) * size] or cores[-size:] for i in range(count)]
+
+
+def spawn_replicas(count: int, base_port: int, parallel: int, keep_alive: str,
+                   ollama_bin: str = "ollama") -> Tuple[List[Replica], List[subprocess.Popen]]:
+    """Start `count` `ollama serve` processes, each pinned to its own share of the cores.
+
+    They share the model directory, so the weights are mapped once in the page
+    cache and every replica only adds its own KV cache.
+    """
+    replicas, processes = [], []
+    for i, cores in enumerate(split_cores(count)):
+        port = base_port + i
+        env = {**os.environ, "OLLAMA_HOST": f"127.0.0.1:{port}",
+               "OLLAMA_NUM_PARALLEL": str(parallel), "OLLAMA_KEEP_ALIVE": keep_alive}
+        processes.append(subprocess.Popen(
+            [ollama_bin, "serve"], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            preexec_fn=lambda cores=cores: os.sched_setaffinity(0, cores)
+        ))
+        replicas.append(Replica(f"http://127.0.0.1:{port}", capacity=parallel, threads=len(cores)))
+        print(f"🚀 Replica {i} on port {port}, cores {cores[0]}-{cores[-1]}")
+    return replicas, processes
+
+
+def serve(pool: ReplicaPool, host: str, port: int, batcher: Optional[EmbedBatcher] = None) -> ThreadingHTTPServer:
+    handler = type("Handler", (GatewayHandler,), {"pool": pool, "batcher": batcher})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None) -> None:
+    """Run the gateway on STRATEGIST_OLLAMA_BASE_URL in front of the replicas"""
+    from backend.config import get_settings
+
+    settings = get_settings()
+    listen = urlparse(settings.ollama_base_url)
+    parser = argparse.ArgumentParser(description="Load-balancing gateway in front of local Ollama replicas")
+    parser.add_argument("--replicas", default=",".join(settings.ollama_replicas),
+                        help="Comma-separated replica URLs (default STRATEGIST_OLLAMA_REPLICAS)")
+    parser.add_argument("--spawn", type=int, default=0,
+                        help="Start this many pinned `ollama serve` replicas instead; set STRATEGIST_OLLAMA_REPLICAS "
+                             "to the URLs it prints so the API's slot count and warm-up cover them")
+    parser.add_argument("--base-port", type=int, default=11500)
+    parser.add_argument("--parallel", type=int, default=settings.ollama_concurrency,
+                        help="Concurrent requests per replica (OLLAMA_NUM_PARALLEL)")
+    parser.add_argument("--host", default=listen.hostname or "127.0.0.1")
+    parser.add_argument("--port", type=int, default=listen.port or 8080)
+    parser.add_argument("--batch-window-ms", type=float, default=5.0, help="Embedding micro-batch window (0 disables)")
+    parser.add_argument("--max-batch", type=int, default=32)
+    args = parser.parse_args(argv)
+
+    processes = []
+    if args.spawn:
+        replicas, processes = spawn_replicas(args.spawn, args.base_port, args.parallel, settings.ollama_keep_alive)
+        spawned = ",".join(replica.url for replica in replicas)
+        if set(settings.ollama_replicas) != {replica.url for replica in replicas}:
+            # The API sizes Ollama admission and warms each replica from this variable
+            print(f"⚠️ Set STRATEGIST_OLLAMA_REPLICAS={spawned} for the API and workers")
+    else:
+        urls = [url.strip() for url in args.replicas.split(",") if url.strip()]
+        replicas = [Replica(url, capacity=args.parallel) for url in urls]
+    pool = ReplicaPool(replicas)
+    batcher = EmbedBatcher(pool, args.max_batch, args.batch_window_ms / 1000) if args.batch_window_ms > 0 else None
+    server = serve(pool, args.host, args.port, batcher)
+    print(f"🔀 Inference gateway on http://{args.host}:{args.port} -> {len(replicas)} replicas "
+          f"x {args.parallel} slots (stats at /gateway/stats)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        for process in processes:
+            process.terminate()
+
+
+if __name__ == "__main__":
+    main()
+
+
+__all__ = ['Replica', 'ReplicaPool', 'EmbedBatcher', 'serve', 'spawn_replicas', 'split_cores']
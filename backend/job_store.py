@@ -0,0 +1,276 @@
+# backend/job_store.py
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from backend.scheduler import PRIORITY_CLASSES, FairScheduler
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id        TEXT PRIMARY KEY,
+    status        TEXT NOT NULL,            -- queued | running | completed | failed
+    priority      TEXT NOT NULL DEFAULT 'interactive',  -- see scheduler.PRIORITY_CLASSES
+    client_id     TEXT NOT NULL DEFAULT 'anonymous',
+    payload       TEXT NOT NULL,            -- JSON workflow arguments
+    result        TEXT,                     -- JSON workflow response
+    error         TEXT,
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    worker        TEXT,
+    lease_expires REAL,
+    submitted_at  REAL NOT NULL,
+    started_at    REAL,
+    finished_at   REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_submitted ON jobs(status, submitted_at);
+
+CREATE TABLE IF NOT EXISTS job_stages (
+    job_id       TEXT NOT NULL REFERENCES jobs(job_id) ON DELETE CASCADE,
+    stage        TEXT NOT NULL,
+    output       TEXT NOT NULL,
+    elapsed      REAL NOT NULL,
+    completed_at REAL NOT NULL,
+    seeded       INTEGER NOT NULL DEFAULT 0,  -- copied from an earlier run, not executed by this job
+    PRIMARY KEY (job_id, stage)
+);
+CREATE INDEX IF NOT EXISTS idx_job_stages_stage_completed ON job_stages(stage, completed_at);
+"""
+
+# Columns added after the first release; applied to older databases on open
+MIGRATIONS = {
+    "priority": "ALTER TABLE jobs ADD COLUMN priority TEXT NOT NULL DEFAULT 'interactive'",
+    "client_id": "ALTER TABLE jobs ADD COLUMN client_id TEXT NOT NULL DEFAULT 'anonymous'",
+}
+STAGE_MIGRATIONS = {
+    "seeded": "ALTER TABLE job_stages ADD COLUMN seeded INTEGER NOT NULL DEFAULT 0",
+}
+
+
+class LeaseLost(Exception):
+    """The worker running a job no longer holds its lease; another worker has taken it over"""
+
+
+class JobStore:
+    """Durable workflow queue backed by SQLite in WAL mode.
+
+    Jobs are claimed with a time-limited lease that the worker keeps renewing
+    while it runs. If a worker (or the whole API process) dies, the lease
+    lapses and the next claim() picks the job up again together with every
+    stage output that was already recorded, so the workflow resumes from the
+    last completed stage. Any number of worker processes on the host can
+    share one database file. Which queued job runs next is decided by the
+    FairScheduler (priority classes + per-client deficit round robin).
+    """
+
+    def __init__(self, db_path: str, lease_seconds: float = 60.0, max_attempts: int = 3,
+                 scheduler: Optional[FairScheduler] = None):
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.scheduler = scheduler or FairScheduler()
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+        for column, statement in MIGRATIONS.items():
+            if column not in columns:
+                conn.execute(statement)
+        stage_columns = {row["name"] for row in conn.execute("PRAGMA table_info(job_stages)")}
+        for column, statement in STAGE_MIGRATIONS.items():
+            if column not in stage_columns:
+                conn.execute(statement)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_queue ON jobs(status, priority, client_id, submitted_at)")
+        FairScheduler.create_schema(conn)
+
+    def _connect(self) -> sqlite3.Connection:
+        """One connection per thread; sqlite3 connections are not thread-safe"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+
+    def submit(self, payload: Dict[str, Any], job_id: Optional[str] = None,
+               priority: str = "interactive", client_id: str = "anonymous",
+               completed_stages: Optional[Dict[str, str]] = None) -> str:
+        """Queue a workflow and return its job id
+
+        `completed_stages` seeds stage outputs from an earlier run; the worker
+        resumes after them exactly as it would after a crash.
+        """
+        if priority not in PRIORITY_CLASSES:
+            raise ValueError(f"Unknown priority '{priority}'. Must be one of: {PRIORITY_CLASSES}")
+        job_id = job_id or uuid.uuid4().hex
+        now = time.time()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT INTO jobs (job_id, status, priority, client_id, payload, submitted_at) VALUES (?, 'queued', ?, ?, ?, ?)",
+                (job_id, priority, client_id, json.dumps(payload), now)
+            )
+            conn.executemany(
+                "INSERT INTO job_stages (job_id, stage, output, elapsed, completed_at, seeded) VALUES (?, ?, ?, 0, ?, 1)",
+                [(job_id, stage, output, now) for stage, output in (completed_stages or {}).items()]
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return job_id
+
+    def _next_job(self, conn: sqlite3.Connection, now: float) -> Optional[sqlite3.Row]:
+        """Abandoned jobs (expired lease) first, then whatever the scheduler picks"""
+        row = conn.execute(
+            """
+            SELECT job_id, payload, attempts FROM jobs
+            WHERE status = 'running' AND lease_expires < ?
+            ORDER BY submitted_at
+            LIMIT 1
+            """,
+            (now,)
+        ).fetchone()
+        if row is not None:
+            return row
+
+        job_id = self.scheduler.pick(conn)
+        if job_id is None:
+            return None
+        return conn.execute("SELECT job_id, payload, attempts FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+
+    def claim(self, worker: str) -> Optional[Dict[str, Any]]:
+        """Atomically take the next runnable job (abandoned, or queued per the scheduler)"""
+        conn = self._connect()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._next_job(conn, now)
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+
+            if row["attempts"] >= self.max_attempts:
+                # Keeps crashing its workers; stop retrying it
+                conn.execute(
+                    "UPDATE jobs SET status = 'failed', error = ?, finished_at = ? WHERE job_id = ?",
+                    (f"Gave up after {row['attempts']} attempts", now, row["job_id"])
+                )
+                conn.execute("COMMIT")
+                return self.claim(worker)
+
+            conn.execute(
+                """
+                UPDATE jobs SET status = 'running', worker = ?, attempts = attempts + 1,
+                       lease_expires = ?, started_at = COALESCE(started_at, ?)
+                WHERE job_id = ?
+                """,
+                (worker, now + self.lease_seconds, now, row["job_id"])
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        if row["attempts"] > 0:
+            print(f"♻️ Resuming job {row['job_id']} (attempt {row['attempts'] + 1})")
+        return {
+            "job_id": row["job_id"],
+            "payload": json.loads(row["payload"]),
+            "completed_stages": self.get_stages(row["job_id"]),
+        }
+
+    def renew_lease(self, job_id: str, worker: str) -> bool:
+        """Extend a running job's lease; False if another worker took it over"""
+        cursor = self._connect().execute(
+            "UPDATE jobs SET lease_expires = ? WHERE job_id = ? AND worker = ? AND status = 'running'",
+            (time.time() + self.lease_seconds, job_id, worker)
+        )
+        return cursor.rowcount == 1
+
+    def record_stage(self, job_id: str, stage: str, output: str, elapsed: float,
+                     worker: Optional[str] = None) -> bool:
+        """Persist one completed stage so a restart can skip it; with `worker`, only while it still holds the job"""
+        cursor = self._connect().execute(
+            """
+            INSERT OR REPLACE INTO job_stages (job_id, stage, output, elapsed, completed_at)
+            SELECT ?, ?, ?, ?, ? WHERE ? IS NULL
+                OR EXISTS (SELECT 1 FROM jobs WHERE job_id = ? AND worker = ? AND status = 'running')
+            """,
+            (job_id, stage, output, elapsed, time.time(), worker, job_id, worker)
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: str, result: Dict[str, Any], worker: Optional[str] = None) -> bool:
+        """Store a job's result; with `worker`, only if that worker still holds the job (False otherwise)"""
+        status = "completed" if result.get("success") else "failed"
+        cursor = self._connect().execute(
+            """
+            UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, lease_expires = NULL
+            WHERE job_id = ? AND (? IS NULL OR (worker = ? AND status = 'running'))
+            """,
+            (status, json.dumps(result, default=str), result.get("error"), time.time(), job_id, worker, worker)
+        )
+        return cursor.rowcount == 1
+
+    def get_stages(self, job_id: str) -> Dict[str, str]:
+        rows = self._connect().execute(
+            "SELECT stage, output FROM job_stages WHERE job_id = ?", (job_id,)
+        ).fetchall()
+        return {row["stage"]: row["output"] for row in rows}
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connect().execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        job["stages"] = self.get_stages(job_id)
+        return job
+
+    def active_jobs(self) -> List[Dict[str, Any]]:
+        """Queued and running jobs with the stages each has already finished"""
+        rows = self._connect().execute(
+            """
+            SELECT j.job_id, j.status, j.priority, GROUP_CONCAT(s.stage) AS stages
+            FROM jobs j LEFT JOIN job_stages s ON s.job_id = j.job_id
+            WHERE j.status IN ('queued', 'running')
+            GROUP BY j.job_id
+            """
+        ).fetchall()
+        return [
+            {"job_id": row["job_id"], "status": row["status"], "priority": row["priority"],
+             "completed_stages": row["stages"].split(",") if row["stages"] else []}
+            for row in rows
+        ]
+
+    def recent_stage_latencies(self, window: int = 50) -> Dict[str, float]:
+        """Mean elapsed seconds per stage over its last `window` completions"""
+        rows = self._connect().execute(
+            """
+            SELECT stage, AVG(elapsed) AS mean_elapsed FROM (
+                SELECT stage, elapsed,
+                       ROW_NUMBER() OVER (PARTITION BY stage ORDER BY completed_at DESC) AS rn
+                FROM job_stages WHERE seeded = 0
+            ) WHERE rn <= ? GROUP BY stage
+            """,
+            (window,)
+        ).fetchall()
+        return {row["stage"]: row["mean_elapsed"] for row in rows}
+
+    def stats(self) -> Dict[str, int]:
+        rows = self._connect().execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+
+__all__ = ['LeaseLost', 'JobStore']
@@ -0,0 +1,54 @@
+# backend/memory.py
+import os
+from typing import Any, Dict
+
+from backend.config import Settings
+
+MEMORY_MODES = ["off", "shared"]
+
+
+def memory_embedder(settings: Settings) -> Dict[str, Any]:
+    """CrewAI embedder config for the local Ollama embedding model"""
+    return {
+        "provider": "ollama",
+        "config": {
+            "model": settings.memory_embedding_model,
+            "url": f"{settings.ollama_base_url.rstrip('/')}/api/embeddings",
+        },
+    }
+
+
+def build_crew_memory(settings: Settings, memory_dir: str = None) -> Dict[str, Any]:
+    """Keyword arguments for Crew(...) that enable or disable CrewAI memory.
+
+    Every stage runs in a brand-new single-task crew, so CrewAI's default
+    per-crew memory stores are created, embedded into and thrown away on each
+    kickoff without ever being read back. Memory is therefore off unless
+    STRATEGIST_CREW_MEMORY=shared, in which case the short-term, long-term and
+    entity stores are built once here and handed to every crew, so they
+    persist under `memory_dir` and accumulate across runs.
+    """
+    if settings.crew_memory not in MEMORY_MODES:
+        raise ValueError(f"Unknown crew memory mode '{settings.crew_memory}'. Must be one of: {MEMORY_MODES}")
+    if settings.crew_memory == "off":
+        return {"memory": False}
+
+    from crewai.memory import EntityMemory, LongTermMemory, ShortTermMemory
+    from crewai.memory.storage.ltm_sqlite_storage import LTMSQLiteStorage
+
+    memory_dir = memory_dir or settings.memory_dir
+    os.makedirs(memory_dir, exist_ok=True)
+    embedder = memory_embedder(settings)
+    print(f"🧠 Shared crew memory at {memory_dir} ({settings.memory_embedding_model} embeddings)")
+    return {
+        "memory": True,
+        "embedder": embedder,
+        "short_term_memory": ShortTermMemory(embedder_config=embedder, path=memory_dir),
+        "entity_memory": EntityMemory(embedder_config=embedder, path=memory_dir),
+        "long_term_memory": LongTermMemory(
+            storage=LTMSQLiteStorage(db_path=os.path.join(memory_dir, "long_term_memory.db"))
+        ),
+    }
+
+
+__all__ = ['build_crew_memory', 'memory_embedder', 'MEMORY_MODES']
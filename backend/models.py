@@ -0,0 +1,12 @@
+# backend/models.py
+"""Shared workflow constants (kept free of heavy imports so the API can use them)"""
+
+# Workflow stages in execution order, keyed by their output field
+STAGES = ["research", "critical_analysis", "mvp_plan", "pitch"]
+
+# Agent names accepted in place of the stage they produce
+STAGE_ALIASES = {"critical": "critical_analysis", "architect": "mvp_plan"}
+
+VALID_STRENGTHS = ["Frontend", "Backend", "AI/ML", "Full-Stack"]
+
+__all__ = ['STAGES', 'STAGE_ALIASES', 'VALID_STRENGTHS']
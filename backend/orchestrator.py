@@ -4,34 +4,122 @@ from backend.agents.critical_agent import CriticalAgents
 from backend.agents.architect_agent import SolutionArchitectAgents
 from backend.agents.pitch_agent import PitchAgents
 from backend.tasks import ResearchTasks, CriticalTasks, SolutionArchitectTasks, PitchTasks
-from crewai import Crew, Process
-from langchain_community.chat_models import ChatLiteLLM
-from dotenv import load_dotenv
+from backend.prompt_templates import precompile_templates, stage_token_budget
+from backend.config import get_settings
+from backend.memory import build_crew_memory
+from backend.models import STAGES
+from backend.quality_gate import grade_stage, repair_context, repair_sections, required_sections
+from backend.refinement import EDIT_INSTRUCTIONS, IdeaDelta, merge_answer
 import os
 import time
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Optional, Tuple
 
-load_dotenv()
-os.environ["OPENAI_API_KEY"] = "dummy-key"
+# Who revises each stage's document in refinement mode
+REFINEMENT_ROLES = {
+    "research": ("Market Research Specialist", "market research report"),
+    "critical_analysis": ("Critical Risk Analyst", "risk analysis"),
+    "mvp_plan": ("Solution Architect", "MVP plan"),
+    "pitch": ("Pitch Strategist", "pitch strategy"),
+}
 
 class AIStrategistOrchestrator:
     def __init__(self):
-        self.llm = ChatLiteLLM(model="ollama/gemma:2b", base_url="http://localhost:8080")
+        # crewai/litellm are imported here rather than at module import so that
+        # importing the API (or this module) stays fast
+        from langchain_community.chat_models import ChatLiteLLM
+
+        settings = get_settings()  # loads .env
+        os.environ["OPENAI_API_KEY"] = "dummy-key"
+
+        # Optional recording of every prompt sent, for prefix-sharing analysis
+        self.prompt_recorder = None
+        callbacks = None
+        if settings.prompt_log_path:
+            from backend.prompt_log import PromptRecorder
+            self.prompt_recorder = PromptRecorder(settings.prompt_log_path)
+            callbacks = [self.prompt_recorder]
+            print(f"📝 Recording prompts to {settings.prompt_log_path}")
+
+        if settings.local_backend == "embedded":
+            # Loaded now, before the worker reports ready; litellm routes embedded/<name> in-process
+            from backend.embedded_llm import default_threads, register_embedded_model
+            local_model = register_embedded_model(
+                settings.embedded_model_path,
+                n_ctx=settings.embedded_context,
+                n_threads=settings.embedded_threads or default_threads(settings.worker_count)
+            )
+            self.llm = ChatLiteLLM(model=local_model, callbacks=callbacks)
+        else:
+            local_model = f"ollama/{settings.ollama_model}"
+            # keep_alive stops Ollama from unloading the model between requests
+            self.llm = ChatLiteLLM(
+                model=local_model,
+                base_url=settings.ollama_base_url,
+                model_kwargs={"keep_alive": settings.ollama_keep_alive},
+                callbacks=callbacks
+            )
         
         # Setup Groq for architect and pitch agents
-        self.groq_api_key = os.getenv("GROQ_API_KEY")
+        self.groq_api_key = settings.groq_api_key
         if self.groq_api_key:
             # Create Groq LLM specifically for architect and pitch agents
             self.groq_llm = ChatLiteLLM(
-                model="groq/gemma2-9b-it",
+                model=f"groq/{settings.groq_model}",
                 api_key=self.groq_api_key,
-                base_url="https://api.groq.com/openai/v1"
+                base_url=settings.groq_base_url,
+                callbacks=callbacks
             )
             print("✅ Groq API configured for architect & pitch agents")
         else:
             self.groq_llm = self.llm
             print("⚠️ GROQ_API_KEY not found, using local LLM for all agents")
 
+        # Research engine: CrewAI agent loop (default) or retrieval + one synthesis call
+        self.research_engine = None
+        if settings.research_mode == "retrieval":
+            if settings.serper_api_key:
+                from backend.research_engine import RetrievalResearchEngine
+                self.research_engine = RetrievalResearchEngine(self.llm, settings.serper_api_key,
+                                                               early_stop=settings.early_stop)
+                print("🔎 Research stage uses retrieval mode")
+            else:
+                print("⚠️ SERPER_API_KEY not set, research stage falls back to agent mode")
+
+        # Architect engine: CrewAI agent on Groq (default) or local draft + Groq verification
+        self.architect_engine = None
+        if settings.architect_mode == "draft":
+            if self.groq_api_key:
+                from backend.architect_engine import DraftArchitectEngine
+                self.architect_engine = DraftArchitectEngine(self.llm, self.groq_llm, early_stop=settings.early_stop)
+                print("📝 Architect stage uses local drafts with Groq verification")
+            else:
+                print("⚠️ GROQ_API_KEY not set, architect stage falls back to direct mode")
+
+        # CrewAI memory is off unless a shared persistent store is configured
+        self.crew_memory = build_crew_memory(settings)
+
+        # Which model served each stage; stored with every result
+        fast_model = f"groq/{settings.groq_model}" if self.groq_api_key else local_model
+        self.run_config = {
+            "research": local_model,
+            "critical_analysis": local_model,
+            "mvp_plan": fast_model,
+            "pitch": fast_model,
+            "research_mode": "retrieval" if self.research_engine is not None else "agent",
+            "architect_mode": "draft" if self.architect_engine is not None else "direct",
+            "crew_memory": settings.crew_memory,
+            "token_budget_scale": settings.token_budget_scale,
+            "early_stop": settings.early_stop,
+            "quality_threshold": settings.quality_threshold,
+        }
+
+        self.token_budget_scale = settings.token_budget_scale
+        self.quality_threshold = settings.quality_threshold
+        self.quality_repair_attempts = settings.quality_repair_attempts
+
+        # Render the static per-team prompt prefixes once, before the first request
+        print(f"🧩 Precompiled {precompile_templates()} prompt templates")
+
     def validate_inputs(self, team_strength: str, hackathon_duration: int) -> tuple:
         """Validate and normalize inputs"""
         valid_strengths = ["Frontend", "Backend", "AI/ML", "Full-Stack"]
@@ -213,139 +301,241 @@ class AIStrategistOrchestrator:
             
         return output
 
-    def run_strategy_workflow(self, theme: str, idea: str, team_strength: str, hackathon_duration: int) -> Dict[str, Any]:
-        """Execute complete AI Strategist workflow with proper task chaining"""
-        
+    def _kickoff(self, agent, task, agent_type: str, verbose: bool = False) -> str:
+        """Run a single-task crew and return its cleaned output"""
+        from crewai import Crew, Process
+
+        if self.prompt_recorder is not None:
+            self.prompt_recorder.stage = agent_type
+        crew = Crew(
+            agents=[agent],
+            tasks=[task],
+            process=Process.sequential,
+            verbose=verbose,
+            **self.crew_memory
+        )
+        return self.extract_clean_output(crew.kickoff(), agent_type)
+
+    def token_budget(self, stage: str, hackathon_duration: int) -> Optional[int]:
+        """Completion-token cap for a stage in this duration tier (None = uncapped)"""
+        return stage_token_budget(stage, hackathon_duration, self.token_budget_scale)
+
+    def _budgeted(self, llm, stage: str, hackathon_duration: int):
+        """Copy of `llm` capped at the stage's token budget; CrewAI reads max_tokens off the model"""
+        budget = self.token_budget(stage, hackathon_duration)
+        return llm.model_copy(update={"max_tokens": budget}) if budget else llm
+
+    def run_research_stage(self, theme: str, idea: str, team_strength: str, hackathon_duration: int) -> str:
+        """STEP 1: Research Agent (Local LLM)"""
+        if self.research_engine is not None:
+            output = self.research_engine.run(theme, idea, team_strength, hackathon_duration,
+                                              max_tokens=self.token_budget("research", hackathon_duration))
+            return self._clean_output(output, "research")
+
+        research_agent = ResearchAgents().enhanced_research_agent_with_team_focus(
+            self._budgeted(self.llm, "research", hackathon_duration), team_strength, hackathon_duration
+        )
+        research_task = ResearchTasks().research_task(
+            research_agent, theme, idea, team_strength, hackathon_duration
+        )
+        return self._kickoff(research_agent, research_task, "research")
+
+    def run_critical_stage(self, idea: str, research_output: str, team_strength: str, hackathon_duration: int) -> str:
+        """STEP 2: Critical Analysis Agent (Local LLM)"""
+        critical_agent = CriticalAgents().enhanced_critical_agent_with_team_focus(
+            self._budgeted(self.llm, "critical_analysis", hackathon_duration), team_strength, hackathon_duration
+        )
+        critical_task = CriticalTasks().critical_task(
+            critical_agent, research_output, idea, team_strength, hackathon_duration
+        )
+        return self._kickoff(critical_agent, critical_task, "critical")
+
+    def run_architect_stage(self, idea: str, research_output: str, critical_output: str,
+                            team_strength: str, hackathon_duration: int) -> str:
+        """STEP 3: Solution Architect Agent (GROQ LLM for speed)"""
+        if self.architect_engine is not None:
+            if self.prompt_recorder is not None:
+                self.prompt_recorder.stage = "architect"
+            output = self.architect_engine.run(idea, research_output, critical_output, team_strength, hackathon_duration,
+                                               max_tokens=self.token_budget("mvp_plan", hackathon_duration))
+            return self._clean_output(output, "architect")
+
+        architect_agent = SolutionArchitectAgents().enhanced_solution_architect_with_team_focus(
+            self._budgeted(self.groq_llm, "mvp_plan", hackathon_duration), team_strength, hackathon_duration
+        )
+        architect_task = SolutionArchitectTasks().solution_architect_task(
+            architect_agent, idea, research_output, critical_output, team_strength, hackathon_duration
+        )
+        return self._kickoff(architect_agent, architect_task, "architect")
+
+    def run_pitch_stage(self, theme: str, idea: str, architect_output: str,
+                        team_strength: str, hackathon_duration: int) -> str:
+        """STEP 4: Pitch Strategy Agent (GROQ LLM for speed) - ENHANCED DEBUGGING"""
+        print(f"🎯 PITCH AGENT: Starting with enhanced debugging...")
+
+        pitch_agent = PitchAgents().enhanced_pitch_agent_with_team_focus(
+            self._budgeted(self.groq_llm, "pitch", hackathon_duration), team_strength, hackathon_duration
+        )
+        pitch_task = PitchTasks().pitch_task(
+            pitch_agent, architect_output, team_strength, theme, hackathon_duration
+        )
+
+        print(f"🎯 PITCH AGENT: Executing crew.kickoff()...")
+        # Enable verbose for pitch agent debugging
+        pitch_output = self._kickoff(pitch_agent, pitch_task, "pitch", verbose=True)
+
+        # FALLBACK GENERATION if extraction still fails
+        if not pitch_output or len(pitch_output.strip()) < 50:
+            print(f"🔧 PITCH AGENT: Generating fallback pitch content...")
+            pitch_output = self._generate_fallback_pitch(theme, idea, team_strength, hackathon_duration, architect_output)
+            print(f"🔧 PITCH AGENT: Using fallback content ({len(pitch_output)} chars)")
+        return pitch_output
+
+    def refine_stage(self, stage: str, idea: str, team_strength: str, previous_output: str,
+                     delta: IdeaDelta, upstream_changes: str, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """Revise one stage's earlier output for an edited idea with a single edit-only completion"""
+        role, document = REFINEMENT_ROLES[stage]
+        # Same model split as the full workflow
+        llm = self.groq_llm if stage in ("mvp_plan", "pitch") else self.llm
+        if self.prompt_recorder is not None:
+            self.prompt_recorder.stage = f"refine_{stage}"
+        prompt = "\n\n".join([
+            f"**REVISED IDEA:** {idea}",
+            f"**WHAT CHANGED IN THE IDEA:**\n{delta.describe()}",
+            f"**CHANGES ALREADY MADE TO EARLIER STAGES:**\n{upstream_changes or '- None'}",
+            f"**YOUR CURRENT {document.upper()}:**\n{previous_output}",
+            EDIT_INSTRUCTIONS,
+        ])
+        response = llm.invoke([
+            ("system", f"You are the {role} of a {team_strength} hackathon team. The team edited their idea; "
+                       f"update your {document} to match, changing only what the edit affects."),
+            ("human", prompt),
+        ], **({"max_tokens": max_tokens} if max_tokens else {}))
+        output, edits = merge_answer(previous_output, response.content)
+        usage = getattr(response, "usage_metadata", None) or {}
+        print(f"✏️ Refined {stage}: {edits if edits >= 0 else 'full rewrite'} edits, "
+              f"{usage.get('output_tokens', '?')} completion tokens")
+        return {"output": self._clean_output(output, stage), "answer": response.content,
+                "edits": edits, "output_tokens": usage.get("output_tokens")}
+
+    def quality_gate(self, stage: str, output: str, theme: str, idea: str, team_strength: str,
+                     hackathon_duration: int, outputs: Dict[str, str]) -> Tuple[str, Dict[str, Any]]:
+        """Grade a stage's output and repair its weak sections while it scores below the threshold
+
+        `outputs` holds the earlier stages' outputs, which the repair prompt quotes as the stage's inputs.
+        """
+        grade = grade_stage(stage, output, team_strength, hackathon_duration)
+        stats = {"score": grade.score, "initial_score": grade.score, "repairs": 0, "repaired_sections": 0,
+                 "output_tokens": 0}
+        if self.quality_threshold <= 0:
+            return output, stats
+        required = required_sections(stage, team_strength, hackathon_duration)
+        role, document = REFINEMENT_ROLES[stage]
+        # Same model split as the full workflow
+        llm = self.groq_llm if stage in ("mvp_plan", "pitch") else self.llm
+        for _ in range(self.quality_repair_attempts):
+            if grade.score >= self.quality_threshold or not grade.weak_sections:
+                break
+            print(f"🩹 {stage} scored {grade.score:.2f} (< {self.quality_threshold}), "
+                  f"repairing {len(grade.weak_sections)} sections")
+            if self.prompt_recorder is not None:
+                self.prompt_recorder.stage = f"repair_{stage}"
+            repaired, replaced, usage = repair_sections(
+                llm, output, required, grade.weak_sections, grade.problems,
+                context=repair_context(stage, theme, idea, team_strength, hackathon_duration, outputs),
+                system=f"You are the {role} of a {team_strength} hackathon team, fixing the weak sections of your {document}.",
+                max_tokens=self.token_budget(stage, hackathon_duration)
+            )
+            stats["repairs"] += 1
+            stats["output_tokens"] += usage["output_tokens"]
+            repaired_grade = grade_stage(stage, repaired, team_strength, hackathon_duration)
+            # Keep a repair only if it actually scores better
+            if not replaced or repaired_grade.score <= grade.score:
+                print(f"⚠️ Repair of {stage} didn't improve it ({repaired_grade.score:.2f}), keeping the original")
+                break
+            output, grade = repaired, repaired_grade
+            stats["repaired_sections"] += replaced
+        stats["score"] = grade.score
+        return output, stats
+
+    def run_strategy_workflow(self, theme: str, idea: str, team_strength: str, hackathon_duration: int,
+                              completed_stages: Optional[Dict[str, str]] = None,
+                              on_stage_complete: Optional[Callable[[str, str, float], None]] = None,
+                              refinement: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Execute complete AI Strategist workflow with proper task chaining
+
+        `completed_stages` maps stage names (see STAGES) to outputs from an earlier,
+        interrupted run; those stages are reused instead of re-executed.
+        `on_stage_complete(stage, output, elapsed)` is called after each stage that
+        actually runs, so callers can persist progress.
+        `refinement` ({"previous_outputs", "delta", ...}, see POST /strategies/{id}/refine)
+        turns every stage into an edit of the previous strategy's output.
+        """
+
         workflow_start = time.time()
         team_strength, hackathon_duration = self.validate_inputs(team_strength, hackathon_duration)
-        
+        outputs = dict(completed_stages or {})
+        stage_timings = {}
+
+        stage_plan = [
+            ("research", "Market Research & Competitor Analysis", "Research Complete",
+             lambda: self.run_research_stage(theme, idea, team_strength, hackathon_duration)),
+            ("critical_analysis", "Critical Risk Analysis", "Critical Analysis Complete",
+             lambda: self.run_critical_stage(idea, outputs["research"], team_strength, hackathon_duration)),
+            ("mvp_plan", "MVP Architecture Design (Groq)", "Architecture Complete (Groq)",
+             lambda: self.run_architect_stage(idea, outputs["research"], outputs["critical_analysis"],
+                                              team_strength, hackathon_duration)),
+            ("pitch", "Pitch Strategy Generation (Groq)", "Workflow Complete",
+             lambda: self.run_pitch_stage(theme, idea, outputs["mvp_plan"], team_strength, hackathon_duration)),
+        ]
+
+        refinement_stats = {}
+        quality = {}
+        if refinement:
+            delta = IdeaDelta.from_dict(refinement["delta"])
+
+            def refine(stage):
+                upstream = "\n".join(
+                    f"{REFINEMENT_ROLES[name][1]}: {stats['answer']}"
+                    for name, stats in refinement_stats.items() if stats["edits"]
+                )
+                stats = self.refine_stage(stage, idea, team_strength, refinement["previous_outputs"][stage],
+                                          delta, upstream, max_tokens=self.token_budget(stage, hackathon_duration))
+                refinement_stats[stage] = stats
+                return stats["output"]
+
+            stage_plan = [(stage, f"{description} (refining)", done, lambda stage=stage: refine(stage))
+                          for stage, description, done, _ in stage_plan]
+
         try:
             self.log_progress(0, 4, f"Initializing {team_strength} workflow ({hackathon_duration}h hackathon)")
-            
-            # Initialize task creators
-            research_tasks = ResearchTasks()
-            critical_tasks = CriticalTasks()
-            architect_tasks = SolutionArchitectTasks()
-            pitch_tasks = PitchTasks()
-
-            # STEP 1: Research Agent (Local LLM)
-            step_start = time.time()
-            self.log_progress(1, 4, "Market Research & Competitor Analysis")
-            
-            research_agent = ResearchAgents().enhanced_research_agent_with_team_focus(
-                self.llm, team_strength, hackathon_duration
-            )
-            research_task = research_tasks.research_task(
-                research_agent, theme, idea, team_strength, hackathon_duration
-            )
-            
-            research_crew = Crew(
-                agents=[research_agent],
-                tasks=[research_task],
-                process=Process.sequential,
-                verbose=False
-            )
-            research_result = research_crew.kickoff()
-            research_output = self.extract_clean_output(research_result, "research")
-            
-            step_time = time.time() - step_start
-            self.log_progress(1, 4, f"Research Complete", step_time)
-            print(f"📊 Research output length: {len(research_output)} chars")
 
-            # STEP 2: Critical Analysis Agent (Local LLM)
-            step_start = time.time()
-            self.log_progress(2, 4, "Critical Risk Analysis")
-            
-            critical_agent = CriticalAgents().enhanced_critical_agent_with_team_focus(
-                self.llm, team_strength, hackathon_duration
-            )
-            critical_task = critical_tasks.critical_task(
-                critical_agent, research_output, idea, team_strength, hackathon_duration
-            )
-            
-            critical_crew = Crew(
-                agents=[critical_agent],
-                tasks=[critical_task],
-                process=Process.sequential,
-                verbose=False
-            )
-            critical_result = critical_crew.kickoff()
-            critical_output = self.extract_clean_output(critical_result, "critical")
-            
-            step_time = time.time() - step_start
-            self.log_progress(2, 4, f"Critical Analysis Complete", step_time)
-            print(f"⚠️ Critical analysis output length: {len(critical_output)} chars")
+            for step, (stage, description, done_description, run_stage) in enumerate(stage_plan, start=1):
+                if outputs.get(stage):
+                    self.log_progress(step, 4, f"{description} (resumed from saved output)")
+                    continue
 
-            # STEP 3: Solution Architect Agent (GROQ LLM for speed)
-            step_start = time.time()
-            self.log_progress(3, 4, "MVP Architecture Design (Groq)")
-            
-            architect_agent = SolutionArchitectAgents().enhanced_solution_architect_with_team_focus(
-                self.groq_llm, team_strength, hackathon_duration
-            )
-            architect_task = architect_tasks.solution_architect_task(
-                architect_agent, idea, research_output, critical_output, team_strength, hackathon_duration
-            )
-            
-            architect_crew = Crew(
-                agents=[architect_agent],
-                tasks=[architect_task],
-                process=Process.sequential,
-                verbose=False
-            )
-            architect_result = architect_crew.kickoff()
-            architect_output = self.extract_clean_output(architect_result, "architect")
-            
-            step_time = time.time() - step_start
-            self.log_progress(3, 4, f"Architecture Complete (Groq)", step_time)
-            print(f"🏗️ Architecture output length: {len(architect_output)} chars")
+                step_start = time.time()
+                self.log_progress(step, 4, description)
+                outputs[stage] = run_stage()
+                if not refinement:
+                    outputs[stage], quality[stage] = self.quality_gate(
+                        stage, outputs[stage], theme, idea, team_strength, hackathon_duration, outputs
+                    )
+
+                step_time = time.time() - step_start
+                stage_timings[stage] = step_time
+                self.log_progress(step, 4, done_description, step_time if stage != "pitch" else time.time() - workflow_start)
+                print(f"📊 {stage} output length: {len(outputs[stage])} chars")
+
+                if on_stage_complete:
+                    on_stage_complete(stage, outputs[stage], step_time)
 
-            # STEP 4: Pitch Strategy Agent (GROQ LLM for speed) - ENHANCED DEBUGGING
-            step_start = time.time()
-            self.log_progress(4, 4, "Pitch Strategy Generation (Groq)")
-            
-            print(f"🎯 PITCH AGENT: Starting with enhanced debugging...")
-            
-            pitch_agent = PitchAgents().enhanced_pitch_agent_with_team_focus(
-                self.groq_llm, team_strength, hackathon_duration
-            )
-            pitch_task = pitch_tasks.pitch_task(
-                pitch_agent, architect_output, team_strength, theme, hackathon_duration
-            )
-            
-            pitch_crew = Crew(
-                agents=[pitch_agent],
-                tasks=[pitch_task],
-                process=Process.sequential,
-                verbose=True  # Enable verbose for pitch agent debugging
-            )
-            
-            print(f"🎯 PITCH AGENT: Executing crew.kickoff()...")
-            pitch_result = pitch_crew.kickoff()
-            print(f"🎯 PITCH AGENT: Crew execution completed, result type: {type(pitch_result)}")
-            
-            # ENHANCED EXTRACTION FOR PITCH
-            pitch_output = self.extract_clean_output(pitch_result, "pitch")
-            
-            # FALLBACK GENERATION if extraction still fails
-            if not pitch_output or len(pitch_output.strip()) < 50:
-                print(f"🔧 PITCH AGENT: Generating fallback pitch content...")
-                pitch_output = self._generate_fallback_pitch(theme, idea, team_strength, hackathon_duration, architect_output)
-                print(f"🔧 PITCH AGENT: Using fallback content ({len(pitch_output)} chars)")
-            
-            step_time = time.time() - step_start
             total_time = time.time() - workflow_start
-            self.log_progress(4, 4, f"Workflow Complete", total_time)
-            print(f"🎯 Pitch output length: {len(pitch_output)} chars")
 
             # Validate all outputs before returning
-            outputs = {
-                "research": research_output,
-                "critical_analysis": critical_output, 
-                "mvp_plan": architect_output,
-                "pitch": pitch_output  # FIXED: Using "pitch" key as expected by Streamlit
-            }
-            
+            outputs = {stage: outputs[stage] for stage in STAGES}
+
             # Check for empty outputs
             empty_outputs = [key for key, value in outputs.items() if not value or len(value.strip()) < 20]
             if empty_outputs:
@@ -374,8 +564,20 @@ class AIStrategistOrchestrator:
                 
                 # Metadata
                 "execution_time": total_time,
+                "stage_timings": stage_timings,
+                "resumed_stages": sorted((completed_stages or {}).keys()),
                 "timestamp": time.time(),
                 "workflow_version": "3.3_pitch_fixed",
+                "run_config": self.run_config,
+                "refinement": {
+                    "previous_strategy_id": refinement.get("previous_strategy_id"),
+                    "delta": refinement["delta"],
+                    "stages": {stage: {"edits": stats["edits"], "output_tokens": stats["output_tokens"]}
+                               for stage, stats in refinement_stats.items()},
+                } if refinement else None,
+                "quality": quality,
+                "architect_draft": self.architect_engine.last_stats
+                if self.architect_engine is not None and "mvp_plan" in stage_timings and not refinement else None,
                 "llm_config": {
                     "research_critical": "Ollama Gemma:2b",
                     "architect_pitch": "Groq Gemma2-9b-it" if self.groq_api_key else "Ollama Gemma:2b"
@@ -0,0 +1,283 @@
+# backend/pitch_scoring.py
+import re
+from collections import deque
+from itertools import chain
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from backend.agents.pitch_agent import PitchAgents, PitchValidation
+from backend.prompt_templates import DEFAULT_STRENGTH, pitch_templates
+from backend.sections import SECTION_HEADING, TemplateSection, template_sections
+
+# Between pitches in the joined batch text: line breaks so no keyword spans two pitches and ^ anchors
+# work, NUL so no \s in a timestamp range does; word counting treats this NUL as a space
+SEPARATOR = "\n\x00\n"
+# What str.split() splits on, as a code point lookup table (every whitespace code point is below
+# U+3001); larger code points are clamped onto the last, non-space entry
+SPACE_TABLE = np.array([chr(code).isspace() for code in range(0x3002)])
+TIMESTAMP_RANGE = re.compile(r"(\d{1,2}):([0-5]\d)\s*(?:-|–|—|to)\s*(\d{1,2}):([0-5]\d)")
+SECONDS = re.compile(r"(\d+)\s*s")
+PITCH_SECONDS = 180
+# A stated segment boundary this close to a formula's boundary counts as following it
+BOUNDARY_TOLERANCE = 10
+
+
+class KeywordAutomaton:
+    """Aho–Corasick automaton over keyword groups: one pass over a text finds every occurrence.
+
+    Uses pyahocorasick when it is installed and a pure-Python automaton
+    otherwise; both report every match, overlapping ones included, so a
+    group matches exactly when `keyword in text` holds for one of its keywords.
+    """
+
+    def __init__(self, groups: Dict[str, Sequence[str]]):
+        self.groups = list(groups)
+        self.keywords = list(dict.fromkeys(keyword.lower() for name in self.groups for keyword in groups[name]))
+        # keyword x group membership, so per-keyword counts become per-group counts with one matmul
+        self.membership = np.array([[keyword in {k.lower() for k in groups[name]} for name in self.groups]
+                                    for keyword in self.keywords], dtype=np.int64)
+        try:
+            import ahocorasick
+
+            self._native = ahocorasick.Automaton(ahocorasick.STORE_INTS)
+            for index, keyword in enumerate(self.keywords):
+                self._native.add_word(keyword, index)
+            self._native.make_automaton()
+            self.backend = "pyahocorasick"
+        except ImportError:
+            self._native = None
+            self._build()
+            self.backend = "python"
+
+    def _build(self) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        output: List[Tuple[int, ...]] = [()]
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                if char not in goto[state]:
+                    goto.append({})
+                    output.append(())
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            output[state] = (index,)
+
+        # Breadth-first failure links, folded into a full transition table so scanning never backtracks
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            output[state] += output[fail[state]]
+            for char, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(char, 0) if state else 0
+                queue.append(child)
+        self._delta, self._output = delta, output
+
+    def iter(self, text: str) -> Iterator[Tuple[int, int]]:
+        """(end index, keyword index) of every keyword occurrence in `text`"""
+        if self._native is not None:
+            return self._native.iter(text)
+        return self._scan(text)
+
+    def _scan(self, text: str) -> Iterator[Tuple[int, int]]:
+        delta, output, state = self._delta, self._output, 0
+        for position, char in enumerate(text):
+            state = delta[state].get(char, 0)
+            for index in output[state]:
+                yield position, index
+
+    def find(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """End positions and keyword indexes of all matches, as arrays"""
+        flat = np.fromiter(chain.from_iterable(self.iter(text)), dtype=np.int64)
+        return flat[0::2], flat[1::2]
+
+
+@lru_cache(maxsize=1)
+def formula_boundaries() -> Tuple[Tuple[str, ...], np.ndarray]:
+    """Names and interior segment boundaries (seconds) of get_winning_pitch_formulas()"""
+    formulas = PitchAgents.get_winning_pitch_formulas()
+    names, rows = tuple(formulas), []
+    for name in names:
+        durations = [int(seconds) for seconds in SECONDS.findall(formulas[name]["timing"])]
+        rows.append(np.cumsum(durations)[:-1])
+    return names, np.array(rows, dtype=np.float64)
+
+
+@dataclass
+class JoinedBatch:
+    """A batch of lowercased pitches joined by SEPARATOR, as text and as code points"""
+    text: str
+    codes: np.ndarray
+    starts: np.ndarray
+
+
+@dataclass
+class PitchScores:
+    """Score matrix for a batch: one row per pitch, one column per metric"""
+    columns: Tuple[str, ...]
+    matrix: np.ndarray
+    formulas: Tuple[str, ...]
+
+    def column(self, name: str) -> np.ndarray:
+        return self.matrix[:, self.columns.index(name)]
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        records = [dict(zip(self.columns, row.tolist())) for row in self.matrix]
+        for record in records:
+            best = int(record["best_formula"])
+            record["best_formula"] = self.formulas[best] if best >= 0 else None
+        return records
+
+
+class BatchPitchScorer(PitchValidation):
+    """PitchValidation for many pitches at once, plus section and timing metrics.
+
+    The batch is lowercased and joined into one text; keyword groups are
+    matched in a single Aho–Corasick pass, and words, headings and stated
+    timestamps are located with vectorized scans of that text, then mapped
+    back to their pitch with np.searchsorted over the pitch offsets. The
+    structure checks and quality score equal validate_pitch_structure and
+    get_pitch_quality_score for every pitch.
+    """
+
+    def __init__(self, team_strength: str = DEFAULT_STRENGTH):
+        self.checks = list(self.KEYWORD_GROUPS)
+        self.automaton = KeywordAutomaton(self.KEYWORD_GROUPS)
+        self.sections: Tuple[TemplateSection, ...] = template_sections(pitch_templates(team_strength)["description"].prefix)
+        self.formulas, self.boundaries = formula_boundaries()
+        self.columns = tuple(
+            self.checks + ["appropriate_length", "quality_score", "word_count"]
+            + [f"{check}_hits" for check in self.checks]
+            + ["sections_found", "timing_coverage", "formula_fit", "best_formula"]
+        )
+
+    def _join(self, pitches: Sequence[str]) -> "JoinedBatch":
+        texts = [(pitch or "").lower() for pitch in pitches]
+        lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+        starts = np.concatenate(([0], np.cumsum(lengths + len(SEPARATOR))[:-1]))
+        text = SEPARATOR.join(texts)
+        # One code point per str index, so array positions are string positions
+        return JoinedBatch(text, np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32), starts)
+
+    @staticmethod
+    def _owner(starts: np.ndarray, positions: Sequence[int]) -> np.ndarray:
+        return np.searchsorted(starts, np.asarray(positions, dtype=np.int64), side="right") - 1
+
+    def keyword_hits(self, batch: "JoinedBatch") -> np.ndarray:
+        """Occurrences of each keyword group in each pitch"""
+        count, keywords = len(batch.starts), len(self.automaton.keywords)
+        ends, matched = self.automaton.find(batch.text)
+        per_keyword = np.bincount(self._owner(batch.starts, ends) * keywords + matched, minlength=count * keywords)
+        return per_keyword.reshape(count, keywords) @ self.automaton.membership
+
+    @staticmethod
+    def word_counts(batch: "JoinedBatch") -> np.ndarray:
+        """str.split() word counts of every pitch: word starts are non-space code points after a space"""
+        codes = batch.codes
+        space = SPACE_TABLE[np.minimum(codes, 128)] if len(codes) else np.zeros(0, dtype=bool)
+        wide = np.flatnonzero(codes > 128)  # emoji, accents, ...: only these need the full table
+        space[wide] = SPACE_TABLE[np.minimum(codes[wide], len(SPACE_TABLE) - 1)]
+        # The separators' NULs; a NUL inside a pitch is part of a word, as in str.split()
+        space[batch.starts[1:] - SEPARATOR.index("\x00") - 1] = True
+        word_starts = np.flatnonzero(~space[1:] & space[:-1]) + 1
+        if len(space) and not space[0]:
+            word_starts = np.concatenate(([0], word_starts))
+        return np.bincount(BatchPitchScorer._owner(batch.starts, word_starts), minlength=len(batch.starts))
+
+    def sections_found(self, batch: "JoinedBatch") -> np.ndarray:
+        """Share of the pitch template's sections each pitch has a heading for"""
+        codes = batch.codes
+        found = np.zeros((len(batch.starts), len(self.sections)), dtype=bool)
+        if not len(codes):  # only empty pitches
+            return found.mean(axis=1)
+        line_starts = np.concatenate(([0], np.flatnonzero(codes[:-1] == 10) + 1))
+        candidates = line_starts[codes[line_starts] == ord("#")]
+        positions, indexes, known = [], [], {}
+        for start in candidates.tolist():
+            match = SECTION_HEADING.match(batch.text, start)
+            if match is None:
+                continue
+            heading = match.group(0)
+            if heading not in known:
+                known[heading] = next((i for i, section in enumerate(self.sections) if section.matches(heading)), None)
+            if known[heading] is not None:
+                positions.append(start)
+                indexes.append(known[heading])
+        if positions:
+            found[self._owner(batch.starts, positions), indexes] = True
+        return found.mean(axis=1)
+
+    def timing(self, batch: "JoinedBatch") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Coverage of the 3 minutes by stated mm:ss ranges, and fit to the winning formulas' segment boundaries"""
+        codes, count = batch.codes, len(batch.starts)
+        if not len(codes):  # only empty pitches
+            return np.zeros(count), np.zeros(count), np.full(count, -1)
+        # Candidate ranges start one or two digits before a colon that is followed by two digits
+        digit = (codes >= 48) & (codes <= 57)
+        colons = np.flatnonzero(codes == ord(":"))
+        colons = colons[(colons >= 1) & (colons + 2 < len(codes))]
+        colons = colons[digit[colons - 1] & digit[colons + 1] & digit[colons + 2]]
+        candidates = colons - 1 - ((colons >= 2) & digit[np.maximum(colons - 2, 0)])
+        positions, bounds, covered_to = [], [], -1
+        for start in candidates.tolist():
+            if start < covered_to:
+                continue
+            match = TIMESTAMP_RANGE.match(batch.text, start)
+            if match is None:
+                continue
+            m1, s1, m2, s2 = (int(group) for group in match.groups())
+            positions.append(start)
+            bounds.append((m1 * 60 + s1, m2 * 60 + s2))
+            covered_to = match.end()
+        coverage = np.zeros(count)
+        fit = np.zeros((count, len(self.formulas)))
+        if bounds:
+            owner = self._owner(batch.starts, positions)
+            segments = np.clip(np.array(bounds), 0, PITCH_SECONDS)
+            valid = segments[:, 1] > segments[:, 0]
+            owner, segments = owner[valid], segments[valid]
+
+            # Per-second coverage as a difference array: +1 at each start, -1 at each end
+            width = PITCH_SECONDS + 1
+            edges = (np.bincount(owner * width + segments[:, 0], minlength=count * width)
+                     - np.bincount(owner * width + segments[:, 1], minlength=count * width))
+            covered = np.cumsum(edges.reshape(count, width), axis=1)[:, :PITCH_SECONDS] > 0
+            coverage = covered.mean(axis=1)
+
+            # Does each formula boundary have a stated boundary within the tolerance?
+            points = np.concatenate((segments[:, 0], segments[:, 1]))
+            point_owner = np.concatenate((owner, owner))
+            close = np.abs(points[:, None, None] - self.boundaries[None]) <= BOUNDARY_TOLERANCE
+            point, formula, boundary = np.nonzero(close)
+            formulas, boundaries = self.boundaries.shape
+            flat = (point_owner[point] * formulas + formula) * boundaries + boundary
+            hit = np.bincount(flat, minlength=count * formulas * boundaries).reshape(count, formulas, boundaries) > 0
+            fit = hit.mean(axis=2)
+        # -1 when no stated boundary is near any formula's (including pitches without timestamps)
+        best = np.where(fit.max(axis=1) > 0, fit.argmax(axis=1), -1)
+        return coverage, fit.max(axis=1), best
+
+    def score(self, pitches: Sequence[str]) -> PitchScores:
+        """Score every pitch; rows follow the input order"""
+        if not pitches:
+            return PitchScores(self.columns, np.zeros((0, len(self.columns))), self.formulas)
+        batch = self._join(pitches)
+        hits = self.keyword_hits(batch)
+        words = self.word_counts(batch)
+        checks = hits > 0
+        length_ok = (words >= self.WORD_RANGE[0]) & (words <= self.WORD_RANGE[1])
+        structure = np.column_stack((checks, length_ok))
+        coverage, fit, best = self.timing(batch)
+        matrix = np.column_stack((
+            structure, structure.mean(axis=1), words, hits,
+            self.sections_found(batch), coverage, fit, best,
+        )).astype(np.float64)
+        return PitchScores(self.columns, matrix, self.formulas)
+
+
+__all__ = ['BatchPitchScorer', 'PitchScores', 'KeywordAutomaton', 'formula_boundaries']
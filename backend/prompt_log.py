@@ -0,0 +1,41 @@
+# backend/prompt_log.py
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+
+class PromptRecorder(BaseCallbackHandler):
+    """Appends the exact chat messages of every LLM call to a JSONL file.
+
+    Enabled with STRATEGIST_PROMPT_LOG; benchmarks/prefix_sharing.py reads the
+    file to measure how much of each prompt is shared with earlier requests.
+    The orchestrator sets `stage` before each crew run so records can be
+    grouped per stage.
+    """
+
+    _file_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        self.stage = None
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[Any]], **kwargs: Any) -> None:
+        params = kwargs.get("invocation_params") or {}
+        for batch in messages:
+            record = {
+                "timestamp": time.time(),
+                "stage": self.stage,
+                "model": params.get("model") or params.get("model_name"),
+                "messages": [{"role": message.type, "content": message.content} for message in batch],
+            }
+            with self._file_lock, open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+__all__ = ['PromptRecorder']
@@ -0,0 +1,537 @@
+# backend/prompt_templates.py
+"""
+Precompiled task prompts.
+
+Every task prompt is split into a static prefix, which only depends on the team
+strength (and, for the architect, the duration bucket), and a short dynamic
+suffix holding the per-request slots (theme, idea, duration, upstream stage
+outputs). Prefixes are rendered once per (team, bucket) and cached.
+
+Canonical layout: CrewAI sends the agent's role/backstory/goal as the system
+message and then the task description followed by expected_output. So agent
+texts only depend on the team, the output template lives in the static part of
+the description, the REQUEST block comes last and expected_output is a short
+static sentence. Requests for the same team then share everything up to the
+REQUEST block, which Ollama's KV cache and hosted prompt caches can reuse
+(measure with benchmarks/prefix_sharing.py).
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from textwrap import dedent
+from typing import Any, Dict, Optional
+
+from backend.models import VALID_STRENGTHS
+
+DEFAULT_STRENGTH = "Full-Stack"
+
+# Team-specific research focus and constraints
+TEAM_CONSTRAINTS = {
+    "Frontend": {
+        "focus": "UI-friendly APIs, component libraries, design systems",
+        "avoid": "complex ML models, backend infrastructure",
+        "priority": "visual appeal, user experience, responsive design"
+    },
+    "Backend": {
+        "focus": "data APIs, cloud services, database solutions",
+        "avoid": "complex frontend frameworks, UI/UX design",
+        "priority": "API performance, data processing, scalability"
+    },
+    "AI/ML": {
+        "focus": "pre-trained models, ML APIs, data processing tools",
+        "avoid": "complex UI frameworks, extensive backend setup",
+        "priority": "model accuracy, data insights, intelligent features"
+    },
+    "Full-Stack": {
+        "focus": "integrated solutions, complete frameworks",
+        "avoid": "over-specialization in single domain",
+        "priority": "end-to-end functionality, system integration"
+    }
+}
+
+# Team-specific risk profiles and failure modes
+TEAM_RISKS = {
+    "Frontend": {
+        "scope_trap": "building custom backend logic or complex algorithms",
+        "demo_risk": "backend failures, API outages during presentation",
+        "time_sink": "perfect pixel designs, complex animations"
+    },
+    "Backend": {
+        "scope_trap": "complex UI design, mobile responsiveness",
+        "demo_risk": "no visual interface, hard to show functionality",
+        "time_sink": "database optimization, deployment complexity"
+    },
+    "AI/ML": {
+        "scope_trap": "production deployment, scalable infrastructure",
+        "demo_risk": "model not performing consistently live",
+        "time_sink": "model training, data preprocessing"
+    },
+    "Full-Stack": {
+        "scope_trap": "perfecting both frontend and backend equally",
+        "demo_risk": "integration failures between components",
+        "time_sink": "attempting enterprise-level features"
+    }
+}
+
+# Architecture patterns optimized for each team type
+ARCHITECTURE_PATTERNS = {
+    "Frontend": {
+        "pattern": "Component-Based UI with Mock Backend",
+        "focus": "responsive design and smooth interactions",
+        "stack": "React/Vue + Tailwind + Mock APIs + JSON Server",
+        "innovation_angle": "superior UX/UI design and user engagement",
+        "wow_factor": "stunning visual design with smooth animations"
+    },
+    "Backend": {
+        "pattern": "API-First Architecture with Simple Frontend",
+        "focus": "robust APIs and data processing",
+        "stack": "FastAPI + PostgreSQL + Redis + Basic Templates",
+        "innovation_angle": "high-performance data processing and scalable architecture",
+        "wow_factor": "lightning-fast API responses and real-time data handling"
+    },
+    "AI/ML": {
+        "pattern": "Model-as-Service with Streamlit Interface",
+        "focus": "AI capabilities and data insights",
+        "stack": "Python ML + Hugging Face + FastAPI + Streamlit",
+        "innovation_angle": "intelligent automation and predictive capabilities",
+        "wow_factor": "AI making smart decisions visible in real-time"
+    },
+    "Full-Stack": {
+        "pattern": "Layered Full-Stack with Balanced Components",
+        "focus": "complete user journey and integration",
+        "stack": "MERN/MEAN + Database + Authentication + Cloud Deploy",
+        "innovation_angle": "seamless end-to-end integration and user experience",
+        "wow_factor": "complete working system that handles entire user flow"
+    }
+}
+
+# Hour split per duration bucket (requests use the closest bucket)
+TIME_ALLOCATION = {
+    8: {"core": 4, "features": 2, "polish": 2},
+    24: {"core": 12, "features": 8, "polish": 4},
+    48: {"core": 20, "features": 18, "polish": 10}
+}
+
+# Completion-token caps per stage and duration bucket: each template's sections at the length
+# its bucket needs, plus headroom. Scaled by STRATEGIST_TOKEN_BUDGET_SCALE (0 disables them)
+STAGE_TOKEN_BUDGETS = {
+    8: {"research": 900, "critical_analysis": 800, "mvp_plan": 1400, "pitch": 900},
+    24: {"research": 1100, "critical_analysis": 1000, "mvp_plan": 1800, "pitch": 1100},
+    48: {"research": 1300, "critical_analysis": 1200, "mvp_plan": 2200, "pitch": 1300}
+}
+
+COMPLEXITY_LIMITS = {
+    "Frontend": {"avoid": "custom backend logic", "max_apis": 3},
+    "Backend": {"avoid": "complex UI frameworks", "max_endpoints": 8},
+    "AI/ML": {"avoid": "custom training", "max_models": 2},
+    "Full-Stack": {"avoid": "enterprise features", "max_components": 6}
+}
+
+# Pitch templates showcasing team strengths
+PITCH_STRATEGIES = {
+    "Frontend": {
+        "demo_focus": "visual interface, smooth interactions, design quality",
+        "wow_factor": "beautiful, intuitive interface working flawlessly",
+        "credibility": "responsive design, API integration skills"
+    },
+    "Backend": {
+        "demo_focus": "API performance, data processing, system reliability",
+        "wow_factor": "fast, robust system handling complex operations",
+        "credibility": "architecture decisions, scalability planning"
+    },
+    "AI/ML": {
+        "demo_focus": "model intelligence, real-time predictions, data insights",
+        "wow_factor": "AI making visibly smart decisions live",
+        "credibility": "model selection, evaluation metrics, data pipeline"
+    },
+    "Full-Stack": {
+        "demo_focus": "complete user journey, seamless integration",
+        "wow_factor": "end-to-end application that just works",
+        "credibility": "system integration, full-stack architecture"
+    }
+}
+
+
+def duration_bucket(hackathon_duration: int) -> int:
+    """Closest TIME_ALLOCATION bucket for a duration in hours"""
+    return min(TIME_ALLOCATION, key=lambda hours: abs(hours - hackathon_duration))
+
+
+def stage_token_budget(stage: str, hackathon_duration: int, scale: float = 1.0) -> Optional[int]:
+    """max_tokens for a stage (see STAGE_TOKEN_BUDGETS); None when budgets are off"""
+    if scale <= 0:
+        return None
+    return int(STAGE_TOKEN_BUDGETS[duration_bucket(hackathon_duration)][stage] * scale)
+
+
+def feasibility_framework(hackathon_duration: int, team_strength: str) -> Dict[str, Any]:
+    return {
+        "time_budget": TIME_ALLOCATION[duration_bucket(hackathon_duration)],
+        "constraints": COMPLEXITY_LIMITS.get(team_strength, COMPLEXITY_LIMITS[DEFAULT_STRENGTH])
+    }
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """Static prefix rendered once, plus a str.format suffix for the per-request slots"""
+    prefix: str
+    suffix: str = ""
+
+    def render(self, **slots: Any) -> str:
+        return self.prefix + self.suffix.format(**slots)
+
+
+@lru_cache(maxsize=64)
+def research_templates(team_strength: str) -> Dict[str, PromptTemplate]:
+    constraints = TEAM_CONSTRAINTS.get(team_strength, TEAM_CONSTRAINTS[DEFAULT_STRENGTH])
+    description = dedent(f"""
+        HACKATHON MARKET RESEARCH - {team_strength} Team Optimization
+
+        Team Focus: {constraints['priority']}
+
+        **RESEARCH OBJECTIVES:**
+
+        1. **COMPETITOR ANALYSIS**:
+           - 2 major competitors (established solutions)
+           - 3-4 niche/emerging solutions
+           - Identify specific gaps a {team_strength} team can exploit
+           - Focus on: {constraints['focus']}
+
+        2. **TECHNICAL RECOMMENDATIONS**:
+           - APIs/tools matching team strength: {constraints['priority']}
+           - Setup time under 1 hour total
+           - Free/freemium tiers available
+           - Backup options if primary fails
+           - Avoid: {constraints['avoid']}
+
+        3. **HACKATHON OPPORTUNITIES**:
+           - 2-3 missing features across ALL competitors
+           - Quick wins demonstrable in 3-minute pitch
+           - Features showcasing {team_strength} expertise
+           - Demo-safe implementations
+
+        **OUTPUT FORMAT:**
+        ```
+        **COMPETITOR LANDSCAPE:**
+        Major Players: [Names + core features + gaps]
+        Niche Solutions: [Specialized tools + focus areas]
+        Market Gap for {team_strength}: [Specific opportunity]
+
+        **TECH STACK RECOMMENDATIONS:**
+        Primary Stack: [Specific tools/APIs with URLs]
+        Setup Time: [Under 1 hour breakdown]
+        Backup Plan: [Alternative if primary fails]
+        Demo Considerations: [Rate limits, costs, reliability]
+
+        **HACKATHON ADVANTAGE:**
+        Unique Features: [2-3 differentiators]
+        {team_strength} Edge: [How team strength creates advantage]
+        Pitch-Ready Elements: [Demo-worthy capabilities]
+        ```
+    """)
+    return {
+        "description": PromptTemplate(description, dedent("""
+            **REQUEST:**
+            Theme: '{theme}'
+            Idea: '{idea}'
+            Duration: {hackathon_duration} hours
+        """)),
+        "expected_output": PromptTemplate(
+            "Detailed research report with competitor analysis and technical recommendations "
+            f"optimized for {team_strength} team within the requested hackathon duration"
+        ),
+    }
+
+
+@lru_cache(maxsize=64)
+def critical_templates(team_strength: str) -> Dict[str, PromptTemplate]:
+    risks = TEAM_RISKS.get(team_strength, TEAM_RISKS[DEFAULT_STRENGTH])
+    description = dedent(f"""
+        HACKATHON REALITY CHECK - {team_strength} Team Risk Analysis
+
+        **CRITICAL FAILURE ANALYSIS:**
+
+        1. **SCOPE CREEP RISKS**:
+           - Features consuming more than the per-feature limit given below
+           - {team_strength} trap: {risks['scope_trap']}
+           - Features to CUT immediately
+           - Time sinks: {risks['time_sink']}
+
+        2. **TECHNICAL & DEMO RISKS**:
+           - API reliability during demo
+           - Integration failure points
+           - Demo risk: {risks['demo_risk']}
+           - Backup plans for technical failures
+
+        3. **COMPETITIVE DIFFERENTIATION**:
+           - Why existing solutions might already win
+           - "How is this different?" - judge question prep
+           - Value proposition clarity
+
+        4. **MARKET VIABILITY CONCERNS**:
+           - User switching costs from current solutions
+           - "Nice to have" vs "must have" problem
+           - Commercial adoption barriers
+
+        **OUTPUT FORMAT:**
+        ```
+        **🚨 SCOPE KILLERS:**
+        Cut These Features: [Specific time-wasters for {team_strength}]
+        Team Trap: [What {team_strength} teams always over-build]
+
+        **⚡ TECHNICAL RISKS:**
+        API Vulnerabilities: [Unreliable services + backups]
+        Demo Disasters: [What breaks under pressure]
+
+        **🎯 DIFFERENTIATION GAPS:**
+        Judge Concerns: [Why they might say "this exists"]
+        Value Prop Issues: [Unclear unique benefits]
+
+        **🔧 MITIGATION PLAN:**
+        Minimum Viable Demo: [Guaranteed working version]
+        Technical Backup: [When main approach fails]
+        Pitch Recovery: [Presenting when demo breaks]
+        ```
+
+        BE BRUTALLY HONEST - identify every failure mode and force backup planning.
+    """)
+    return {
+        "description": PromptTemplate(description, dedent("""
+            **REQUEST:**
+            Original Idea: {idea}
+            Duration: {hackathon_duration} hours
+            Per-feature limit: {feature_hours} hours
+            Research Context: {research_report}
+        """)),
+        "expected_output": PromptTemplate(
+            f"Honest risk assessment with failure scenarios and mitigation strategies for {team_strength} team"
+        ),
+    }
+
+
+@lru_cache(maxsize=64)
+def architect_templates(team_strength: str, bucket: int) -> Dict[str, PromptTemplate]:
+    arch = ARCHITECTURE_PATTERNS.get(team_strength, ARCHITECTURE_PATTERNS[DEFAULT_STRENGTH])
+    feasibility = feasibility_framework(bucket, team_strength)
+    budget = feasibility['time_budget']
+    description = dedent(f"""
+        COMPREHENSIVE MVP SOLUTION ARCHITECTURE
+
+        Team Strength: {team_strength}
+
+        **CORE ARCHITECT RESPONSIBILITIES:**
+
+        1. **REAL-WORLD PROBLEM DEFINITION:**
+           - Clearly articulate the specific problem being solved
+           - Quantify the problem impact (who, how many, how often)
+           - Connect to hackathon theme meaningfully
+           - Ensure problem is significant enough to matter
+
+        2. **INNOVATION ANALYSIS:**
+           - Identify the core innovation beyond existing solutions
+           - Leverage {team_strength} strengths for unique approach: {arch['innovation_angle']}
+           - Define technical or methodological breakthrough
+           - Explain why this approach hasn't been done before
+
+        3. **TARGET AUDIENCE SPECIFICATION:**
+           - Primary users (demographics, needs, pain points)
+           - Secondary markets and expansion opportunities
+           - Market size and accessibility for {team_strength} team
+           - User acquisition strategy within team capabilities
+
+        4. **FEASIBILITY VALIDATION:**
+           - Time budget: Core ({budget['core']}h), Features ({budget['features']}h), Polish ({budget['polish']}h)
+           - Technical constraints: {feasibility['constraints']}
+           - Resource requirements vs team skills
+           - Risk mitigation for time/scope overruns
+           - Clear go/no-go decision framework
+
+        5. **WOW FACTOR ENGINEERING:**
+           - Define the "holy shit" moment for judges/users
+           - {team_strength} team advantage: {arch['wow_factor']}
+           - Demo-ready features that showcase innovation
+           - Emotional impact and memorable experience design
+
+        6. **COMPETITIVE DIFFERENTIATION:**
+           - Specific advantages over existing solutions from research
+           - Unique value proposition only {team_strength} team can deliver
+           - Defensible moats (technical, user experience, market positioning)
+           - Clear answer to "why can't competitors copy this?"
+
+        **ARCHITECTURE CONSTRAINTS:**
+        - Must use {team_strength} strengths prominently
+        - Recommended pattern: {arch['pattern']}
+        - Tech stack: {arch['stack']}
+        - Avoid: {feasibility['constraints']['avoid']}
+        - Maximum complexity limits applied
+
+        **DELIVERABLE REQUIREMENTS:**
+        Create a complete MVP specification that addresses all 6 core questions while ensuring the solution is:
+        - Buildable by {team_strength} team within the hackathon duration below
+        - Clearly differentiated from competitors
+        - Demo-ready with high wow factor
+        - Commercially viable with clear target market
+        - Technically feasible with specific implementation plan
+
+        **OUTPUT TEMPLATE:**
+
+        # MVP SOLUTION ARCHITECTURE - {team_strength} Team
+
+        ## 🎯 REAL-WORLD PROBLEM
+        **Problem Statement**: [Specific, quantified problem]
+        **Impact Scale**: [Who affected, frequency, severity]
+        **Current Pain Points**: [What users struggle with today]
+        **Market Validation**: [Evidence problem matters]
+
+        ## 💡 CORE INNOVATION
+        **Innovation Thesis**: [What's genuinely new/different]
+        **Technical Breakthrough**: [Leveraging {arch['innovation_angle']}]
+        **Unique Approach**: [Why {team_strength} team can do this]
+        **Competitive Moat**: [Why competitors can't easily copy]
+
+        ## 🎯 TARGET AUDIENCE
+        **Primary Users**: [Demographics, needs, behaviors]
+        **Market Size**: [Addressable market scope]
+        **User Acquisition**: [How to reach them with {team_strength} skills]
+        **Expansion Path**: [Secondary markets and growth]
+
+        ## ⚡ FEASIBILITY ASSESSMENT
+        **Time Breakdown**:
+        - Core Features ({budget['core']}h): [Essential functionality]
+        - Additional Features ({budget['features']}h): [Nice-to-have]
+        - Polish & Demo Prep ({budget['polish']}h): [Final touches]
+
+        **Technical Feasibility**:
+        - Stack: {arch['stack']}
+        - Constraints: {feasibility['constraints']}
+        - Risk Factors: [What could go wrong + mitigation]
+
+        **GO/NO-GO Decision**: ✅ FEASIBLE / ❌ NEEDS SCOPE REDUCTION
+
+        ## 🚀 WOW FACTOR DESIGN
+        **The Magic Moment**: [Specific feature that amazes users]
+        **{team_strength} Showcase**: {arch['wow_factor']}
+        **Demo Hook**: [First 30 seconds that grab attention]
+        **Emotional Impact**: [How users will feel using this]
+
+        ## 🏆 COMPETITIVE DIFFERENTIATION
+        **Unique Value Prop**: [What only we can deliver]
+        **Advantages Over Competitors**:
+        - vs Major Players: [How we're different from big solutions]
+        - vs Niche Solutions: [Our advantage over smaller competitors]
+        **{team_strength} Edge**: [Why our team type wins here]
+        **Defensibility**: [Why this advantage is sustainable]
+
+        ## 🏗️ TECHNICAL ARCHITECTURE
+        **System Design**: {arch['pattern']}
+        **Core Components**: [3-4 main system parts]
+        **Data Flow**: [How information moves through system]
+        **API Strategy**: [External integrations and interfaces]
+
+        ## 📋 IMPLEMENTATION ROADMAP
+        **Phase 1 - Foundation**: [Hours 0-{budget['core']}]
+        **Phase 2 - Features**: [Hours {budget['core']}-{budget['core'] + budget['features']}]
+        **Phase 3 - Polish**: [Final {budget['polish']} hours]
+
+        **Team Task Distribution**: [Specific roles for {team_strength} team]
+        **Demo Preparation**: [What to build for maximum judge impact]
+    """)
+    return {
+        "description": PromptTemplate(description, dedent("""
+            **REQUEST:**
+            Original Idea: "{idea}"
+            Hackathon Duration: {hackathon_duration} hours
+            Research Context: {research_result}
+            Critical Analysis: {critical_result}
+        """)),
+        "expected_output": PromptTemplate(
+            f"Complete MVP solution architecture for the {team_strength} team following the OUTPUT TEMPLATE above"
+        ),
+    }
+
+
+@lru_cache(maxsize=64)
+def pitch_templates(team_strength: str) -> Dict[str, PromptTemplate]:
+    strategy = PITCH_STRATEGIES.get(team_strength, PITCH_STRATEGIES[DEFAULT_STRENGTH])
+    description = dedent(f"""
+        WINNING PITCH STRATEGY - {team_strength} Team Showcase
+
+        **PITCH OPTIMIZATION:**
+        - Demo Focus: {strategy['demo_focus']}
+        - Wow Factor: {strategy['wow_factor']}
+        - Credibility: {strategy['credibility']}
+
+        **3-MINUTE STRUCTURE:**
+
+        **HOOK (0:00-0:25)**: Problem tied to the hackathon theme
+        **SOLUTION (0:25-0:45)**: Core concept + {team_strength} advantage
+        **LIVE DEMO (0:45-2:00)**: Showcase {strategy['demo_focus']}
+        **CREDIBILITY (2:00-2:30)**: Technical depth + {strategy['credibility']}
+        **CLOSE (2:30-3:00)**: Impact + memorable ending
+
+        Create exact script with timing, demo choreography, and backup plans.
+
+        **OUTPUT TEMPLATE:**
+
+        # 3-Minute Pitch Script - {team_strength} Team
+
+        ## 🎯 HOOK (0:00-0:25)
+        [Problem question tied to the theme]
+        [Demo setup and expectation]
+
+        ## 💡 SOLUTION (0:25-0:45)
+        [One-sentence concept]
+        [{team_strength} advantage highlight]
+
+        ## 🚀 LIVE DEMO (0:45-2:00)
+        [Step-by-step user actions → system responses]
+        [Narration emphasizing {strategy['demo_focus']}]
+        [Wow moment showcasing {team_strength}]
+
+        ## 🛠️ CREDIBILITY (2:00-2:30)
+        [Tech stack mention: {strategy['credibility']}]
+        [Challenge overcome]
+        [Market opportunity]
+
+        ## 🏆 CLOSE (2:30-3:00)
+        [Impact statement]
+        [Commercial viability]
+        [Memorable closing line]
+
+        ## 🔧 BACKUP PLAN
+        [Demo failure recovery]
+        [Simplified fallback version]
+
+        ## 📋 Q&A PREP
+        [Top 3 judge questions + answers]
+    """)
+    return {
+        "description": PromptTemplate(description, dedent("""
+            **REQUEST:**
+            Theme: {theme}
+            Duration: {hackathon_duration} hours
+            MVP Plan: {mvp_plan}
+        """)),
+        "expected_output": PromptTemplate(
+            f"3-minute pitch script for the {team_strength} team following the OUTPUT TEMPLATE above"
+        ),
+    }
+
+
+def precompile_templates() -> int:
+    """Render every team / duration-bucket prefix up front; returns how many were built"""
+    for team_strength in VALID_STRENGTHS:
+        research_templates(team_strength)
+        critical_templates(team_strength)
+        pitch_templates(team_strength)
+        for bucket in TIME_ALLOCATION:
+            architect_templates(team_strength, bucket)
+    return len(VALID_STRENGTHS) * (3 + len(TIME_ALLOCATION))
+
+
+__all__ = [
+    'PromptTemplate', 'duration_bucket', 'feasibility_framework', 'precompile_templates', 'stage_token_budget',
+    'research_templates', 'critical_templates', 'architect_templates', 'pitch_templates',
+    'TEAM_CONSTRAINTS', 'TEAM_RISKS', 'ARCHITECTURE_PATTERNS', 'TIME_ALLOCATION',
+    'COMPLEXITY_LIMITS', 'PITCH_STRATEGIES', 'STAGE_TOKEN_BUDGETS'
+]
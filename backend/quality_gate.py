@@ -0,0 +1,120 @@
+# backend/quality_gate.py
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.agents.pitch_agent import PitchValidation
+from backend.prompt_templates import (architect_templates, critical_templates, duration_bucket, pitch_templates,
+                                      research_templates)
+from backend.refinement import parse_edits
+from backend.sections import TemplateSection, check_sections, completeness, replace_sections, template_sections
+
+REPAIR_INSTRUCTIONS = """**HOW TO ANSWER:**
+Every other section is fine and will be kept as is. Output only the sections listed under
+SECTIONS TO FIX, each in full and following its template, as:
+=== REPLACE: <heading line from the template> ===
+<complete section content, without the heading>"""
+
+# What each stage is written from, and how it is labelled when a repair prompt quotes it
+STAGE_INPUTS = {
+    "research": (),
+    "critical_analysis": ("research",),
+    "mvp_plan": ("research", "critical_analysis"),
+    "pitch": ("mvp_plan",),
+}
+INPUT_LABELS = {"research": "MARKET RESEARCH", "critical_analysis": "RISK ANALYSIS", "mvp_plan": "MVP PLAN"}
+
+# PitchValidation check -> the pitch section that should satisfy it, and what it looks for
+PITCH_CHECK_SECTIONS = {
+    "has_strong_opening": "HOOK",
+    "includes_demo_script": "LIVE DEMO",
+    "shows_technical_credibility": "CREDIBILITY",
+    "has_memorable_closing": "CLOSE",
+}
+
+
+@dataclass
+class StageGrade:
+    """Cheap structural score of one stage's output, and the sections a repair should target"""
+    stage: str
+    score: float
+    problems: List[str] = field(default_factory=list)
+    weak_sections: List[int] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def required_sections(stage: str, team_strength: str, hackathon_duration: int) -> Tuple[TemplateSection, ...]:
+    """The sections a stage's task template asks for"""
+    templates = {
+        "research": lambda: research_templates(team_strength),
+        "critical_analysis": lambda: critical_templates(team_strength),
+        "mvp_plan": lambda: architect_templates(team_strength, duration_bucket(hackathon_duration)),
+        "pitch": lambda: pitch_templates(team_strength),
+    }[stage]()
+    return template_sections(templates["description"].prefix)
+
+
+def repair_context(stage: str, theme: str, idea: str, team_strength: str, hackathon_duration: int,
+                   outputs: Dict[str, str]) -> str:
+    """The request a stage was written from, including the upstream outputs it builds on"""
+    lines = [f"**THEME:** {theme}", f"**IDEA:** {idea}",
+             f"**TEAM:** {team_strength}, {hackathon_duration}-hour hackathon"]
+    lines += [f"\n**{INPUT_LABELS[name]}:**\n{outputs[name]}" for name in STAGE_INPUTS[stage] if outputs.get(name)]
+    return "\n".join(lines)
+
+
+def grade_stage(stage: str, output: str, team_strength: str, hackathon_duration: int) -> StageGrade:
+    """Section completeness for every stage; the pitch also gets PitchValidation's structure checks"""
+    required = required_sections(stage, team_strength, hackathon_duration)
+    checks = check_sections(output, required)
+    weak = [index for index, check in enumerate(checks) if not check.ok]
+    grade = StageGrade(stage, completeness(checks), [checks[index].describe() for index in weak], weak)
+    if stage != "pitch":
+        return grade
+
+    structure = PitchValidation.validate_pitch_structure(output or "")
+    grade.score = (grade.score + PitchValidation.get_pitch_quality_score(structure)) / 2
+    for check, section_name in PITCH_CHECK_SECTIONS.items():
+        if structure[check]:
+            continue
+        keywords = ", ".join(f'"{keyword}"' for keyword in PitchValidation.KEYWORD_GROUPS[check])
+        grade.problems.append(f"- {check.replace('_', ' ')}: none of {keywords}")
+        index = next((i for i, section in enumerate(required) if section.matches(section_name)), None)
+        if index is not None and index not in grade.weak_sections:
+            grade.weak_sections.append(index)
+    if not structure["appropriate_length"]:
+        low, high = PitchValidation.WORD_RANGE
+        grade.problems.append(f"- length: {len((output or '').split())} words, aim for {low}-{high}")
+    grade.score = round(grade.score, 3)
+    return grade
+
+
+def repair_sections(llm, document: str, required: Tuple[TemplateSection, ...], weak: List[int],
+                    problems: List[str], context: str, system: str, instructions: str = REPAIR_INSTRUCTIONS,
+                    max_tokens: Optional[int] = None) -> Tuple[str, int, Dict[str, int]]:
+    """Have `llm` rewrite only the weak sections of a document; returns (document, sections replaced, usage)"""
+    prompt = "\n\n".join([
+        context,
+        f"**CURRENT DOCUMENT:**\n{document}",
+        "**SECTIONS TO FIX:**\n" + "\n".join(problems),
+        "**TEMPLATE FOR THOSE SECTIONS:**\n" + "\n\n".join(required[index].template for index in weak),
+        instructions,
+    ])
+    response = llm.invoke([("system", system), ("human", prompt)],
+                          **({"max_tokens": max_tokens} if max_tokens else {}))
+    usage = getattr(response, "usage_metadata", None) or {}
+    usage = {"input_tokens": usage.get("input_tokens", 0), "output_tokens": usage.get("output_tokens", 0)}
+    # Rewrites of sections that weren't asked for are dropped, so those stay verbatim
+    replacements = {}
+    for _, heading, content in parse_edits(response.content):
+        index = next((index for index in weak if required[index].matches(heading)), None)
+        if index is not None and content.strip():
+            replacements[index] = content
+    if not replacements:
+        return document, 0, usage
+    return replace_sections(document, required, replacements), len(replacements), usage
+
+
+__all__ = ['StageGrade', 'grade_stage', 'required_sections', 'repair_context', 'repair_sections',
+           'REPAIR_INSTRUCTIONS', 'PITCH_CHECK_SECTIONS', 'STAGE_INPUTS']
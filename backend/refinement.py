@@ -0,0 +1,170 @@
+# backend/refinement.py
+import difflib
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Sentence pairs at least this similar count as unchanged; between the two, as reworded
+MATCH_THRESHOLD = 0.85
+RELATED_THRESHOLD = 0.5
+# Below this whole-idea similarity the old strategy is no useful starting point
+REWRITE_BELOW = 0.5
+
+HEADING = re.compile(r"^#{1,4}\s+\S.*$", re.M)
+EDIT_MARKER = re.compile(r"^===\s*(REPLACE|ADD|REMOVE)\s*:\s*(.+?)\s*===\s*$", re.M)
+NO_CHANGES = "NO CHANGES"
+
+EDIT_INSTRUCTIONS = f"""**HOW TO ANSWER:**
+Do not rewrite the document. Output only the sections that must change, each as:
+=== REPLACE: <exact existing heading line> ===
+<full new content of that section, without the heading>
+=== ADD: <new heading line, e.g. ## Offline Mode> ===
+<content>
+=== REMOVE: <exact existing heading line> ===
+Leave every section the changes don't affect untouched. If nothing needs to change, answer exactly {NO_CHANGES}."""
+
+
+@dataclass
+class IdeaDelta:
+    """What changed between two versions of an idea, sentence by sentence"""
+    similarity: float
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    reworded: List[Tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def unchanged(self) -> bool:
+        return not (self.added or self.removed or self.reworded)
+
+    @property
+    def needs_rewrite(self) -> bool:
+        return self.similarity < REWRITE_BELOW
+
+    def describe(self) -> str:
+        """The delta as prompt text"""
+        lines = [f"- Now: {new}  (was: {old})" for old, new in self.reworded]
+        lines += [f"- Added: {sentence}" for sentence in self.added]
+        lines += [f"- Dropped: {sentence}" for sentence in self.removed]
+        return "\n".join(lines) or "- No material change"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IdeaDelta":
+        return cls(data["similarity"], data.get("added", []), data.get("removed", []),
+                   [tuple(pair) for pair in data.get("reworded", [])])
+
+
+def split_sentences(text: str) -> List[str]:
+    return [part.strip() for part in re.split(r"(?<=[.!?])\s+|\n+", text) if part.strip()]
+
+
+def diff_ideas(old: str, new: str, encode: Optional[Callable[[List[str]], Any]] = None) -> IdeaDelta:
+    """Semantic diff of two idea texts.
+
+    With `encode` (texts -> L2-normalized vectors, e.g. StrategySearchIndex.encode)
+    sentences are compared by embedding cosine, so rephrasing isn't reported
+    as a change; without it, by character-level similarity.
+    """
+    old_sentences, new_sentences = split_sentences(old), split_sentences(new)
+    if not old_sentences or not new_sentences:
+        return IdeaDelta(similarity=0.0, added=new_sentences, removed=old_sentences)
+
+    if encode is not None:
+        vectors = encode([old, new] + old_sentences + new_sentences)
+        similarity = float(vectors[0] @ vectors[1])
+        old_vectors, new_vectors = vectors[2:2 + len(old_sentences)], vectors[2 + len(old_sentences):]
+        scores = (new_vectors @ old_vectors.T).tolist()
+    else:
+        similarity = difflib.SequenceMatcher(None, old, new).ratio()
+        scores = [[difflib.SequenceMatcher(None, a, b).ratio() for b in old_sentences] for a in new_sentences]
+
+    delta = IdeaDelta(similarity=round(similarity, 3))
+    matched = set()
+    for i, sentence in enumerate(new_sentences):
+        best = max(range(len(old_sentences)), key=lambda j: scores[i][j])
+        if scores[i][best] >= MATCH_THRESHOLD:
+            matched.add(best)
+        elif scores[i][best] >= RELATED_THRESHOLD:
+            matched.add(best)
+            delta.reworded.append((old_sentences[best], sentence))
+        else:
+            delta.added.append(sentence)
+    delta.removed = [sentence for j, sentence in enumerate(old_sentences) if j not in matched]
+    return delta
+
+
+def heading_key(heading: str) -> str:
+    """Headings compare without #'s, emoji, punctuation or case"""
+    return " ".join(re.findall(r"[a-z0-9]+", heading.lower()))
+
+
+def split_sections(markdown: str) -> List[Tuple[str, str]]:
+    """(heading line, body) pairs; text before the first heading has heading ''"""
+    sections, starts = [], [m.start() for m in HEADING.finditer(markdown)]
+    if not starts or starts[0] > 0:
+        sections.append(("", markdown[:starts[0] if starts else len(markdown)].strip("\n")))
+    for start, end in zip(starts, starts[1:] + [len(markdown)]):
+        heading, _, body = markdown[start:end].partition("\n")
+        sections.append((heading.strip(), body.strip("\n")))
+    return sections
+
+
+def parse_edits(text: str) -> List[Tuple[str, str, str]]:
+    """(action, heading, content) triples from a stage's edit answer"""
+    markers = list(EDIT_MARKER.finditer(text))
+    edits = []
+    for marker, following in zip(markers, markers[1:] + [None]):
+        content = text[marker.end():following.start() if following else len(text)].strip("\n")
+        edits.append((marker.group(1), marker.group(2), content))
+    return edits
+
+
+def _section_end(sections: List[Tuple[str, str]], index: int) -> int:
+    """Index after a section's last subsection: the next heading of the same or a higher level"""
+    level = len(sections[index][0]) - len(sections[index][0].lstrip("#"))
+    for end in range(index + 1, len(sections)):
+        heading = sections[end][0]
+        if len(heading) - len(heading.lstrip("#")) <= level:
+            return end
+    return len(sections)
+
+
+def apply_edits(document: str, edits: List[Tuple[str, str, str]]) -> str:
+    """Merge section edits into a markdown document; a section includes its ### subsections"""
+    sections = split_sections(document)
+    for action, heading, content in edits:
+        key = heading_key(heading)
+        index = next((i for i, (existing, _) in enumerate(sections) if existing and heading_key(existing) == key), None)
+        if action == "REMOVE":
+            if index is not None:
+                del sections[index:_section_end(sections, index)]
+        elif action == "REPLACE" and index is not None:
+            sections[index:_section_end(sections, index)] = [(sections[index][0], content)]
+        else:
+            # ADD, or REPLACE of a heading the document doesn't have
+            if not heading.lstrip().startswith("#"):
+                heading = f"## {heading}"
+            sections.append((heading, content))
+    return "\n\n".join(f"{heading}\n{body}" if heading else body for heading, body in sections if heading or body)
+
+
+def merge_answer(previous: str, answer: str) -> Tuple[str, int]:
+    """Apply a stage's answer to its previous output; returns (merged, edits applied)"""
+    answer = answer.strip()
+    edits = parse_edits(answer)
+    if edits:
+        return apply_edits(previous, edits), len(edits)
+    if not answer or answer.rstrip(".!").upper() == NO_CHANGES:
+        return previous, 0
+    # The model ignored the edit format; take a full structured rewrite, otherwise keep what we had
+    if HEADING.search(answer) and len(answer) > len(previous) / 2:
+        print("⚠️ Refinement answer was a full rewrite rather than edits")
+        return answer, -1
+    print("⚠️ Refinement answer had no usable edits, keeping the previous output")
+    return previous, 0
+
+
+__all__ = ['IdeaDelta', 'diff_ideas', 'merge_answer', 'apply_edits', 'parse_edits', 'split_sections',
+           'heading_key', 'EDIT_INSTRUCTIONS', 'REWRITE_BELOW']
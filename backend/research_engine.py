@@ -0,0 +1,127 @@
+# backend/research_engine.py
+import json
+import re
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.agents.research_agent import ResearchAgents
+from backend.prompt_templates import research_templates
+from backend.sections import stream_sections, template_sections
+
+SERPER_URL = "https://google.serper.dev/search"
+
+
+@lru_cache(maxsize=64)
+def synthesis_system_prompt(team_strength: str) -> str:
+    return (
+        f"You are a {team_strength} Team Market Research Specialist for hackathons. "
+        "Base every competitor, tool and API you name on the search results provided with the task, "
+        "cite their URLs, and say so when the results don't cover something instead of guessing."
+    )
+
+
+class RetrievalResearchEngine:
+    """Research stage as deterministic retrieval plus a single synthesis completion.
+
+    The agent mode lets the model decide, one round trip at a time, whether
+    and what to search. Here the team's query templates
+    (ResearchAgents.get_team_search_strategy) are searched in parallel, the
+    results are de-duplicated and compacted to a fixed budget, and the model
+    is called exactly once to write the research report from them.
+    """
+
+    def __init__(self, llm, serper_api_key: str, queries_per_kind: int = 2,
+                 results_per_query: int = 5, max_context_chars: int = 6000, early_stop: bool = True):
+        self.llm = llm
+        self.early_stop = early_stop
+        self.serper_api_key = serper_api_key
+        self.queries_per_kind = queries_per_kind
+        self.results_per_query = results_per_query
+        self.max_context_chars = max_context_chars
+        self.last_stats: Dict[str, Any] = {}
+
+    def build_queries(self, idea: str, team_strength: str) -> List[str]:
+        strategy = ResearchAgents.get_team_search_strategy(team_strength)
+        # Long idea descriptions make poor search queries
+        subject = " ".join(idea.split()[:12])
+        templates = (strategy["competitor_queries"][:self.queries_per_kind]
+                     + strategy["tech_queries"][:self.queries_per_kind])
+        return [template.format(idea=subject) for template in templates]
+
+    def search(self, query: str) -> List[Dict[str, str]]:
+        request = urllib.request.Request(
+            SERPER_URL,
+            data=json.dumps({"q": query, "num": self.results_per_query}).encode("utf-8"),
+            headers={"X-API-KEY": self.serper_api_key, "Content-Type": "application/json"},
+            method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=15) as response:
+                payload = json.loads(response.read().decode("utf-8"))
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            print(f"⚠️ Search failed for '{query}': {e}")
+            return []
+        return [
+            {"title": item.get("title", ""), "link": item.get("link", ""), "snippet": item.get("snippet", "")}
+            for item in payload.get("organic", [])[:self.results_per_query]
+        ]
+
+    def retrieve(self, queries: List[str]) -> List[List[Dict[str, str]]]:
+        with ThreadPoolExecutor(max_workers=len(queries) or 1) as executor:
+            return list(executor.map(self.search, queries))
+
+    def compact(self, queries: List[str], results: List[List[Dict[str, str]]]) -> Tuple[str, int]:
+        """Round-robin over queries, drop duplicate links, stop at the character budget"""
+        seen, lines, used = set(), [], 0
+        for rank in range(self.results_per_query):
+            for query, hits in zip(queries, results):
+                if rank >= len(hits) or hits[rank]["link"] in seen:
+                    continue
+                hit = hits[rank]
+                seen.add(hit["link"])
+                snippet = re.sub(r"\s+", " ", hit["snippet"]).strip()
+                line = f"- [{query}] {hit['title']} ({hit['link']}): {snippet}"
+                if used + len(line) > self.max_context_chars:
+                    return "\n".join(lines), len(lines)
+                lines.append(line)
+                used += len(line) + 1
+        return "\n".join(lines), len(lines)
+
+    def run(self, theme: str, idea: str, team_strength: str, hackathon_duration: int,
+            max_tokens: Optional[int] = None) -> str:
+        start = time.time()
+        queries = self.build_queries(idea, team_strength)
+        context, used_results = self.compact(queries, self.retrieve(queries))
+        retrieval_seconds = time.time() - start
+
+        templates = research_templates(team_strength)
+        prompt = "\n".join([
+            templates["description"].render(theme=theme, idea=idea, hackathon_duration=hackathon_duration),
+            "**SEARCH RESULTS:**",
+            context or "(no results)",
+            "",
+            templates["expected_output"].render(),
+        ])
+        required = template_sections(templates["description"].prefix) if self.early_stop else ()
+        result = stream_sections(self.llm, [("system", synthesis_system_prompt(team_strength)), ("human", prompt)],
+                                 required, max_tokens)
+
+        self.last_stats = {
+            "queries": len(queries),
+            "results": used_results,
+            "context_chars": len(context),
+            "retrieval_seconds": round(retrieval_seconds, 2),
+            "synthesis_seconds": round(time.time() - start - retrieval_seconds, 2),
+            "usage": result.usage,
+            "stopped_early": result.stopped_early,
+        }
+        print(f"🔎 Retrieval research: {len(queries)} queries, {used_results} results, "
+              f"{self.last_stats['retrieval_seconds']}s search + {self.last_stats['synthesis_seconds']}s synthesis")
+        return result.text
+
+
+__all__ = ['RetrievalResearchEngine', 'synthesis_system_prompt']
@@ -0,0 +1,394 @@
+# backend/result_store.py
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.search_index import StrategySearchIndex
+from backend.segments import SegmentStore
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS strategies (
+    strategy_id        TEXT PRIMARY KEY,
+    theme              TEXT NOT NULL COLLATE NOCASE,
+    idea               TEXT NOT NULL,
+    team_strength      TEXT NOT NULL,
+    hackathon_duration INTEGER NOT NULL,
+    success            INTEGER NOT NULL,
+    created_at         REAL NOT NULL,
+    execution_time     REAL,
+    stage_timings      TEXT,                  -- JSON {stage: seconds}
+    run_config         TEXT,                  -- JSON {stage: model, research_mode, ...}
+    codec              TEXT NOT NULL,         -- compression of the body, see CODECS
+    dict_id            INTEGER,               -- zstd dictionary the body was compressed with
+    body               BLOB NOT NULL,         -- compressed JSON response (empty when in a segment)
+    segment            INTEGER,               -- segment file holding the body, if any
+    segment_offset     INTEGER,
+    segment_length     INTEGER,
+    body_size          INTEGER NOT NULL       -- uncompressed bytes
+);
+CREATE INDEX IF NOT EXISTS idx_strategies_created ON strategies(created_at);
+CREATE INDEX IF NOT EXISTS idx_strategies_team_created ON strategies(team_strength, created_at);
+CREATE INDEX IF NOT EXISTS idx_strategies_theme_created ON strategies(theme, created_at);
+
+CREATE TABLE IF NOT EXISTS compression_dicts (
+    dict_id    INTEGER PRIMARY KEY AUTOINCREMENT,
+    dictionary BLOB NOT NULL,
+    samples    INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+# Columns added after the first release; applied to older databases on open
+MIGRATIONS = {
+    "dict_id": "ALTER TABLE strategies ADD COLUMN dict_id INTEGER",
+    "segment": "ALTER TABLE strategies ADD COLUMN segment INTEGER",
+    "segment_offset": "ALTER TABLE strategies ADD COLUMN segment_offset INTEGER",
+    "segment_length": "ALTER TABLE strategies ADD COLUMN segment_length INTEGER",
+}
+
+# Summary columns returned by list(); the body is only decompressed by get()
+SUMMARY_COLUMNS = [
+    "strategy_id", "theme", "idea", "team_strength", "hackathon_duration",
+    "success", "created_at", "execution_time",
+]
+
+
+class ZlibCodec:
+    name = "zlib"
+
+    def load_dictionary(self, data: bytes):
+        return None
+
+    def compress(self, data: bytes, dictionary=None) -> bytes:
+        return zlib.compress(data, 6)
+
+    def decompress(self, data, dictionary=None) -> bytes:
+        return zlib.decompress(data)
+
+
+class ZstdCodec:
+    """zstd, optionally primed with a dictionary trained on earlier outputs.
+
+    Compressors and decompressors are not thread-safe and loading a
+    dictionary into one is the expensive part, so they are kept per thread
+    and per dictionary.
+    """
+    name = "zstd"
+
+    def __init__(self, level: int = 9):
+        import zstandard
+
+        self._zstd = zstandard
+        self.level = level
+        self._local = threading.local()
+
+    def load_dictionary(self, data: bytes):
+        dictionary = self._zstd.ZstdCompressionDict(data)
+        dictionary.precompute_compress(level=self.level)
+        return dictionary
+
+    def _cached(self, kind: str, dictionary):
+        cache = self._local.__dict__.setdefault(kind, {})
+        key = dictionary.dict_id() if dictionary is not None else 0
+        if key not in cache:
+            if kind == "compressors":
+                cache[key] = self._zstd.ZstdCompressor(level=self.level, dict_data=dictionary)
+            else:
+                cache[key] = self._zstd.ZstdDecompressor(dict_data=dictionary)
+        return cache[key]
+
+    def compress(self, data: bytes, dictionary=None) -> bytes:
+        return self._cached("compressors", dictionary).compress(data)
+
+    def decompress(self, data, dictionary=None) -> bytes:
+        return self._cached("decompressors", dictionary).decompress(data)
+
+
+CODECS = {"zlib": ZlibCodec, "zstd": ZstdCodec}
+
+
+def make_codec(name: str):
+    """Codec by name; zstd falls back to zlib when zstandard isn't installed"""
+    if name not in CODECS:
+        raise ValueError(f"Unknown codec '{name}'. Must be one of: {list(CODECS)}")
+    try:
+        return CODECS[name]()
+    except ImportError:
+        print("⚠️ zstandard not installed, compressing strategies with zlib")
+        return ZlibCodec()
+
+
+class ResultStore:
+    """Where finished strategy runs are kept for the history API"""
+
+    def save(self, strategy_id: str, inputs: Dict[str, Any], result: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def get(self, strategy_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def list(self, team_strength: Optional[str] = None, theme: Optional[str] = None,
+             since: Optional[float] = None, until: Optional[float] = None,
+             limit: int = 20, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        raise NotImplementedError
+
+    def summaries(self, strategy_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        raise NotImplementedError
+
+
+class SQLiteResultStore(ResultStore):
+    """Strategy history in SQLite (WAL) with the full response stored compressed.
+
+    Filterable fields are plain indexed columns so listing history never
+    touches the bodies; reading one strategy back is a single primary-key
+    lookup plus a decompress, instead of a regeneration. Bodies are
+    compressed with zstd and, once enough runs exist, a dictionary trained on
+    them (outputs share most of their headings and boilerplate). With a
+    segment directory the compressed bytes go to append-only segment files
+    and are decompressed straight out of an mmap; otherwise they are stored
+    inline as a BLOB. When a search index is attached, every saved run is
+    indexed right away.
+    """
+
+    def __init__(self, db_path: str, codec: str = "zstd", index: Optional[StrategySearchIndex] = None,
+                 segment_dir: Optional[str] = None, dictionary_threshold: int = 200):
+        self.db_path = db_path
+        self.codec = make_codec(codec)
+        self._codecs = {self.codec.name: self.codec}
+        self.index = index
+        self.segments = SegmentStore(segment_dir) if segment_dir else None
+        self.dictionary_threshold = dictionary_threshold
+        self._local = threading.local()
+        self._dicts: Dict[int, Any] = {}
+        self._dicts_lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(strategies)")}
+        for column, statement in MIGRATIONS.items():
+            if column not in columns:
+                conn.execute(statement)
+
+    def _connect(self) -> sqlite3.Connection:
+        """One connection per thread; sqlite3 connections are not thread-safe"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _dictionary(self, dict_id: Optional[int]):
+        """Loaded dictionary by id (cached; dictionaries never change once written)"""
+        if dict_id is None:
+            return None
+        with self._dicts_lock:
+            if dict_id not in self._dicts:
+                row = self._connect().execute(
+                    "SELECT dictionary FROM compression_dicts WHERE dict_id = ?", (dict_id,)
+                ).fetchone()
+                self._dicts[dict_id] = make_codec("zstd").load_dictionary(row["dictionary"])
+            return self._dicts[dict_id]
+
+    def _current_dictionary(self) -> Optional[int]:
+        """Newest dictionary id, training the first one once enough strategies exist"""
+        if self.codec.name != "zstd":
+            return None
+        conn = self._connect()
+        dict_id = conn.execute("SELECT MAX(dict_id) FROM compression_dicts").fetchone()[0]
+        if dict_id is None and conn.execute("SELECT COUNT(*) FROM strategies").fetchone()[0] >= self.dictionary_threshold:
+            try:
+                dict_id = self.train_dictionary()
+            except Exception as e:
+                # Too few or too uniform samples; keep compressing without one
+                print(f"⚠️ Failed to train compression dictionary: {e}")
+        return dict_id
+
+    def train_dictionary(self, sample_limit: int = 2000, dict_size: int = 112 * 1024) -> int:
+        """Train a zstd dictionary on the most recent bodies and make it the current one"""
+        import zstandard
+
+        rows = self._connect().execute(
+            "SELECT strategy_id FROM strategies ORDER BY created_at DESC LIMIT ?", (sample_limit,)
+        ).fetchall()
+        samples = [self._body(row["strategy_id"]) for row in rows]
+        trained = zstandard.train_dictionary(dict_size, samples)
+        dict_id = self._connect().execute(
+            "INSERT INTO compression_dicts (dictionary, samples, created_at) VALUES (?, ?, ?)",
+            (trained.as_bytes(), len(samples), time.time())
+        ).lastrowid
+        print(f"🗜️ Trained compression dictionary {dict_id} on {len(samples)} strategies")
+        return dict_id
+
+    def _body(self, strategy_id: str) -> Optional[bytes]:
+        """Uncompressed JSON body of one strategy"""
+        row = self._connect().execute(
+            "SELECT codec, dict_id, body, segment, segment_offset, segment_length "
+            "FROM strategies WHERE strategy_id = ?", (strategy_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        if row["segment"] is not None:
+            if self.segments is None:
+                raise RuntimeError(f"Strategy {strategy_id} is stored in a segment file but no segment dir is set")
+            # Decompress straight out of the mapped segment, no read() copy
+            data = self.segments.read(row["segment"], row["segment_offset"], row["segment_length"])
+        else:
+            data = row["body"]
+        if row["codec"] not in self._codecs:
+            self._codecs[row["codec"]] = make_codec(row["codec"])
+        return self._codecs[row["codec"]].decompress(data, self._dictionary(row["dict_id"]))
+
+    def save(self, strategy_id: str, inputs: Dict[str, Any], result: Dict[str, Any]) -> None:
+        body = json.dumps(result, default=str).encode("utf-8")
+        dict_id = self._current_dictionary()
+        compressed = self.codec.compress(body, self._dictionary(dict_id))
+        segment = segment_offset = segment_length = None
+        if self.segments is not None:
+            segment, segment_offset, segment_length = self.segments.append(compressed)
+            compressed = b""
+        self._connect().execute(
+            """
+            INSERT OR REPLACE INTO strategies
+                (strategy_id, theme, idea, team_strength, hackathon_duration, success, created_at,
+                 execution_time, stage_timings, run_config, codec, dict_id, body,
+                 segment, segment_offset, segment_length, body_size)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                strategy_id,
+                result.get("theme", inputs["theme"]),
+                result.get("original_idea", inputs["idea"]),
+                # Normalized values from the workflow when it got that far
+                result.get("team_strength", inputs["team_strength"]),
+                int(result.get("hackathon_duration", inputs["hackathon_duration"])),
+                int(bool(result.get("success"))),
+                result.get("timestamp") or time.time(),
+                result.get("execution_time"),
+                json.dumps(result.get("stage_timings") or {}),
+                json.dumps(result.get("run_config") or {}),
+                self.codec.name,
+                dict_id,
+                compressed,
+                segment,
+                segment_offset,
+                segment_length,
+                len(body),
+            )
+        )
+        if self.index is not None:
+            try:
+                self.index.add(strategy_id, {**result, "theme": inputs["theme"], "idea": inputs["idea"]})
+            except Exception as e:
+                # The run itself is stored; `python -m backend.search_index` can backfill it later
+                print(f"⚠️ Failed to index strategy {strategy_id}: {e}")
+
+    def get(self, strategy_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connect().execute(
+            f"SELECT {', '.join(SUMMARY_COLUMNS)}, stage_timings, run_config FROM strategies WHERE strategy_id = ?",
+            (strategy_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        record = {column: row[column] for column in SUMMARY_COLUMNS}
+        record["success"] = bool(record["success"])
+        record["stage_timings"] = json.loads(row["stage_timings"] or "{}")
+        record["run_config"] = json.loads(row["run_config"] or "{}")
+        record["result"] = json.loads(self._body(strategy_id))
+        return record
+
+    def storage_stats(self) -> Dict[str, Any]:
+        """Stored vs uncompressed bytes per codec"""
+        rows = self._connect().execute(
+            "SELECT codec, dict_id IS NOT NULL AS with_dict, COUNT(*) AS strategies, SUM(body_size) AS raw_bytes, "
+            "SUM(COALESCE(segment_length, LENGTH(body))) AS stored_bytes FROM strategies GROUP BY 1, 2"
+        ).fetchall()
+        return {
+            f"{row['codec']}{'+dict' if row['with_dict'] else ''}": {
+                "strategies": row["strategies"],
+                "raw_bytes": row["raw_bytes"],
+                "stored_bytes": row["stored_bytes"],
+                "ratio": round(row["raw_bytes"] / max(1, row["stored_bytes"]), 2),
+            }
+            for row in rows
+        }
+
+    def summaries(self, strategy_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Summary rows for the given ids (e.g. search hits), keyed by id"""
+        if not strategy_ids:
+            return {}
+        rows = self._connect().execute(
+            f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM strategies "
+            f"WHERE strategy_id IN ({', '.join('?' for _ in strategy_ids)})",
+            strategy_ids
+        ).fetchall()
+        return {row["strategy_id"]: {**dict(row), "success": bool(row["success"])} for row in rows}
+
+    def list(self, team_strength: Optional[str] = None, theme: Optional[str] = None,
+             since: Optional[float] = None, until: Optional[float] = None,
+             limit: int = 20, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """Newest first; returns (page, total matching)"""
+        clauses, params = [], []
+        if team_strength:
+            clauses.append("team_strength = ?")
+            params.append(team_strength)
+        if theme:
+            clauses.append("theme = ?")
+            params.append(theme)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("created_at < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        conn = self._connect()
+        total = conn.execute(f"SELECT COUNT(*) FROM strategies {where}", params).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM strategies {where} "
+            "ORDER BY created_at DESC LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        ).fetchall()
+        page = [{**dict(row), "success": bool(row["success"])} for row in rows]
+        return page, total
+
+
+def create_result_store() -> ResultStore:
+    from backend.config import get_settings
+
+    settings = get_settings()
+    index = StrategySearchIndex(settings.result_db_path, embedding_model=settings.search_embedding_model)
+    return SQLiteResultStore(
+        settings.result_db_path,
+        codec=settings.result_codec,
+        index=index,
+        segment_dir=settings.result_segment_dir,
+    )
+
+
+def main(argv=None) -> None:
+    """Train a fresh compression dictionary on the stored strategies"""
+    parser = argparse.ArgumentParser(description="Manage strategy storage compression")
+    parser.add_argument("--samples", type=int, default=2000, help="Most recent strategies to train on")
+    args = parser.parse_args(argv)
+    store = create_result_store()
+    store.train_dictionary(sample_limit=args.samples)
+    for codec, stats in store.storage_stats().items():
+        print(f"📦 {codec:10s} {stats['strategies']:6d} strategies  {stats['ratio']:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
+
+
+__all__ = ['ResultStore', 'SQLiteResultStore', 'create_result_store', 'make_codec', 'CODECS']
@@ -0,0 +1,140 @@
+# backend/scheduler.py
+import sqlite3
+import time
+from typing import List, Optional
+
+from backend.models import STAGES
+
+# Served in this order; a lower class only runs when the classes above are empty
+PRIORITY_CLASSES = ["interactive", "batch"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scheduler_turns (
+    priority TEXT PRIMARY KEY,
+    client_id TEXT NOT NULL            -- client currently holding the round-robin turn
+);
+CREATE TABLE IF NOT EXISTS scheduler_deficits (
+    priority  TEXT NOT NULL,
+    client_id TEXT NOT NULL,
+    deficit   INTEGER NOT NULL,
+    PRIMARY KEY (priority, client_id)
+);
+"""
+
+
+class FairScheduler:
+    """Priority classes with deficit round robin across clients.
+
+    Interactive jobs always go before batch jobs, except that a batch job
+    that has waited longer than `batch_max_wait` is promoted so batches still
+    make progress under constant interactive load. Within a class, clients
+    (API key or client id) take turns: each turn grants `quantum` credits and
+    a job costs one credit per stage it still has to run, so a client with 200
+    queued ideas gets the same share as a client with one. Scheduler state
+    lives in the job database so every worker process sees the same rotation.
+
+    All methods expect to run inside the caller's write transaction.
+    """
+
+    def __init__(self, quantum: int = len(STAGES), batch_max_wait: float = 900.0):
+        # A quantum of at least the largest job cost guarantees progress every turn
+        self.quantum = max(quantum, len(STAGES))
+        self.batch_max_wait = batch_max_wait
+
+    @staticmethod
+    def create_schema(conn: sqlite3.Connection) -> None:
+        conn.executescript(SCHEMA)
+
+    def pick(self, conn: sqlite3.Connection) -> Optional[str]:
+        """Job id of the next queued job to run, or None"""
+        if self._has_starved_batch(conn):
+            order = ["batch", "interactive"]
+        else:
+            order = PRIORITY_CLASSES
+
+        for priority in order:
+            job_id = self._pick_in_class(conn, priority)
+            if job_id:
+                return job_id
+        return None
+
+    def _has_starved_batch(self, conn: sqlite3.Connection) -> bool:
+        row = conn.execute(
+            "SELECT 1 FROM jobs WHERE status = 'queued' AND priority = 'batch' AND submitted_at < ? LIMIT 1",
+            (time.time() - self.batch_max_wait,)
+        ).fetchone()
+        return row is not None
+
+    def _waiting_clients(self, conn: sqlite3.Connection, priority: str) -> List[str]:
+        rows = conn.execute(
+            "SELECT DISTINCT client_id FROM jobs WHERE status = 'queued' AND priority = ? ORDER BY client_id",
+            (priority,)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def _head_job(self, conn: sqlite3.Connection, priority: str, client_id: str):
+        """Client's oldest queued job and its cost (stages left to run)"""
+        row = conn.execute(
+            """
+            SELECT j.job_id, (SELECT COUNT(*) FROM job_stages s WHERE s.job_id = j.job_id) AS done
+            FROM jobs j
+            WHERE j.status = 'queued' AND j.priority = ? AND j.client_id = ?
+            ORDER BY j.submitted_at
+            LIMIT 1
+            """,
+            (priority, client_id)
+        ).fetchone()
+        return row[0], max(len(STAGES) - row[1], 1)
+
+    def _pick_in_class(self, conn: sqlite3.Connection, priority: str) -> Optional[str]:
+        clients = self._waiting_clients(conn, priority)
+        if not clients:
+            conn.execute("DELETE FROM scheduler_deficits WHERE priority = ?", (priority,))
+            conn.execute("DELETE FROM scheduler_turns WHERE priority = ?", (priority,))
+            return None
+
+        # Idle clients lose their leftover credit, as in classic DRR
+        placeholders = ",".join("?" * len(clients))
+        conn.execute(
+            f"DELETE FROM scheduler_deficits WHERE priority = ? AND client_id NOT IN ({placeholders})",
+            (priority, *clients)
+        )
+        deficits = dict(conn.execute(
+            "SELECT client_id, deficit FROM scheduler_deficits WHERE priority = ?", (priority,)
+        ).fetchall())
+
+        turn = conn.execute("SELECT client_id FROM scheduler_turns WHERE priority = ?", (priority,)).fetchone()
+        if turn and turn[0] in clients:
+            # The current client's turn is still in progress; its quantum was already granted
+            index = clients.index(turn[0])
+        else:
+            # Continue the rotation after the last client served
+            last = turn[0] if turn else ""
+            index = next((i for i, client in enumerate(clients) if client > last), 0)
+            deficits[clients[index]] = deficits.get(clients[index], 0) + self.quantum
+
+        for _ in range(len(clients) + 1):
+            client = clients[index]
+            job_id, cost = self._head_job(conn, priority, client)
+            if deficits.get(client, 0) >= cost:
+                deficits[client] -= cost
+                self._save(conn, priority, client, deficits)
+                return job_id
+            # Turn over: the next client gets its quantum
+            index = (index + 1) % len(clients)
+            deficits[clients[index]] = deficits.get(clients[index], 0) + self.quantum
+
+        return None  # unreachable while quantum >= max job cost
+
+    def _save(self, conn: sqlite3.Connection, priority: str, client: str, deficits) -> None:
+        conn.executemany(
+            "INSERT OR REPLACE INTO scheduler_deficits (priority, client_id, deficit) VALUES (?, ?, ?)",
+            [(priority, client_id, deficit) for client_id, deficit in deficits.items()]
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO scheduler_turns (priority, client_id) VALUES (?, ?)",
+            (priority, client)
+        )
+
+
+__all__ = ['FairScheduler', 'PRIORITY_CLASSES']
@@ -0,0 +1,319 @@
+# backend/search_index.py
+import argparse
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS strategies_fts USING fts5(
+    strategy_id UNINDEXED,
+    theme, idea, research, critical_analysis, mvp_plan, pitch,
+    tokenize = 'porter unicode61'
+);
+-- strategy_id -> its strategies_fts row; FTS5 can't index the UNINDEXED id column
+CREATE TABLE IF NOT EXISTS strategy_index (
+    seq         INTEGER PRIMARY KEY AUTOINCREMENT,  -- never reused; a re-index gets a new one
+    strategy_id TEXT NOT NULL UNIQUE,
+    fts_rowid   INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS strategy_embeddings (
+    version     INTEGER PRIMARY KEY AUTOINCREMENT,  -- never reused, so readers can follow new rows
+    strategy_id TEXT NOT NULL,
+    model       TEXT NOT NULL,
+    vector      BLOB NOT NULL,                      -- float32, L2-normalized
+    UNIQUE (strategy_id, model)
+);
+"""
+
+FTS_COLUMNS = ["theme", "idea", "research", "critical_analysis", "mvp_plan", "pitch"]
+SEARCH_MODES = ["keyword", "semantic", "hybrid"]
+
+# Reciprocal-rank-fusion constant for hybrid search
+RRF_K = 60
+
+
+def embedding_text(fields: Dict[str, Any]) -> str:
+    """What a strategy is compared on: the idea plus the start of its MVP plan"""
+    return f"{fields.get('theme', '')}: {fields.get('idea', '')}\n{(fields.get('mvp_plan') or '')[:1500]}"
+
+
+def fts_query(text: str) -> str:
+    """Quote every term so user input can't trip FTS5 query syntax"""
+    terms = re.findall(r"\w+", text)
+    return " ".join(f'"{term}"' for term in terms)
+
+
+class StrategySearchIndex:
+    """Keyword (SQLite FTS5) and semantic (sentence-transformers) search over stored strategies.
+
+    Lives in the result store's database. ResultStore.save() only updates the
+    keyword index, so workers never load the embedding model; new strategies
+    are embedded in batches by embed_pending(), which the API runs in a
+    background thread (start_embedder) and the backfill CLI runs up front.
+    Embeddings are kept in SQLite and mirrored into an in-memory matrix that
+    each process extends with rows it hasn't seen yet, so a query is one
+    matrix-vector product. Semantic search is skipped when the model can't
+    be loaded.
+    """
+
+    def __init__(self, db_path: str, embedding_model: Optional[str] = "all-MiniLM-L6-v2"):
+        self.db_path = db_path
+        self.embedding_model = embedding_model
+        self._local = threading.local()
+        self._encoder = None
+        self._encoder_lock = threading.Lock()
+        self._embed_lock = threading.Lock()
+        self._matrix_lock = threading.Lock()
+        self._ids: List[str] = []
+        self._matrix = None
+        self._loaded_version = 0
+        self._embedded_seq = 0
+        self._embedder: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        self._migrate(self._connect())
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """Create the tables, upgrading databases from before strategy_index and embedding versions"""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(strategy_embeddings)")}
+        if columns and "version" not in columns:
+            # Embeddings are derived data; embed_pending() rebuilds them
+            conn.execute("DROP TABLE strategy_embeddings")
+        new_index = not conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'strategy_index'"
+        ).fetchone()
+        conn.executescript(SCHEMA)
+        if new_index:
+            conn.execute("INSERT OR REPLACE INTO strategy_index (strategy_id, fts_rowid) "
+                         "SELECT strategy_id, rowid FROM strategies_fts ORDER BY rowid")
+
+    def _connect(self) -> sqlite3.Connection:
+        """One connection per thread; sqlite3 connections are not thread-safe"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    @property
+    def semantic_enabled(self) -> bool:
+        return self._get_encoder() is not None
+
+    def _get_encoder(self):
+        """Load the embedding model on first use (False = unavailable); may download it, so call off the event loop"""
+        if self._encoder is None:
+            with self._encoder_lock:
+                if self._encoder is None and not self.embedding_model:
+                    self._encoder = False
+                elif self._encoder is None:
+                    try:
+                        from sentence_transformers import SentenceTransformer
+                        self._encoder = SentenceTransformer(self.embedding_model)
+                    except ImportError:
+                        print("⚠️ sentence-transformers not installed, semantic search disabled")
+                        self._encoder = False
+                    except Exception as e:
+                        # Download or load failures (OSError, HTTP errors, ...) leave search keyword-only
+                        print(f"⚠️ Failed to load embedding model {self.embedding_model}, semantic search disabled: {e}")
+                        self._encoder = False
+        return self._encoder or None
+
+    def encode(self, texts: List[str]):
+        return self._get_encoder().encode(texts, normalize_embeddings=True, convert_to_numpy=True).astype("float32")
+
+    def add(self, strategy_id: str, fields: Dict[str, Any]) -> None:
+        """Index (or re-index) one strategy for keyword search; embed_pending() embeds it later"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            previous = conn.execute("SELECT fts_rowid FROM strategy_index WHERE strategy_id = ?",
+                                    (strategy_id,)).fetchone()
+            if previous is not None:
+                conn.execute("DELETE FROM strategies_fts WHERE rowid = ?", (previous[0],))
+            # A re-indexed strategy gets re-embedded from its new text
+            conn.execute("DELETE FROM strategy_embeddings WHERE strategy_id = ?", (strategy_id,))
+            cursor = conn.execute(
+                f"INSERT INTO strategies_fts (strategy_id, {', '.join(FTS_COLUMNS)}) "
+                f"VALUES (?, {', '.join('?' for _ in FTS_COLUMNS)})",
+                [strategy_id] + [fields.get(column) or "" for column in FTS_COLUMNS]
+            )
+            conn.execute("INSERT OR REPLACE INTO strategy_index (strategy_id, fts_rowid) VALUES (?, ?)",
+                         (strategy_id, cursor.lastrowid))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def embed_pending(self, batch_size: int = 64) -> int:
+        """Embed strategies indexed since the last call that have no embedding for this model; returns how many"""
+        if not self.semantic_enabled:
+            return 0
+        conn = self._connect()
+        embedded = 0
+        with self._embed_lock:
+            while True:
+                # Writers serialize, so seq order is commit order and everything up to _embedded_seq is done
+                rows = conn.execute(
+                    """
+                    SELECT i.seq, i.strategy_id, f.theme, f.idea, f.mvp_plan
+                    FROM strategy_index i JOIN strategies_fts f ON f.rowid = i.fts_rowid
+                    WHERE i.seq > ? AND NOT EXISTS (
+                        SELECT 1 FROM strategy_embeddings e WHERE e.strategy_id = i.strategy_id AND e.model = ?
+                    )
+                    ORDER BY i.seq LIMIT ?
+                    """,
+                    (self._embedded_seq, self.embedding_model, batch_size)
+                ).fetchall()
+                if not rows:
+                    return embedded
+                vectors = self.encode([embedding_text(dict(row)) for row in rows])
+                conn.executemany(
+                    "INSERT OR REPLACE INTO strategy_embeddings (strategy_id, model, vector) VALUES (?, ?, ?)",
+                    [(row["strategy_id"], self.embedding_model, vector.tobytes()) for row, vector in zip(rows, vectors)]
+                )
+                self._embedded_seq = rows[-1]["seq"]
+                embedded += len(rows)
+
+    def start_embedder(self, interval: float = 10.0) -> None:
+        """Embed newly saved strategies in a background thread, so queries never wait on it"""
+        if self._embedder is not None or not self.embedding_model:
+            return
+
+        def run():
+            while not self._stop.is_set():
+                try:
+                    if not self.semantic_enabled:
+                        return
+                    count = self.embed_pending()
+                    if count:
+                        print(f"🧠 Embedded {count} new strategies for semantic search")
+                except Exception as e:
+                    print(f"⚠️ Embedding new strategies failed: {e}")
+                self._stop.wait(interval)
+
+        self._stop.clear()
+        self._embedder = threading.Thread(target=run, name="strategy-embedder", daemon=True)
+        self._embedder.start()
+
+    def stop_embedder(self) -> None:
+        if self._embedder is not None:
+            self._stop.set()
+            self._embedder.join(timeout=5)
+            self._embedder = None
+
+    def keyword_search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        match = fts_query(query)
+        if not match:
+            return []
+        rows = self._connect().execute(
+            """
+            SELECT strategy_id, bm25(strategies_fts) AS rank,
+                   snippet(strategies_fts, -1, '**', '**', '…', 12) AS snippet
+            FROM strategies_fts WHERE strategies_fts MATCH ?
+            ORDER BY rank LIMIT ?
+            """,
+            (match, limit)
+        ).fetchall()
+        # bm25() is lower-is-better; flip it so every mode returns higher = better
+        return [{"strategy_id": row["strategy_id"], "score": -row["rank"], "snippet": row["snippet"]} for row in rows]
+
+    def _refresh_matrix(self) -> None:
+        """Append embeddings written (by any process) since the last refresh"""
+        import numpy as np
+
+        rows = self._connect().execute(
+            "SELECT version, strategy_id, vector FROM strategy_embeddings WHERE version > ? AND model = ? "
+            "ORDER BY version",
+            (self._loaded_version, self.embedding_model)
+        ).fetchall()
+        if not rows:
+            return
+        vectors = np.stack([np.frombuffer(row["vector"], dtype=np.float32) for row in rows])
+        with self._matrix_lock:
+            # A re-embedded strategy comes back with a new version; drop its old row
+            new_ids = {row["strategy_id"] for row in rows}
+            if self._matrix is not None and new_ids.intersection(self._ids):
+                keep = [i for i, sid in enumerate(self._ids) if sid not in new_ids]
+                self._ids = [self._ids[i] for i in keep]
+                self._matrix = self._matrix[keep]
+            self._ids.extend(row["strategy_id"] for row in rows)
+            self._matrix = vectors if self._matrix is None else np.vstack([self._matrix, vectors])
+            self._loaded_version = rows[-1]["version"]
+
+    def semantic_search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        if not self.semantic_enabled:
+            return []
+        return self.nearest(self.encode([query])[0], limit)
+
+    def nearest(self, vector, limit: int = 20) -> List[Dict[str, Any]]:
+        """Strategies whose embedding has the highest cosine similarity to `vector`"""
+        import numpy as np
+
+        self._refresh_matrix()
+        with self._matrix_lock:
+            if self._matrix is None or not len(self._ids):
+                return []
+            scores = self._matrix @ vector
+            top = np.argpartition(-scores, min(limit, len(scores)) - 1)[:limit]
+            top = top[np.argsort(-scores[top])]
+            return [{"strategy_id": self._ids[i], "score": float(scores[i]), "snippet": None} for i in top]
+
+    def search(self, query: str, mode: str = "keyword", limit: int = 20) -> List[Dict[str, Any]]:
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode '{mode}'. Must be one of: {SEARCH_MODES}")
+        if mode == "keyword":
+            return self.keyword_search(query, limit)
+        if mode == "semantic":
+            return self.semantic_search(query, limit)
+
+        # Hybrid: reciprocal rank fusion of both result lists
+        fused: Dict[str, Dict[str, Any]] = {}
+        for results in (self.keyword_search(query, limit * 2), self.semantic_search(query, limit * 2)):
+            for rank, hit in enumerate(results):
+                entry = fused.setdefault(hit["strategy_id"], {**hit, "score": 0.0})
+                entry["score"] += 1.0 / (RRF_K + rank + 1)
+                entry["snippet"] = entry["snippet"] or hit["snippet"]
+        return sorted(fused.values(), key=lambda hit: hit["score"], reverse=True)[:limit]
+
+    def backfill(self, result_store, batch_size: int = 500) -> int:
+        """Index stored strategies that are missing from the index; returns how many"""
+        conn = self._connect()
+        missing = [row[0] for row in conn.execute(
+            "SELECT strategy_id FROM strategies WHERE strategy_id NOT IN (SELECT strategy_id FROM strategy_index)"
+        )]
+        for start in range(0, len(missing), batch_size):
+            for strategy_id in missing[start:start + batch_size]:
+                record = result_store.get(strategy_id)
+                self.add(strategy_id, {**record["result"], "theme": record["theme"], "idea": record["idea"]})
+            print(f"🔎 Indexed {min(start + batch_size, len(missing))}/{len(missing)} strategies")
+        embedded = self.embed_pending()
+        if embedded:
+            print(f"🧠 Embedded {embedded} strategies for semantic search")
+        return len(missing)
+
+
+def main(argv=None) -> None:
+    """Index strategies stored before the search index existed"""
+    from backend.result_store import create_result_store
+
+    parser = argparse.ArgumentParser(description="Backfill the strategy search index")
+    parser.parse_args(argv)
+    store = create_result_store()
+    start = time.time()
+    count = store.index.backfill(store)
+    print(f"✅ Backfilled {count} strategies in {time.time() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
+
+
+__all__ = ['StrategySearchIndex', 'SEARCH_MODES', 'embedding_text', 'fts_query']
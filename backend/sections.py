@@ -0,0 +1,253 @@
+# backend/sections.py
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.refinement import heading_key
+
+# Architect/pitch prompts: "## " headings with "**Field**:" lines; "###" stays inside its section
+SECTION_HEADING = re.compile(r"^#{1,2}\s+\S.*$", re.M)
+TEMPLATE_MARKER = "**OUTPUT TEMPLATE:**"
+FIELD = re.compile(r"\*\*([^*\n]+?)\*\*\s*:")
+# Research/critical prompts: a fenced block of "**HEADING:**" lines with "Field: [...]" lines
+FORMAT_MARKER = "**OUTPUT FORMAT:**"
+BOLD_HEADING = re.compile(r"^\*\*[^*\n]+?:?\*\*:?[ \t]*$", re.M)
+PLAIN_FIELD = re.compile(r"^([^\s*\[:][^:\n\[]{1,60}):", re.M)
+# Template slots such as "[Specific, quantified problem]" left in the answer; not markdown links
+PLACEHOLDER = re.compile(r"\[[^\]\n]{4,}\](?!\()")
+PARENTHETICAL = re.compile(r"\([^)\n]*\)")
+MIN_SECTION_WORDS = 25
+
+SECTION_PATTERNS = {"markdown": SECTION_HEADING, "bold": BOLD_HEADING}
+
+
+@dataclass(frozen=True)
+class TemplateSection:
+    """A required section of a task's output template and the fields it asks for"""
+    heading: str
+    fields: Tuple[str, ...]
+    template: str
+    style: str = "markdown"
+
+    @property
+    def key(self) -> str:
+        return heading_key(PARENTHETICAL.sub("", self.heading))
+
+    def matches(self, heading: str) -> bool:
+        """Generated headings often drop the emoji, add words or change the (0:00-0:25) timing; compare the words only"""
+        key = heading_key(PARENTHETICAL.sub("", heading))
+        return bool(key) and (self.key in key or key in self.key)
+
+
+@dataclass
+class SectionCheck:
+    """How one required section came out in a generated document"""
+    heading: str
+    present: bool
+    words: int = 0
+    missing_fields: List[str] = field(default_factory=list)
+    placeholders: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.present and self.words >= MIN_SECTION_WORDS and not self.missing_fields and not self.placeholders
+
+    def describe(self) -> str:
+        """Why the section failed, as prompt text"""
+        if not self.present:
+            return f"- {self.heading}: missing"
+        problems = []
+        if self.words < MIN_SECTION_WORDS:
+            problems.append(f"only {self.words} words")
+        if self.missing_fields:
+            problems.append(f"no {', '.join(self.missing_fields)}")
+        if self.placeholders:
+            problems.append(f"unfilled {', '.join(self.placeholders[:3])}")
+        return f"- {self.heading}: {'; '.join(problems) or 'ok'}"
+
+
+def section_headings(document: str, style: str = "markdown",
+                     required: Tuple[TemplateSection, ...] = ()) -> List[Tuple[int, str]]:
+    """(offset, heading line) of the section boundaries in a document.
+
+    In bold style, models also write fields as "**Major Players:**" lines, so
+    once the required sections are known only bold lines naming one of them
+    start a section, plus any "#"/"##" heading.
+    """
+    if style == "markdown" or not required:
+        return [(m.start(), m.group(0)) for m in SECTION_PATTERNS[style].finditer(document)]
+    fields = {heading_key(label) for section in required for label in section.fields}
+    headings = [(m.start(), m.group(0)) for m in BOLD_HEADING.finditer(document)
+                if heading_key(m.group(0)) not in fields and any(section.matches(m.group(0)) for section in required)]
+    headings += [(m.start(), m.group(0)) for m in SECTION_HEADING.finditer(document)]
+    return sorted(headings)
+
+
+def split_document(document: str, style: str = "markdown",
+                   required: Tuple[TemplateSection, ...] = ()) -> List[Tuple[str, str]]:
+    """(heading line, body) pairs (see section_headings); text before the first heading has heading ''"""
+    sections, starts = [], [start for start, _ in section_headings(document, style, required)]
+    if not starts or starts[0] > 0:
+        sections.append(("", document[:starts[0] if starts else len(document)].strip("\n")))
+    for start, end in zip(starts, starts[1:] + [len(document)]):
+        heading, _, body = document[start:end].partition("\n")
+        sections.append((heading.strip(), body.strip("\n")))
+    return sections
+
+
+@lru_cache(maxsize=256)
+def template_sections(prompt: str) -> Tuple[TemplateSection, ...]:
+    """Required sections of the output template in a rendered task prompt (cached per static prefix)"""
+    if TEMPLATE_MARKER in prompt:
+        template, style, fields = prompt.partition(TEMPLATE_MARKER)[2], "markdown", FIELD
+    elif FORMAT_MARKER in prompt:
+        template = prompt.partition(FORMAT_MARKER)[2].strip().strip("`")
+        template, style, fields = template.partition("```")[0], "bold", PLAIN_FIELD
+    else:
+        return ()
+    sections = []
+    for heading, body in split_document(template.strip(), style):
+        if (style == "markdown" and heading.startswith("## ")) or (style == "bold" and heading):
+            labels = tuple(dict.fromkeys(label.strip() for label in fields.findall(body)))
+            sections.append(TemplateSection(heading, labels, f"{heading}\n{body}", style))
+    return tuple(sections)
+
+
+def find_section(sections: List[Tuple[str, str]], required: TemplateSection) -> Optional[str]:
+    """Body of the document section matching a required heading"""
+    return next((body for heading, body in sections if heading and required.matches(heading)), None)
+
+
+def check_sections(document: str, required: Tuple[TemplateSection, ...]) -> List[SectionCheck]:
+    """Check a generated document against the sections its template requires"""
+    if not required:
+        return []
+    sections = split_document(document or "", required[0].style, required)
+    checks = []
+    for section in required:
+        body = find_section(sections, section)
+        if body is None:
+            checks.append(SectionCheck(section.heading, present=False, missing_fields=list(section.fields)))
+            continue
+        lowered = body.lower()
+        checks.append(SectionCheck(
+            section.heading,
+            present=True,
+            words=len(body.split()),
+            missing_fields=[label for label in section.fields if label.lower() not in lowered],
+            placeholders=PLACEHOLDER.findall(body),
+        ))
+    return checks
+
+
+def completeness(checks: List[SectionCheck]) -> float:
+    """Share of required sections that pass"""
+    return sum(check.ok for check in checks) / len(checks) if checks else 1.0
+
+
+def _join_sections(sections: List[Tuple[str, str]]) -> str:
+    return "\n\n".join(f"{heading}\n{body}" if heading else body for heading, body in sections if heading or body)
+
+
+def order_sections(document: str, required: Tuple[TemplateSection, ...]) -> str:
+    """Put required sections back in template order (added sections land at the end)"""
+    style = required[0].style if required else "markdown"
+
+    def position(item: Tuple[int, Tuple[str, str]]) -> Tuple[int, int]:
+        index, (heading, _) = item
+        if not heading or (style == "markdown" and heading.startswith("# ")):
+            return (-1, index)
+        match = next((i for i, section in enumerate(required) if section.matches(heading)), len(required))
+        return (match, index)
+
+    sections = split_document(document, style, required)
+    return _join_sections([section for _, section in sorted(enumerate(sections), key=position)])
+
+
+def replace_sections(document: str, required: Tuple[TemplateSection, ...], replacements: Dict[int, str]) -> str:
+    """New bodies for required sections (by index into `required`); missing ones are added, the rest stays verbatim"""
+    sections = split_document(document, required[0].style, required)
+    for index, body in replacements.items():
+        section = required[index]
+        position = next((i for i, (heading, _) in enumerate(sections) if heading and section.matches(heading)), None)
+        if position is None:
+            sections.append((section.heading, body))
+        else:
+            sections[position] = (sections[position][0], body)
+    return order_sections(_join_sections(sections), required)
+
+
+class SectionStreamMonitor:
+    """Watches a streamed answer and reports when every required section is complete.
+
+    Checked at line boundaries only. Generation stops once every required
+    section has started and the model then opens a section the template
+    doesn't ask for (closing remarks, "Next steps", ...); `text` is then
+    trimmed to what was asked for. A required section that is still being
+    written is never cut, however complete it already looks.
+    """
+
+    def __init__(self, required: Tuple[TemplateSection, ...]):
+        self.required = required
+        self.style = required[0].style if required else "markdown"
+        self.text = ""
+        self.done = False
+
+    def feed(self, chunk: str) -> bool:
+        if self.done:
+            return True
+        self.text += chunk
+        if not self.required or "\n" not in chunk:
+            return False
+        complete = self.text[:self.text.rfind("\n")]
+        headings = section_headings(complete, self.style, self.required)
+        matched = [next((i for i, section in enumerate(self.required) if section.matches(heading)), None)
+                   for _, heading in headings]
+        if set(range(len(self.required))) <= set(matched):
+            last = max(i for i, index in enumerate(matched) if index is not None)
+            extra = next((start for (start, _), index in zip(headings[last + 1:], matched[last + 1:])
+                          if index is None), None)
+            if extra is not None:
+                self.text, self.done = complete[:extra].rstrip(), True
+        return self.done
+
+
+@dataclass
+class StreamResult:
+    text: str
+    stopped_early: bool
+    chunks: int
+    usage: Dict[str, Any]
+
+
+def stream_sections(llm, messages, required: Tuple[TemplateSection, ...] = (),
+                    max_tokens: Optional[int] = None) -> StreamResult:
+    """Stream a completion, stopping once the model moves past the `required` sections (see SectionStreamMonitor).
+
+    Providers only report usage in the final chunk, which an early stop never
+    receives; `usage["output_tokens"]` then counts the content chunks streamed
+    (Ollama and llama.cpp send one token per chunk).
+    """
+    monitor = SectionStreamMonitor(required)
+    kwargs = {"max_tokens": max_tokens} if max_tokens else {}
+    stream, message, chunks, generated = llm.stream(messages, **kwargs), None, 0, 0
+    try:
+        for chunk in stream:
+            chunks += 1
+            generated += bool(chunk.content)
+            message = chunk if message is None else message + chunk
+            if monitor.feed(chunk.content or ""):
+                break
+    finally:
+        # Closing the stream drops the connection, which makes Ollama stop generating
+        stream.close()
+    usage = dict(getattr(message, "usage_metadata", None) or {})
+    if not usage.get("output_tokens"):
+        usage.update(input_tokens=usage.get("input_tokens", 0), output_tokens=generated, estimated=True)
+    return StreamResult(monitor.text, monitor.done, chunks, usage)
+
+
+__all__ = ['TemplateSection', 'SectionCheck', 'SectionStreamMonitor', 'StreamResult', 'template_sections',
+           'check_sections', 'completeness', 'find_section', 'order_sections', 'replace_sections', 'section_headings',
+           'split_document', 'stream_sections', 'MIN_SECTION_WORDS']
@@ -0,0 +1,100 @@
+# backend/segments.py
+import mmap
+import os
+import re
+import threading
+from typing import Dict, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+SEGMENT_PATTERN = re.compile(r"^segment-(\d{6})\.bin$")
+
+
+def _lock(handle) -> None:
+    """Exclusive lock on an open file, shared across processes (flock on POSIX, msvcrt on Windows)"""
+    if fcntl is not None:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        return
+    handle.seek(0)
+    while True:
+        try:
+            # LK_LOCK itself retries for ~10s before giving up
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+
+def _unlock(handle) -> None:
+    if fcntl is not None:
+        fcntl.flock(handle, fcntl.LOCK_UN)
+        return
+    handle.seek(0)
+    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class SegmentStore:
+    """Append-only segment files that are read back through mmap.
+
+    Writers from any process append under an exclusive file lock and get back
+    (segment, offset, length); a new segment is started once the current one
+    would exceed `max_segment_bytes`. Readers map each segment once and hand
+    out memoryview slices of the mapping, so reading a record costs no read()
+    syscall or copy of the compressed bytes.
+    """
+
+    def __init__(self, directory: str, max_segment_bytes: int = 64 * 1024 * 1024):
+        self.directory = directory
+        self.max_segment_bytes = max_segment_bytes
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._maps_lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"segment-{segment:06d}.bin")
+
+    def _latest_segment(self) -> int:
+        segments = [int(m.group(1)) for m in map(SEGMENT_PATTERN.match, os.listdir(self.directory)) if m]
+        return max(segments, default=1)
+
+    def append(self, data: bytes) -> Tuple[int, int, int]:
+        with open(os.path.join(self.directory, ".lock"), "a+") as lock:
+            _lock(lock)
+            try:
+                segment = self._latest_segment()
+                path = self._path(segment)
+                size = os.path.getsize(path) if os.path.exists(path) else 0
+                if size and size + len(data) > self.max_segment_bytes:
+                    segment, size = segment + 1, 0
+                with open(self._path(segment), "ab") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+            finally:
+                _unlock(lock)
+        return segment, size, len(data)
+
+    def read(self, segment: int, offset: int, length: int) -> memoryview:
+        with self._maps_lock:
+            mapped = self._maps.get(segment)
+            if mapped is None or offset + length > len(mapped):
+                # The segment grew since it was mapped; map it again at its current size.
+                # The old mapping stays alive as long as views into it do.
+                with open(self._path(segment), "rb") as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._maps[segment] = mapped
+        return memoryview(mapped)[offset:offset + length]
+
+    def stats(self) -> Dict[str, int]:
+        files = [name for name in os.listdir(self.directory) if SEGMENT_PATTERN.match(name)]
+        return {
+            "segments": len(files),
+            "bytes": sum(os.path.getsize(os.path.join(self.directory, name)) for name in files),
+        }
+
+
+__all__ = ['SegmentStore']
@@ -1,6 +1,26 @@
 # backend/tools.py
-from crewai_tools import SerperDevTool
+from functools import lru_cache
 
-# Initialize the tool for internet searching capabilities.
-# It will automatically use the SERPER_API_KEY from your .env file.
-search_tool = SerperDevTool(cache=True)
\ No newline at end of file
+# Serper settings per agent type; tools are built on first use, not at import
+SEARCH_TOOL_PROFILES = {
+    "default": {"cache": True},
+    "research": {},
+    # Enhanced search tool for risk analysis
+    "critical": {"n_results": 6, "country": "us", "locale": "en", "timeout": 10},
+}
+
+
+@lru_cache(maxsize=None)
+def get_search_tool(profile: str = "default"):
+    """Shared SerperDevTool for internet searching capabilities.
+
+    It will automatically use the SERPER_API_KEY from your .env file.
+    """
+    from backend.config import get_settings
+    from crewai_tools import SerperDevTool
+
+    get_settings()  # make sure .env is loaded before the tool reads SERPER_API_KEY
+    return SerperDevTool(**SEARCH_TOOL_PROFILES[profile])
+
+
+__all__ = ['get_search_tool', 'SEARCH_TOOL_PROFILES']
@@ -0,0 +1,140 @@
+# backend/warmup.py
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Any, Dict, List
+
+from backend.config import Settings
+
+
+def _post_json(url: str, payload: Dict[str, Any], headers: Dict[str, str] = None, timeout: float = 120.0) -> Dict[str, Any]:
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json", **(headers or {})},
+        method="POST"
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read().decode("utf-8"))
+
+
+class ModelWarmup:
+    """Startup warm-up for every configured model.
+
+    Sends a one-token priming completion to each model so the first real
+    request doesn't pay Ollama's model load, and pins Ollama's keep_alive so
+    the model stays resident afterwards. Talks to the model servers over
+    plain HTTP so the API process doesn't need to import litellm for this.
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self._lock = threading.Lock()
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._started_at = None
+        self._finished_at = None
+        self._stop = threading.Event()
+
+    def targets(self) -> List[str]:
+        targets = []
+        # An embedded model is loaded by each worker before it reports ready
+        if self.settings.local_backend != "embedded":
+            targets.append(f"ollama/{self.settings.ollama_model}")
+        if self.settings.groq_available:
+            targets.append(f"groq/{self.settings.groq_model}")
+        return targets
+
+    def _warm_ollama(self) -> Dict[str, Any]:
+        # Behind the gateway every replica loads the model itself, so prime each one directly
+        loads = []
+        for base_url in self.settings.ollama_replicas or (self.settings.ollama_base_url,):
+            response = _post_json(
+                f"{base_url.rstrip('/')}/api/generate",
+                {
+                    "model": self.settings.ollama_model,
+                    "prompt": "Hi",
+                    "stream": False,
+                    "keep_alive": self.settings.ollama_keep_alive,
+                    "options": {"num_predict": 1}
+                }
+            )
+            # Ollama reports durations in nanoseconds
+            loads.append(round(response.get("load_duration", 0) / 1e9, 2))
+        return {"load_seconds": max(loads), "replicas": len(loads)}
+
+    def _warm_groq(self) -> Dict[str, Any]:
+        _post_json(
+            f"{self.settings.groq_base_url.rstrip('/')}/chat/completions",
+            {
+                "model": self.settings.groq_model,
+                "messages": [{"role": "user", "content": "Hi"}],
+                "max_tokens": 1
+            },
+            headers={"Authorization": f"Bearer {self.settings.groq_api_key}"},
+            timeout=30.0
+        )
+        return {}
+
+    def _warm(self, target: str) -> Dict[str, Any]:
+        provider = target.split("/", 1)[0]
+        warmers = {"ollama": self._warm_ollama, "groq": self._warm_groq}
+        start = time.time()
+        print(f"🔥 Warming up {target}...")
+        try:
+            details = warmers[provider]()
+            result = {"status": "ready", "seconds": round(time.time() - start, 2), **details}
+            print(f"✅ {target} warm ({result['seconds']}s)")
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            result = {"status": "failed", "error": str(e)[:200], "seconds": round(time.time() - start, 2)}
+            print(f"❌ Warm-up failed for {target}: {result['error']}")
+        return result
+
+    def run(self, retry_delay: float = 15.0, max_attempts: int = 0) -> Dict[str, Dict[str, Any]]:
+        """Prime every target, retrying failures (0 = until stop()); safe to call from a background thread"""
+        self._started_at = time.time()
+        pending = self.targets()
+        attempt = 0
+
+        while pending and not self._stop.is_set():
+            attempt += 1
+            for target in pending:
+                result = self._warm(target)
+                with self._lock:
+                    self._results[target] = {**result, "attempts": attempt}
+            pending = [t for t in pending if self._results[t]["status"] != "ready"]
+            if max_attempts and attempt >= max_attempts:
+                break
+            if pending:
+                self._stop.wait(retry_delay)
+
+        self._finished_at = time.time()
+        return self.report()["models"]
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    @property
+    def is_ready(self) -> bool:
+        if not self.settings.warmup_enabled:
+            return True
+        with self._lock:
+            statuses = [self._results.get(target, {}).get("status") for target in self.targets()]
+        return all(status == "ready" for status in statuses)
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            models = dict(self._results)
+        if not self.settings.warmup_enabled:
+            phase = "disabled"
+        elif self._started_at is None:
+            phase = "pending"
+        elif self._finished_at is None:
+            phase = "retrying" if any(r["status"] == "failed" for r in models.values()) else "running"
+        else:
+            phase = "finished"
+        return {"phase": phase, "models": models}
+
+
+__all__ = ['ModelWarmup']
@@ -0,0 +1,212 @@
+# backend/worker_pool.py
+import argparse
+import asyncio
+import multiprocessing
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from backend.config import get_settings
+from backend.job_store import JobStore, LeaseLost
+from backend.result_store import ResultStore, create_result_store
+
+
+def execute_job(store: JobStore, orchestrator, worker: str, job: Dict[str, Any],
+                results: Optional[ResultStore] = None) -> None:
+    """Run one claimed job, persisting each stage and renewing the lease meanwhile.
+
+    A worker that loses the lease stops at the next stage boundary and writes
+    nothing more, so the worker that took the job over owns its result.
+    """
+    job_id = job["job_id"]
+    done, lost = threading.Event(), threading.Event()
+
+    def keep_lease():
+        while not done.wait(store.lease_seconds / 3):
+            if not store.renew_lease(job_id, worker):
+                print(f"⚠️ Lost lease on job {job_id}")
+                lost.set()
+                return
+
+    def on_stage_complete(stage: str, output: str, elapsed: float) -> None:
+        if lost.is_set() or not store.record_stage(job_id, stage, output, elapsed, worker=worker):
+            raise LeaseLost(f"Lost lease on job {job_id}")
+
+    heartbeat = threading.Thread(target=keep_lease, name=f"lease-{job_id[:8]}", daemon=True)
+    heartbeat.start()
+    try:
+        result = orchestrator.run_strategy_workflow(
+            **job["payload"],
+            completed_stages=job["completed_stages"],
+            on_stage_complete=on_stage_complete
+        )
+    except Exception as e:
+        result = {"success": False, "error": str(e), "error_type": type(e).__name__}
+    finally:
+        done.set()
+    # Renewing also re-checks ownership right before anything is written
+    if lost.is_set() or not store.renew_lease(job_id, worker):
+        print(f"⏭️ Dropping result of job {job_id}: another worker took it over")
+        return
+    if results is not None:
+        # History first: a crash in between leaves the job to be resumed, not lost
+        results.save(job_id, job["payload"], result)
+    store.complete(job_id, result, worker=worker)
+
+
+def run_worker(store: JobStore, worker: str, stop_event, ready_counter=None, poll_interval: float = 0.5) -> None:
+    """Claim and execute jobs until stop_event is set"""
+    from backend.orchestrator import AIStrategistOrchestrator
+
+    orchestrator = AIStrategistOrchestrator()
+    results = create_result_store()
+    if ready_counter is not None:
+        with ready_counter.get_lock():
+            ready_counter.value += 1
+    print(f"👷 Worker {worker} ready")
+
+    while not stop_event.is_set():
+        job = store.claim(worker)
+        if job is None:
+            stop_event.wait(poll_interval)
+            continue
+        execute_job(store, orchestrator, worker, job, results)
+
+
+def _worker_process_main(worker: str, db_path: str, lease_seconds: float, max_attempts: int,
+                         stop_event, ready_counter) -> None:
+    """Entry point of a spawned worker process: its own store connection and warmed orchestrator"""
+    store = JobStore(db_path, lease_seconds=lease_seconds, max_attempts=max_attempts)
+    run_worker(store, worker, stop_event, ready_counter)
+
+
+class OrchestratorWorkerPool:
+    """Fan strategy workflows out to N orchestrator worker processes.
+
+    The API process only writes jobs to the shared JobStore and reads their
+    state back; prompt building, crew execution and output post-processing
+    run in the workers, so they no longer contend for the API process's GIL.
+    """
+
+    def __init__(self, store: JobStore, num_workers: int):
+        self.store = store
+        self.num_workers = num_workers
+        # spawn keeps each worker free of the parent's event loop and sockets
+        self._ctx = multiprocessing.get_context("spawn")
+        self._stop_event = self._ctx.Event()
+        # Workers that finished building their orchestrator
+        self._ready_counter = self._ctx.Value("i", 0)
+        self._workers = []
+
+    def _worker_name(self, index: int) -> str:
+        return f"{os.getpid()}-{index}"
+
+    def start(self) -> None:
+        for index in range(self.num_workers):
+            process = self._ctx.Process(
+                target=_worker_process_main,
+                args=(self._worker_name(index), self.store.db_path, self.store.lease_seconds,
+                      self.store.max_attempts, self._stop_event, self._ready_counter),
+                name=f"strategist-worker-{index}",
+                daemon=True
+            )
+            process.start()
+            self._workers.append(process)
+        print(f"✅ Started {self.num_workers} orchestrator worker process(es)")
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop claiming new jobs; running jobs resume elsewhere once their lease lapses"""
+        self._stop_event.set()
+        for worker in self._workers:
+            worker.join(timeout)
+            if hasattr(worker, "terminate") and worker.is_alive():
+                worker.terminate()
+        self._workers = []
+
+    def submit(self, payload: Dict[str, Any], priority: str = "interactive", client_id: str = "anonymous",
+               completed_stages: Optional[Dict[str, str]] = None) -> str:
+        """Enqueue a workflow and return its job id"""
+        return self.store.submit(payload, priority=priority, client_id=client_id, completed_stages=completed_stages)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self.store.get(job_id)
+
+    async def wait(self, job_id: str, poll_interval: float = 0.5) -> Dict[str, Any]:
+        """Wait for a job without blocking the event loop"""
+        while True:
+            job = self.get(job_id)
+            if job is None:
+                raise KeyError(job_id)
+            if job["status"] in ("completed", "failed"):
+                return job["result"] or {"success": False, "error": job["error"] or "Job failed"}
+            await asyncio.sleep(poll_interval)
+
+    @property
+    def ready_workers(self) -> int:
+        return self._ready_counter.value
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.num_workers,
+            "ready_workers": self.ready_workers,
+            "alive_workers": sum(worker.is_alive() for worker in self._workers),
+            "jobs": self.store.stats()
+        }
+
+
+class InProcessWorkerPool(OrchestratorWorkerPool):
+    """Same interface, but the worker loop runs on a thread inside the API process.
+
+    Used when STRATEGIST_WORKERS=0 (local development, debugging).
+    """
+
+    def __init__(self, store: JobStore):
+        super().__init__(store, num_workers=0)
+        self._stop_event = threading.Event()
+
+    def start(self) -> None:
+        thread = threading.Thread(
+            target=run_worker,
+            args=(self.store, f"{os.getpid()}-inproc", self._stop_event, self._ready_counter),
+            name="strategist-inproc-worker",
+            daemon=True
+        )
+        thread.start()
+        self._workers.append(thread)
+        print("✅ Running workflows in-process (STRATEGIST_WORKERS=0)")
+
+
+def create_job_store() -> JobStore:
+    settings = get_settings()
+    return JobStore(settings.job_db_path, lease_seconds=settings.job_lease_seconds,
+                    max_attempts=settings.job_max_attempts)
+
+
+def create_worker_pool(num_workers: int, store: Optional[JobStore] = None) -> OrchestratorWorkerPool:
+    """Process pool for N > 0 workers, in-process execution for 0"""
+    store = store or create_job_store()
+    if num_workers <= 0:
+        return InProcessWorkerPool(store)
+    return OrchestratorWorkerPool(store, num_workers)
+
+
+def main(argv=None) -> None:
+    """Run a standalone worker tier that pulls from the same job database as the API"""
+    parser = argparse.ArgumentParser(description="AI Strategist orchestrator workers")
+    parser.add_argument("--workers", type=int, default=get_settings().worker_count)
+    args = parser.parse_args(argv)
+
+    pool = create_worker_pool(max(args.workers, 1))
+    pool.start()
+    try:
+        for worker in pool._workers:
+            worker.join()
+    except KeyboardInterrupt:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
+
+
+__all__ = ['OrchestratorWorkerPool', 'InProcessWorkerPool', 'create_job_store', 'create_worker_pool', 'execute_job']
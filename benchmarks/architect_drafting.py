@@ -0,0 +1,75 @@
+# benchmarks/architect_drafting.py
+"""
+Architect stage: Groq writing it directly vs local draft + Groq verification.
+
+For each sample idea the research and critical stages run once, then the
+architect stage runs in both modes on the same inputs. Reports wall time,
+completion tokens per model and section completeness (backend.sections)
+of each output, and what draft mode saved in total. Needs Ollama and Groq
+(GROQ_API_KEY) to be reachable.
+
+Usage:
+    python benchmarks/architect_drafting.py
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from research_modes import SAMPLE_IDEAS, UsageCounter  # noqa: E402
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argparse.ArgumentParser(description="Compare architect stage modes").parse_args(argv)
+
+    from backend.architect_engine import DraftArchitectEngine
+    from backend.orchestrator import AIStrategistOrchestrator
+    from backend.prompt_templates import architect_templates, duration_bucket
+    from backend.sections import check_sections, completeness, template_sections
+
+    orchestrator = AIStrategistOrchestrator()
+    if orchestrator.groq_llm is orchestrator.llm:
+        print("❌ GROQ_API_KEY is required to compare against the direct (Groq) mode")
+        return 1
+    local, groq = UsageCounter(), UsageCounter()
+    orchestrator.llm.callbacks = list(orchestrator.llm.callbacks or []) + [local]
+    orchestrator.groq_llm.callbacks = list(orchestrator.groq_llm.callbacks or []) + [groq]
+    engines = {"direct": None, "draft": DraftArchitectEngine(orchestrator.llm, orchestrator.groq_llm)}
+
+    totals: Dict[str, Dict[str, float]] = {mode: {"seconds": 0.0, "groq": 0, "local": 0} for mode in engines}
+    for item in SAMPLE_IDEAS:
+        args = (item["idea"], item["team_strength"], item["hackathon_duration"])
+        research = orchestrator.run_research_stage(item["theme"], *args)
+        critical = orchestrator.run_critical_stage(item["idea"], research, *args[1:])
+        required = template_sections(
+            architect_templates(item["team_strength"], duration_bucket(item["hackathon_duration"]))["description"].prefix
+        )
+        print(f"💡 {item['idea'][:45]}")
+        for mode, engine in engines.items():
+            orchestrator.architect_engine = engine
+            local.reset()
+            groq.reset()
+            start = time.time()
+            output = orchestrator.run_architect_stage(item["idea"], research, critical, *args[1:])
+            row: Dict[str, Any] = {"seconds": time.time() - start, "groq": groq.completion_tokens,
+                                   "local": local.completion_tokens}
+            for key in totals[mode]:
+                totals[mode][key] += row[key]
+            score = completeness(check_sections(output, required))
+            print(f"   {mode:6s} {row['seconds']:6.1f}s  groq {row['groq']:5d} + local {row['local']:5d} "
+                  f"completion tokens  completeness {score:.0%}")
+
+    direct, draft = totals["direct"], totals["draft"]
+    print(f"📊 draft mode: {direct['seconds'] - draft['seconds']:+.1f}s saved, "
+          f"{direct['groq'] - draft['groq']:+d} Groq completion tokens saved "
+          f"({draft['local']} local tokens spent drafting)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
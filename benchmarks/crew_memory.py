@@ -0,0 +1,85 @@
+# benchmarks/crew_memory.py
+"""
+Per-run cost of CrewAI memory for the research stage.
+
+Runs the (agent-mode) research stage for the sample ideas under three setups:
+    off      - memory disabled (the default)
+    per-run  - a fresh memory store for every kickoff, which is what memory=True
+               on a brand-new single-task crew amounts to
+    shared   - one persistent store reused by every kickoff (STRATEGIST_CREW_MEMORY=shared)
+and reports wall time and LLM round trips per run. Needs Ollama with the
+embedding model pulled (see STRATEGIST_MEMORY_EMBEDDER) and Serper.
+
+Usage:
+    python benchmarks/crew_memory.py --repeat 2
+"""
+
+import argparse
+import dataclasses
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from research_modes import SAMPLE_IDEAS, UsageCounter  # noqa: E402
+
+MODES = ["off", "per-run", "shared"]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure CrewAI memory overhead per research run")
+    parser.add_argument("--modes", nargs="+", default=MODES, choices=MODES)
+    parser.add_argument("--repeat", type=int, default=1, help="Passes over the sample ideas per mode")
+    args = parser.parse_args(argv)
+
+    from backend.config import get_settings
+    from backend.memory import build_crew_memory
+    from backend.orchestrator import AIStrategistOrchestrator
+
+    settings = get_settings()
+    orchestrator = AIStrategistOrchestrator()
+    orchestrator.research_engine = None  # memory only matters for the agent loop
+    counter = UsageCounter()
+    orchestrator.llm.callbacks = list(orchestrator.llm.callbacks or []) + [counter]
+
+    with tempfile.TemporaryDirectory(prefix="crew_memory_") as scratch:
+        memory_settings = dataclasses.replace(settings, crew_memory="shared")
+        summary = {}
+        for mode in args.modes:
+            if mode == "off":
+                orchestrator.crew_memory = build_crew_memory(dataclasses.replace(settings, crew_memory="off"))
+            elif mode == "shared":
+                orchestrator.crew_memory = build_crew_memory(memory_settings, os.path.join(scratch, "shared"))
+
+            seconds, calls = [], []
+            for run in range(args.repeat):
+                for i, item in enumerate(SAMPLE_IDEAS):
+                    if mode == "per-run":
+                        run_dir = os.path.join(scratch, f"run_{run}_{i}")
+                        orchestrator.crew_memory = build_crew_memory(memory_settings, run_dir)
+                    counter.reset()
+                    start = time.time()
+                    orchestrator.run_research_stage(
+                        item["theme"], item["idea"], item["team_strength"], item["hackathon_duration"]
+                    )
+                    seconds.append(time.time() - start)
+                    calls.append(counter.calls)
+            summary[mode] = (statistics.mean(seconds), statistics.mean(calls))
+            print(f"⏱️ {mode:8s} {summary[mode][0]:6.1f}s/run  {summary[mode][1]:4.1f} LLM calls/run")
+
+    if "off" in summary:
+        base_seconds, base_calls = summary["off"]
+        for mode, (mode_seconds, mode_calls) in summary.items():
+            if mode != "off":
+                print(f"📊 {mode} costs {mode_seconds - base_seconds:+.1f}s and "
+                      f"{mode_calls - base_calls:+.1f} LLM calls per run vs memory off")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
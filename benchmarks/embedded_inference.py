@@ -0,0 +1,142 @@
+# benchmarks/embedded_inference.py
+"""
+Local stages: in-process llama.cpp (STRATEGIST_LOCAL_BACKEND=embedded) vs Ollama.
+
+Spawns --workers processes the way the worker pool does; each one sets up
+the backend and runs --requests chat completions through litellm, the same
+path the orchestrator uses. Reports generated tokens/s (per worker and
+aggregate) and memory: RSS and PSS of every worker, plus the Ollama server
+processes for the Ollama backend. With embedded weights mmap'd, RSS counts
+the whole model in each worker while PSS splits the shared pages between
+them, so PSS x workers is the real footprint. Linux only for the memory
+columns (/proc/<pid>/smaps_rollup).
+
+Usage:
+    python benchmarks/embedded_inference.py --model-path data/models/gemma-2b-it.Q4_K_M.gguf
+    python benchmarks/embedded_inference.py --workers 4 --backends embedded
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from inference_gateway import PROMPTS  # noqa: E402
+
+
+def memory_mb(pid: str = "self") -> Dict[str, Optional[float]]:
+    """RSS and PSS of a process in MB (None where /proc doesn't have them)"""
+    values = {"rss": None, "pss": None}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as handle:
+            for line in handle:
+                key, _, rest = line.partition(":")
+                if key in ("Rss", "Pss"):
+                    values[key.lower()] = int(rest.split()[0]) / 1024
+    except OSError:
+        pass
+    return values
+
+
+def ollama_server_memory() -> Dict[str, float]:
+    """Summed memory of the ollama processes on this host (server and model runners)"""
+    total = {"rss": 0.0, "pss": 0.0}
+    for pid in filter(str.isdigit, os.listdir("/proc") if os.path.isdir("/proc") else []):
+        try:
+            with open(f"/proc/{pid}/comm") as handle:
+                if "ollama" not in handle.read():
+                    continue
+        except OSError:
+            continue
+        for key, value in memory_mb(pid).items():
+            total[key] += value or 0.0
+    return total
+
+
+def worker(backend: str, args: argparse.Namespace, index: int, start_barrier, results) -> None:
+    import litellm
+
+    if backend == "embedded":
+        from backend.embedded_llm import default_threads, register_embedded_model
+        model = register_embedded_model(args.model_path, n_ctx=args.context,
+                                        n_threads=args.threads or default_threads(args.workers))
+        extra = {}
+    else:
+        model, extra = f"ollama/{args.ollama_model}", {"api_base": args.ollama_url}
+    litellm.completion(model=model, messages=[{"role": "user", "content": "Hi"}], max_tokens=1, **extra)
+
+    start_barrier.wait()
+    tokens, start = 0, time.perf_counter()
+    for i in range(args.requests):
+        response = litellm.completion(
+            model=model,
+            messages=[{"role": "user", "content": PROMPTS[(index + i) % len(PROMPTS)]}],
+            max_tokens=args.max_tokens, temperature=0.0, **extra
+        )
+        tokens += response.usage.completion_tokens
+    seconds = time.perf_counter() - start
+    results.put({"index": index, "tokens": tokens, "seconds": seconds, **memory_mb()})
+
+
+def run_backend(backend: str, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    context = multiprocessing.get_context("spawn")
+    barrier, results = context.Barrier(args.workers), context.Queue()
+    processes = [context.Process(target=worker, args=(backend, args, i, barrier, results))
+                 for i in range(args.workers)]
+    for process in processes:
+        process.start()
+    rows = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return sorted(rows, key=lambda row: row["index"])
+
+
+def fmt(value: Optional[float]) -> str:
+    return f"{value:8.0f}" if value is not None else "       -"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from backend.config import get_settings
+
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Embedded llama.cpp vs Ollama for the local stages")
+    parser.add_argument("--backends", default="embedded,ollama")
+    parser.add_argument("--workers", type=int, default=max(settings.worker_count, 1))
+    parser.add_argument("--requests", type=int, default=4, help="Completions per worker")
+    parser.add_argument("--max-tokens", type=int, default=128)
+    parser.add_argument("--model-path", default=settings.embedded_model_path)
+    parser.add_argument("--threads", type=int, default=settings.embedded_threads)
+    parser.add_argument("--context", type=int, default=settings.embedded_context)
+    parser.add_argument("--ollama-url", default=settings.ollama_base_url)
+    parser.add_argument("--ollama-model", default=settings.ollama_model)
+    args = parser.parse_args(argv)
+
+    for backend in args.backends.split(","):
+        start = time.perf_counter()
+        rows = run_backend(backend.strip(), args)
+        wall = time.perf_counter() - start
+        total_tokens = sum(row["tokens"] for row in rows)
+        slowest = max(row["seconds"] for row in rows)
+        print(f"⏱️ {backend}: {args.workers} workers x {args.requests} completions "
+              f"({wall:.1f}s including model load)")
+        print("   worker  tokens/s   RSS MB   PSS MB")
+        for row in rows:
+            print(f"   {row['index']:6d} {row['tokens'] / max(row['seconds'], 1e-9):9.1f} "
+                  f"{fmt(row['rss'])} {fmt(row['pss'])}")
+        pss = [row["pss"] for row in rows if row["pss"] is not None]
+        print(f"   aggregate {total_tokens / max(slowest, 1e-9):.1f} tokens/s"
+              + (f", workers' PSS total {sum(pss):.0f} MB" if pss else ""))
+        if backend.strip() == "ollama":
+            server = ollama_server_memory()
+            if server["rss"]:
+                print(f"   ollama server RSS {server['rss']:.0f} MB, PSS {server['pss']:.0f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+# benchmarks/import_time.py
+"""
+Import-time regression check for the API entry point.
+
+Runs `python -X importtime -c "import backend.api"` in a fresh interpreter,
+reports the slowest modules and fails when the total exceeds the budget or
+when a heavy dependency that should load lazily shows up at import time.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --module backend.orchestrator --budget-ms 300
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Must only be imported on first use (when a workflow actually runs)
+LAZY_MODULES = ["crewai", "crewai_tools", "langchain_community", "litellm", "uvicorn"]
+
+DEFAULT_BUDGET_MS = 1500.0
+
+
+def measure(module: str) -> List[Tuple[str, int, int, int]]:
+    """(module, depth, self_us, cumulative_us) for every import, in import order"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        # -X importtime indents nested imports by two spaces per level after one leading space
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return entries
+
+
+def summarize(entries: List[Tuple[str, int, int, int]], module: str) -> Dict[str, object]:
+    # Depth 0 are the interpreter's own imports plus `module`; a module's imports are listed just before it
+    top_level = [i for i, (_, depth, _, _) in enumerate(entries) if depth == 0]
+    end = next((i for i in top_level if entries[i][0] == module), None)
+    if end is None:
+        total_us, children = sum(entries[i][3] for i in top_level), [entries[i] for i in top_level]
+    else:
+        start = max([i for i in top_level if i < end], default=-1) + 1
+        total_us, children = entries[end][3], [entry for entry in entries[start:end] if entry[1] == 1]
+    # The root package name is what we budget against
+    loaded_roots = {name.split(".")[0] for name, _, _, _ in entries}
+    return {
+        "total_ms": total_us / 1000,
+        "slowest": sorted(((name, cumulative) for name, _, _, cumulative in children),
+                          key=lambda item: item[1], reverse=True)[:10],
+        "eager_heavy_modules": [m for m in LAZY_MODULES if m in loaded_roots],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Import-time budget check")
+    parser.add_argument("--module", default="backend.api")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=3, help="Take the best of N cold interpreters")
+    args = parser.parse_args(argv)
+
+    best = None
+    for _ in range(args.runs):
+        summary = summarize(measure(args.module), args.module)
+        if best is None or summary["total_ms"] < best["total_ms"]:
+            best = summary
+
+    print(f"⏱️ import {args.module}: {best['total_ms']:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    for name, cumulative_us in best["slowest"]:
+        print(f"   {cumulative_us / 1000:8.1f} ms  {name}")
+
+    failed = False
+    if best["eager_heavy_modules"]:
+        print(f"❌ Heavy modules imported eagerly: {best['eager_heavy_modules']}")
+        failed = True
+    if best["total_ms"] > args.budget_ms:
+        print(f"❌ Import time over budget by {best['total_ms'] - args.budget_ms:.0f} ms")
+        failed = True
+    if not failed:
+        print("✅ Within budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
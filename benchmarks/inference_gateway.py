@@ -0,0 +1,96 @@
+# benchmarks/inference_gateway.py
+"""
+Concurrent local completions: one Ollama server vs the inference gateway.
+
+Fires --requests short chat completions at --concurrency and reports
+throughput and latency percentiles. Point --url at a single Ollama server,
+then at the gateway (python -m backend.inference_gateway --spawn N), to see
+how far replicas scale on this machine; with a gateway URL the per-replica
+utilization from /gateway/stats is printed as well.
+
+Usage:
+    python benchmarks/inference_gateway.py --url http://127.0.0.1:11434
+    python benchmarks/inference_gateway.py --url http://127.0.0.1:8080 --concurrency 8
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+PROMPTS = [
+    "List three risks of building a symptom checker in 24 hours.",
+    "Name two competitors of a carbon footprint tracker for small businesses.",
+    "Suggest a tech stack for a peer tutoring marketplace MVP.",
+    "Write a one-sentence pitch hook for an offline language learning app.",
+]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def complete(url: str, model: str, prompt: str, max_tokens: int) -> float:
+    request = urllib.request.Request(
+        f"{url.rstrip('/')}/api/chat",
+        data=json.dumps({
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "stream": False,
+            "options": {"num_predict": max_tokens},
+        }).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    start = time.perf_counter()
+    with urllib.request.urlopen(request, timeout=600) as response:
+        response.read()
+    return time.perf_counter() - start
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from backend.config import get_settings
+
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Local inference throughput benchmark")
+    parser.add_argument("--url", default=settings.ollama_base_url)
+    parser.add_argument("--model", default=settings.ollama_model)
+    parser.add_argument("--requests", type=int, default=16)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--max-tokens", type=int, default=64)
+    args = parser.parse_args(argv)
+
+    complete(args.url, args.model, "Hi", 1)  # load the model first
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.concurrency) as executor:
+        latencies = list(executor.map(
+            lambda i: complete(args.url, args.model, PROMPTS[i % len(PROMPTS)], args.max_tokens),
+            range(args.requests)
+        ))
+    wall = time.perf_counter() - start
+    print(f"⏱️ {args.requests} completions at concurrency {args.concurrency} against {args.url}")
+    print(f"   throughput {args.requests / wall:.2f} req/s   "
+          f"p50 {statistics.median(latencies):.1f}s   p95 {percentile(latencies, 0.95):.1f}s")
+
+    try:
+        with urllib.request.urlopen(f"{args.url.rstrip('/')}/gateway/stats", timeout=5) as response:
+            stats = json.loads(response.read())
+    except (urllib.error.URLError, ValueError):
+        return 0  # a plain Ollama server, not the gateway
+    for replica in stats.get("replicas", []):
+        print(f"   {replica['url']:28s} {replica['requests']:4d} req  "
+              f"utilization {replica['utilization']:.0%}  mean concurrency {replica['mean_concurrency']:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
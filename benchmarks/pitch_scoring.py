@@ -0,0 +1,115 @@
+# benchmarks/pitch_scoring.py
+"""
+Pitch scoring: PitchValidation one pitch at a time vs BatchPitchScorer.
+
+Scores --count pitches three ways and reports pitches/s:
+  - validate: validate_pitch_structure + get_pitch_quality_score per pitch
+    (the six structure columns only)
+  - single:   BatchPitchScorer.score([pitch]) per pitch (all columns)
+  - batch:    BatchPitchScorer.score(pitches) once (all columns)
+and checks that the batch structure columns equal the per-pitch results.
+Pitches come from --input (JSONL with a "pitch" field, e.g. exported
+strategies) or are synthesized from the pitch template.
+
+Usage:
+    python benchmarks/pitch_scoring.py --count 5000
+    python benchmarks/pitch_scoring.py --input pitches.jsonl
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+SENTENCES = [
+    "Every day, thousands of small clinics turn patients away because triage takes too long.",
+    "Imagine a nurse getting a ranked list of urgent cases before the waiting room fills up.",
+    "We built a lightweight model that runs on a ten dollar phone.",
+    "Watch as I type three symptoms and the dashboard updates in real time.",
+    "Our API wraps a fine-tuned classifier behind a single endpoint.",
+    "The architecture is a FastAPI service, a Postgres store and a React front end.",
+    "Judges always ask how this differs from existing apps, so here is the answer.",
+    "If the live demo fails, we switch to the recorded walkthrough immediately.",
+    "This is the future of community healthcare, and it starts with one clinic.",
+    "Teams usually over-build the admin panel, so we cut it on day one.",
+    "Let me show you the moment a clinician sees the highest risk patient first.",
+    "Our vision is a network of clinics sharing anonymised insights.",
+]
+HEADINGS = ["🎯 HOOK", "💡 SOLUTION", "🚀 LIVE DEMO", "🛠️ CREDIBILITY", "🏆 CLOSE", "🔧 BACKUP PLAN", "📋 Q&A PREP"]
+
+
+def synthesize(count: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    pitches = []
+    for _ in range(count):
+        lines, second = ["# 3-Minute Pitch Script"], 0
+        for heading in HEADINGS:
+            if rng.random() < 0.15:
+                continue
+            if second < 180 and heading not in ("🔧 BACKUP PLAN", "📋 Q&A PREP"):
+                length = rng.choice([20, 25, 30, 35, 45, 60, 75])
+                end = min(second + length, 180)
+                lines.append(f"## {heading} ({second // 60}:{second % 60:02d}-{end // 60}:{end % 60:02d})")
+                second = end
+            else:
+                lines.append(f"## {heading}")
+            lines.append(" ".join(rng.choice(SENTENCES) for _ in range(rng.randint(3, 9))))
+        pitches.append("\n\n".join(lines))
+    return pitches
+
+
+def load(path: str) -> List[str]:
+    with open(path, encoding="utf-8") as handle:
+        return [json.loads(line).get("pitch", "") for line in handle if line.strip()]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Batch pitch scoring benchmark")
+    parser.add_argument("--input", help="JSONL file with a 'pitch' field per line")
+    parser.add_argument("--count", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    from backend.agents.pitch_agent import PitchValidation
+    from backend.pitch_scoring import BatchPitchScorer
+
+    pitches = load(args.input) if args.input else synthesize(args.count)
+    scorer = BatchPitchScorer()
+    print(f"🎤 {len(pitches)} pitches, keyword matching via {scorer.automaton.backend}")
+
+    start = time.perf_counter()
+    reference = []
+    for pitch in pitches:
+        checks = PitchValidation.validate_pitch_structure(pitch)
+        reference.append([*checks.values(), PitchValidation.get_pitch_quality_score(checks)])
+    timings = {"validate": time.perf_counter() - start}
+
+    start = time.perf_counter()
+    for pitch in pitches:
+        scorer.score([pitch])
+    timings["single"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scores = scorer.score(pitches)
+    timings["batch"] = time.perf_counter() - start
+
+    structure = scores.matrix[:, :len(reference[0])] if pitches else scores.matrix
+    mismatches = sum(row.tolist() != [float(value) for value in expected]
+                     for row, expected in zip(structure, reference))
+    for label, seconds in timings.items():
+        print(f"   {label:9s} {seconds:7.3f}s  {len(pitches) / max(seconds, 1e-9):10.0f} pitches/s")
+    print(f"   structure columns match validate_pitch_structure: {'yes' if not mismatches else f'{mismatches} rows differ'}")
+    means = scores.matrix.mean(axis=0) if pitches else []
+    for name, value in zip(scores.columns, means):
+        if name in ("quality_score", "word_count", "sections_found", "timing_coverage", "formula_fit"):
+            print(f"   mean {name:16s} {value:.2f}")
+    return 0 if not mismatches else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+# benchmarks/prefix_sharing.py
+"""
+Shared-prefix analysis for recorded LLM requests.
+
+Record prompts by running workflows with STRATEGIST_PROMPT_LOG=data/prompts.jsonl,
+then measure how much of each request repeats a prefix of an earlier one (the
+part a KV/prompt cache can skip). With --ollama the recorded requests are also
+replayed against Ollama twice: once with an unrelated request in between each
+one (no cache reuse) and once back to back, and Ollama's own prompt_eval
+counters show the prefill time saved by reusing the cached prefix.
+
+Usage:
+    python benchmarks/prefix_sharing.py --log data/prompts.jsonl
+    python benchmarks/prefix_sharing.py --log data/prompts.jsonl --ollama --stage research --limit 20
+    python benchmarks/prefix_sharing.py --synthetic
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import urllib.request
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+# LangChain message types -> chat roles
+ROLES = {"system": "system", "human": "user", "ai": "assistant"}
+
+# Rough chars-per-token ratio, only used to present lengths in tokens
+CHARS_PER_TOKEN = 4
+
+
+def load_prompt_log(path: str) -> List[Dict[str, Any]]:
+    """Records written by backend.prompt_log.PromptRecorder"""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def flatten(record: Dict[str, Any]) -> str:
+    return "".join(f"<{m['role']}>{m['content']}" for m in record["messages"])
+
+
+def shared_prefix_lengths(records: List[Dict[str, Any]]) -> List[int]:
+    """For each request, the longest prefix it shares with any earlier request"""
+    seen: List[str] = []
+    lengths = []
+    for record in records:
+        text = flatten(record)
+        lengths.append(max((len(os.path.commonprefix([text, prev])) for prev in seen), default=0))
+        seen.append(text)
+    return lengths
+
+
+def prefix_report(records: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    by_stage = defaultdict(list)
+    for record, shared in zip(records, shared_prefix_lengths(records)):
+        by_stage[record.get("stage") or "unknown"].append((len(flatten(record)), shared))
+
+    report = {}
+    for stage, rows in by_stage.items():
+        total = sum(length for length, _ in rows)
+        shared = sum(s for _, s in rows)
+        report[stage] = {
+            "requests": len(rows),
+            "mean_prompt_tokens": statistics.mean(length for length, _ in rows) / CHARS_PER_TOKEN,
+            "mean_shared_tokens": statistics.mean(s for _, s in rows) / CHARS_PER_TOKEN,
+            "shared_ratio": shared / total if total else 0.0,
+        }
+    return report
+
+
+def synthetic_records() -> List[Dict[str, Any]]:
+    """Task descriptions for every team and a few ideas/durations, straight from the templates"""
+    from backend.models import VALID_STRENGTHS
+    from backend.prompt_templates import (
+        architect_templates, critical_templates, duration_bucket, pitch_templates, research_templates
+    )
+
+    ideas = [
+        ("Healthcare", "AI symptom checker for rural clinics"),
+        ("Climate", "Carbon footprint tracker for small businesses"),
+        ("Education", "Peer tutoring marketplace for university students"),
+    ]
+    records = []
+    for team in VALID_STRENGTHS:
+        for duration in (12, 24, 36):
+            for theme, idea in ideas:
+                rendered = {
+                    "research": research_templates(team)["description"].render(
+                        theme=theme, idea=idea, hackathon_duration=duration),
+                    "critical": critical_templates(team)["description"].render(
+                        idea=idea, hackathon_duration=duration, feature_hours=duration // 4,
+                        research_report=f"Research notes for {idea}"),
+                    "architect": architect_templates(team, duration_bucket(duration))["description"].render(
+                        idea=idea, hackathon_duration=duration,
+                        research_result=f"Research notes for {idea}", critical_result=f"Risks for {idea}"),
+                    "pitch": pitch_templates(team)["description"].render(
+                        theme=theme, hackathon_duration=duration, mvp_plan=f"MVP plan for {idea}"),
+                }
+                for stage, content in rendered.items():
+                    records.append({"stage": stage, "messages": [{"role": "human", "content": content}]})
+    return records
+
+
+def _ollama_chat(base_url: str, model: str, messages: List[Dict[str, str]], keep_alive: str) -> Dict[str, Any]:
+    request = urllib.request.Request(
+        f"{base_url.rstrip('/')}/api/chat",
+        data=json.dumps({
+            "model": model,
+            "messages": messages,
+            "stream": False,
+            "keep_alive": keep_alive,
+            "options": {"num_predict": 1},
+        }).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST"
+    )
+    with urllib.request.urlopen(request, timeout=600) as response:
+        return json.loads(response.read().decode("utf-8"))
+
+
+def replay_on_ollama(records: List[Dict[str, Any]], base_url: str, model: str, keep_alive: str) -> Dict[str, Dict[str, float]]:
+    """Prefill tokens/time without and with KV cache reuse between consecutive requests"""
+    chats = [
+        [{"role": ROLES.get(m["role"], "user"), "content": m["content"]} for m in record["messages"]]
+        for record in records
+    ]
+    results = {}
+    for mode in ("cold", "warm"):
+        evaluated, seconds = 0, 0.0
+        for i, messages in enumerate(chats):
+            if mode == "cold":
+                # Overwrites the cached context so the next request shares nothing with it
+                _ollama_chat(base_url, model, [{"role": "user", "content": f"Say OK ({i})"}], keep_alive)
+            response = _ollama_chat(base_url, model, messages, keep_alive)
+            # Ollama only counts and times the prompt tokens it actually had to evaluate
+            evaluated += response.get("prompt_eval_count", 0)
+            seconds += response.get("prompt_eval_duration", 0) / 1e9
+        results[mode] = {"prompt_tokens_evaluated": evaluated, "prefill_seconds": seconds}
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Shared-prefix analysis for recorded prompts")
+    parser.add_argument("--log", default=os.getenv("STRATEGIST_PROMPT_LOG", "data/prompts.jsonl"))
+    parser.add_argument("--synthetic", action="store_true", help="Use template renders instead of a prompt log")
+    parser.add_argument("--stage", help="Only analyse requests from this stage")
+    parser.add_argument("--limit", type=int, default=0, help="Only the first N requests (0 = all)")
+    parser.add_argument("--ollama", action="store_true", help="Replay on Ollama and report prefill savings")
+    args = parser.parse_args(argv)
+
+    records = synthetic_records() if args.synthetic else load_prompt_log(args.log)
+    if args.stage:
+        records = [r for r in records if r.get("stage") == args.stage]
+    if args.limit:
+        records = records[:args.limit]
+    if not records:
+        print("❌ No recorded requests to analyse")
+        return 1
+
+    print(f"📊 Shared prefix across {len(records)} requests (~{CHARS_PER_TOKEN} chars/token)")
+    for stage, row in sorted(prefix_report(records).items()):
+        print(f"   {stage:10s} n={row['requests']:4d}  prompt≈{row['mean_prompt_tokens']:7.0f} tok  "
+              f"shared≈{row['mean_shared_tokens']:7.0f} tok  ({row['shared_ratio']:.0%})")
+
+    if args.ollama:
+        from backend.config import get_settings
+
+        settings = get_settings()
+        print(f"🔁 Replaying on {settings.ollama_base_url} ({settings.ollama_model})...")
+        results = replay_on_ollama(records, settings.ollama_base_url, settings.ollama_model, settings.ollama_keep_alive)
+        cold, warm = results["cold"], results["warm"]
+        for mode, row in results.items():
+            print(f"   {mode}: {row['prompt_tokens_evaluated']} prompt tokens evaluated, "
+                  f"{row['prefill_seconds']:.2f}s prefill")
+        if cold["prefill_seconds"]:
+            saved = 1 - warm["prefill_seconds"] / cold["prefill_seconds"]
+            print(f"✅ KV cache reuse saves {cold['prefill_seconds'] - warm['prefill_seconds']:.2f}s "
+                  f"of prefill ({saved:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
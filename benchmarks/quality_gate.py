@@ -0,0 +1,91 @@
+# benchmarks/quality_gate.py
+"""
+Quality gate: repairing weak sections vs re-running the whole stage.
+
+For each sample idea the workflow stages run once with the gate disabled.
+Every output is graded (backend.quality_gate); for each one below the
+threshold the benchmark times a targeted section repair and a full re-run
+of that stage, and reports seconds, completion tokens and the score each
+reached. Needs Ollama and Groq (GROQ_API_KEY) to be reachable.
+
+Usage:
+    python benchmarks/quality_gate.py
+    python benchmarks/quality_gate.py --threshold 0.9
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from research_modes import SAMPLE_IDEAS, UsageCounter  # noqa: E402
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare section repair against full stage re-runs")
+    parser.add_argument("--threshold", type=float, default=0.75)
+    args = parser.parse_args(argv)
+
+    from backend.orchestrator import AIStrategistOrchestrator
+    from backend.quality_gate import grade_stage
+
+    orchestrator = AIStrategistOrchestrator()
+    counter = UsageCounter()
+    for llm in {id(orchestrator.llm): orchestrator.llm, id(orchestrator.groq_llm): orchestrator.groq_llm}.values():
+        llm.callbacks = list(llm.callbacks or []) + [counter]
+
+    totals: Dict[str, Dict[str, float]] = {mode: {"seconds": 0.0, "tokens": 0, "gain": 0.0}
+                                           for mode in ("repair", "rerun")}
+    graded = 0
+    for item in SAMPLE_IDEAS:
+        idea, team, duration = item["idea"], item["team_strength"], item["hackathon_duration"]
+        orchestrator.quality_threshold = 0
+        outputs = {}
+        reruns = {
+            "research": lambda: orchestrator.run_research_stage(item["theme"], idea, team, duration),
+            "critical_analysis": lambda: orchestrator.run_critical_stage(idea, outputs["research"], team, duration),
+            "mvp_plan": lambda: orchestrator.run_architect_stage(idea, outputs["research"],
+                                                                 outputs["critical_analysis"], team, duration),
+            "pitch": lambda: orchestrator.run_pitch_stage(item["theme"], idea, outputs["mvp_plan"], team, duration),
+        }
+        print(f"💡 {idea[:45]}")
+        for stage, run in reruns.items():
+            outputs[stage] = run()
+            score = grade_stage(stage, outputs[stage], team, duration).score
+            graded += 1
+            if score >= args.threshold:
+                print(f"   {stage:17s} score {score:.2f}  passes")
+                continue
+            orchestrator.quality_threshold = args.threshold
+            results = {}
+            for mode in totals:
+                counter.reset()
+                start = time.time()
+                if mode == "repair":
+                    output, _ = orchestrator.quality_gate(stage, outputs[stage], item["theme"], idea, team,
+                                                           duration, outputs)
+                else:
+                    output = run()
+                new_score = grade_stage(stage, output, team, duration).score
+                results[mode] = (time.time() - start, counter.completion_tokens, new_score)
+                totals[mode]["seconds"] += results[mode][0]
+                totals[mode]["tokens"] += results[mode][1]
+                totals[mode]["gain"] += new_score - score
+            orchestrator.quality_threshold = 0
+            print(f"   {stage:17s} score {score:.2f}  " + "  ".join(
+                f"{mode} {seconds:5.1f}s {tokens:5d} tok -> {new_score:.2f}"
+                for mode, (seconds, tokens, new_score) in results.items()))
+
+    repair, rerun = totals["repair"], totals["rerun"]
+    print(f"📊 {graded} stage outputs graded; repairs: {rerun['seconds'] - repair['seconds']:+.1f}s and "
+          f"{rerun['tokens'] - repair['tokens']:+d} completion tokens saved vs re-runs, "
+          f"score gain {repair['gain']:+.2f} (re-runs {rerun['gain']:+.2f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
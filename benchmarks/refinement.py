@@ -0,0 +1,86 @@
+# benchmarks/refinement.py
+"""
+Refinement mode vs a full rerun after a small edit to the idea.
+
+For each sample idea: runs the full workflow once, edits the idea (one
+sentence appended), then produces the revised strategy both ways - a
+full rerun of the four stages and refinement mode, where each stage
+edits its previous output - and reports wall time, LLM round trips and
+prompt/completion tokens of each. Needs the configured models (Ollama,
+Groq, Serper) to be reachable.
+
+Usage:
+    python benchmarks/refinement.py
+    python benchmarks/refinement.py --edit "It must work offline on cheap Android phones."
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from research_modes import SAMPLE_IDEAS, UsageCounter  # noqa: E402
+
+DEFAULT_EDIT = "It must also work offline on low-end Android phones."
+
+
+def measure(counter: UsageCounter, run) -> Dict[str, Any]:
+    counter.reset()
+    start = time.time()
+    result = run()
+    return {
+        "seconds": time.time() - start,
+        "llm_calls": counter.calls,
+        "prompt_tokens": counter.prompt_tokens,
+        "completion_tokens": counter.completion_tokens,
+        "success": result.get("success"),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare refinement mode with a full rerun")
+    parser.add_argument("--edit", default=DEFAULT_EDIT, help="Sentence appended to each idea")
+    args = parser.parse_args(argv)
+
+    from backend.models import STAGES
+    from backend.orchestrator import AIStrategistOrchestrator
+    from backend.refinement import diff_ideas
+
+    orchestrator = AIStrategistOrchestrator()
+    counter = UsageCounter()
+    for llm in {id(orchestrator.llm): orchestrator.llm, id(orchestrator.groq_llm): orchestrator.groq_llm}.values():
+        llm.callbacks = list(llm.callbacks or []) + [counter]
+
+    totals = {"full": [], "refine": []}
+    for item in SAMPLE_IDEAS:
+        base = orchestrator.run_strategy_workflow(**item)
+        if not base.get("success"):
+            print(f"❌ Base run failed for {item['idea']}: {base.get('error')}")
+            continue
+        edited = {**item, "idea": f"{item['idea']}. {args.edit}"}
+        delta = diff_ideas(item["idea"], edited["idea"])
+        refinement = {"previous_outputs": {stage: base[stage] for stage in STAGES}, "delta": delta.to_dict()}
+
+        full = measure(counter, lambda: orchestrator.run_strategy_workflow(**edited))
+        refine = measure(counter, lambda: orchestrator.run_strategy_workflow(**edited, refinement=refinement))
+        totals["full"].append(full)
+        totals["refine"].append(refine)
+        print(f"💡 {item['idea'][:45]}")
+        for label, row in (("full", full), ("refine", refine)):
+            print(f"   {label:7s} {row['seconds']:6.1f}s  {row['llm_calls']:3d} calls  "
+                  f"{row['prompt_tokens']:6d} prompt + {row['completion_tokens']:5d} completion tokens")
+
+    if totals["full"]:
+        for key in ("seconds", "completion_tokens", "prompt_tokens"):
+            full_sum = sum(row[key] for row in totals["full"])
+            refine_sum = sum(row[key] for row in totals["refine"])
+            print(f"📊 {key}: refinement uses {refine_sum / max(full_sum, 1):.0%} of a full rerun")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
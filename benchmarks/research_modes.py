@@ -0,0 +1,138 @@
+# benchmarks/research_modes.py
+"""
+Research stage: CrewAI agent loop vs retrieval + single synthesis completion.
+
+Runs the research stage for each sample idea in both modes against the
+configured models (Ollama + Serper must be reachable) and reports wall time,
+number of LLM round trips and token usage per mode.
+
+Usage:
+    python benchmarks/research_modes.py
+    python benchmarks/research_modes.py --input ideas.csv --limit 5 --modes retrieval
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from langchain_core.callbacks import BaseCallbackHandler  # noqa: E402
+
+SAMPLE_IDEAS = [
+    {"theme": "Healthcare", "idea": "AI symptom checker for rural clinics", "team_strength": "AI/ML", "hackathon_duration": 24},
+    {"theme": "Climate", "idea": "Carbon footprint tracker for small businesses", "team_strength": "Full-Stack", "hackathon_duration": 24},
+    {"theme": "Education", "idea": "Peer tutoring marketplace for university students", "team_strength": "Frontend", "hackathon_duration": 12},
+]
+
+
+class UsageCounter(BaseCallbackHandler):
+    """Counts LLM round trips and completion tokens.
+
+    Streamed calls don't fill in llm_output["token_usage"], and one stopped
+    early never ends at all, so their tokens are counted as they arrive
+    (one per streamed chunk) and topped up to the provider's count if it
+    reports one.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self._streamed: Dict[Any, int] = {}
+
+    def on_llm_new_token(self, token: str, *, run_id=None, **kwargs: Any) -> None:
+        if run_id not in self._streamed:
+            self.calls += 1
+            self._streamed[run_id] = 0
+        if token:
+            self._streamed[run_id] += 1
+            self.completion_tokens += 1
+
+    def on_llm_end(self, response, *, run_id=None, **kwargs: Any) -> None:
+        streamed = self._streamed.pop(run_id, None)
+        if streamed is None:
+            self.calls += 1
+        usage = (response.llm_output or {}).get("token_usage") or {}
+        self.prompt_tokens += usage.get("prompt_tokens", 0)
+        self.completion_tokens += max(usage.get("completion_tokens", 0) - (streamed or 0), 0)
+
+
+def run_mode(orchestrator, mode: str, ideas: List[Dict[str, Any]], counter: UsageCounter,
+             serper_api_key: Optional[str]) -> List[Dict[str, float]]:
+    from backend.research_engine import RetrievalResearchEngine
+
+    orchestrator.research_engine = (
+        RetrievalResearchEngine(orchestrator.llm, serper_api_key) if mode == "retrieval" else None
+    )
+    rows = []
+    for item in ideas:
+        counter.reset()
+        start = time.time()
+        output = orchestrator.run_research_stage(
+            item["theme"], item["idea"], item["team_strength"], int(item["hackathon_duration"])
+        )
+        rows.append({
+            "seconds": time.time() - start,
+            "llm_calls": counter.calls,
+            "prompt_tokens": counter.prompt_tokens,
+            "completion_tokens": counter.completion_tokens,
+            "output_chars": len(output or ""),
+        })
+        print(f"   {mode:9s} {item['idea'][:40]:40s} {rows[-1]['seconds']:6.1f}s  "
+              f"{counter.calls} calls  {counter.prompt_tokens}+{counter.completion_tokens} tok")
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare research stage engines")
+    parser.add_argument("--input", help="CSV/JSONL of ideas (same format as main.py); defaults to built-in samples")
+    parser.add_argument("--limit", type=int, default=0)
+    parser.add_argument("--modes", nargs="+", default=["agent", "retrieval"], choices=["agent", "retrieval"])
+    args = parser.parse_args(argv)
+
+    from backend.config import get_settings
+    from backend.orchestrator import AIStrategistOrchestrator
+
+    ideas = SAMPLE_IDEAS
+    if args.input:
+        from main import load_ideas
+        ideas = load_ideas(args.input)
+    if args.limit:
+        ideas = ideas[:args.limit]
+
+    settings = get_settings()
+    if "retrieval" in args.modes and not settings.serper_api_key:
+        print("❌ SERPER_API_KEY is required for retrieval mode")
+        return 1
+
+    orchestrator = AIStrategistOrchestrator()
+    counter = UsageCounter()
+    orchestrator.llm.callbacks = list(orchestrator.llm.callbacks or []) + [counter]
+
+    summary = {}
+    for mode in args.modes:
+        print(f"⏱️ Research mode: {mode}")
+        rows = run_mode(orchestrator, mode, ideas, counter, settings.serper_api_key)
+        summary[mode] = {key: statistics.mean(row[key] for row in rows) for key in rows[0]}
+
+    print("\n📊 Mean per research stage")
+    for mode, row in summary.items():
+        print(f"   {mode:9s} {row['seconds']:6.1f}s  {row['llm_calls']:4.1f} calls  "
+              f"{row['prompt_tokens']:7.0f} prompt tok  {row['completion_tokens']:6.0f} completion tok  "
+              f"{row['output_chars']:6.0f} chars")
+    if {"agent", "retrieval"} <= summary.keys() and summary["retrieval"]["seconds"]:
+        print(f"✅ Retrieval mode is {summary['agent']['seconds'] / summary['retrieval']['seconds']:.1f}x "
+              f"faster than the agent loop")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+# benchmarks/result_storage.py
+"""
+Compression ratio and read throughput of the strategy result store.
+
+Generates N synthetic workflow responses that follow the real output layout
+(each stage's OUTPUT TEMPLATE sections and fields for a valid team strength
+and duration, filled with varied text), then:
+  1. compares zlib, zstd and zstd with a trained dictionary on compression
+     ratio and compress/decompress MB/s over the raw bodies;
+  2. stores the corpus with SQLiteResultStore inline (BLOB) and with
+     mmap-backed segment files and times random get() calls on each.
+
+Usage:
+    python benchmarks/result_storage.py --docs 5000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from backend.models import STAGES, VALID_STRENGTHS  # noqa: E402
+from backend.quality_gate import required_sections  # noqa: E402
+from backend.result_store import SQLiteResultStore, make_codec  # noqa: E402
+
+WORDS = ("api model dashboard realtime react fastapi postgres redis streamlit demo judge pitch market "
+         "competitor latency mobile offline sensor vision speech chatbot recommendation analytics privacy "
+         "payment map voice ocr notification schedule volunteer clinic farmer student users data team "
+         "build feature integration deploy prototype risk scope hours backend frontend").split()
+THEMES = ["Healthcare", "Education", "Climate", "Fintech", "Accessibility", "Agriculture"]
+
+
+def fake_strategy(rng: random.Random, i: int) -> Dict:
+    text = lambda words: " ".join(rng.choices(WORDS, k=words))  # noqa: E731
+    team, duration = rng.choice(VALID_STRENGTHS), rng.choice([12, 24, 36, 48])
+    result = {
+        "success": True,
+        "theme": rng.choice(THEMES),
+        "original_idea": text(20),
+        "team_strength": team,
+        "hackathon_duration": duration,
+        "timestamp": time.time() - i,
+        "execution_time": rng.uniform(30, 240),
+        "stage_timings": {stage: rng.uniform(5, 60) for stage in STAGES},
+        "run_config": {"research": "ollama/gemma:2b", "pitch": "groq/llama3-8b-8192", "research_mode": "agent"},
+    }
+    for stage in STAGES:
+        sections = []
+        for section in required_sections(stage, team, duration):
+            label = "**{}**: " if section.style == "markdown" else "{}: "
+            lines = [label.format(field) + text(rng.randint(8, 30)) for field in section.fields]
+            lines += [f"- {text(rng.randint(8, 30))}" for _ in range(rng.randint(1, 4))]
+            sections.append("\n".join([section.heading] + lines))
+        result[stage] = "\n\n".join(sections)
+    return result
+
+
+def throughput(fn, items: List, total_bytes: int) -> float:
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return total_bytes / 1e6 / (time.perf_counter() - start)
+
+
+def compare_codecs(bodies: List[bytes]) -> None:
+    raw = sum(len(body) for body in bodies)
+    zstd = make_codec("zstd")
+    setups = [("zlib", make_codec("zlib"), None), ("zstd", zstd, None)]
+    if zstd.name == "zstd":
+        import zstandard
+
+        # Train on the first 20% and measure on everything, like the store does
+        trained = zstandard.train_dictionary(112 * 1024, bodies[:max(10, len(bodies) // 5)])
+        setups.append(("zstd+dict", zstd, zstd.load_dictionary(trained.as_bytes())))
+
+    print(f"🗜️ {len(bodies)} bodies, {raw / 1e6:.1f} MB raw, {raw / len(bodies) / 1024:.1f} KB average")
+    for label, codec, dictionary in setups:
+        compressed = [codec.compress(body, dictionary) for body in bodies]
+        stored = sum(len(blob) for blob in compressed)
+        compress_mbs = throughput(lambda body: codec.compress(body, dictionary), bodies, raw)
+        decompress_mbs = throughput(lambda blob: codec.decompress(blob, dictionary), compressed, raw)
+        print(f"   {label:10s} ratio {raw / stored:5.2f}x   "
+              f"compress {compress_mbs:7.1f} MB/s   decompress {decompress_mbs:7.1f} MB/s")
+
+
+def compare_reads(results: List[Dict], scratch: str, reads: int) -> None:
+    rng = random.Random(1)
+    for label, segment_dir in (("inline BLOB", None), ("mmap segments", os.path.join(scratch, "segments"))):
+        store = SQLiteResultStore(os.path.join(scratch, f"{label.split()[0]}.db"), segment_dir=segment_dir,
+                                  dictionary_threshold=min(200, len(results) // 5))
+        for i, result in enumerate(results):
+            store.save(f"s{i}", {"theme": result["theme"], "idea": result["original_idea"],
+                                 "team_strength": result["team_strength"],
+                                 "hackathon_duration": result["hackathon_duration"]}, result)
+        ids = [f"s{rng.randrange(len(results))}" for _ in range(reads)]
+        store.get(ids[0])
+        start = time.perf_counter()
+        for strategy_id in ids:
+            store.get(strategy_id)
+        elapsed = time.perf_counter() - start
+        print(f"   {label:14s} {reads / elapsed:8.0f} get()/s   {elapsed / reads * 1e6:6.0f} µs/get")
+        for codec, stats in store.storage_stats().items():
+            print(f"   {'':14s} {codec:10s} {stats['strategies']:6d} stored at {stats['ratio']:.2f}x")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Strategy storage compression and read benchmark")
+    parser.add_argument("--docs", type=int, default=5000)
+    parser.add_argument("--reads", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(7)
+    results = [fake_strategy(rng, i) for i in range(args.docs)]
+    compare_codecs([json.dumps(result).encode("utf-8") for result in results])
+    with tempfile.TemporaryDirectory(prefix="storage_bench_") as scratch:
+        print(f"📖 {args.reads} random get() calls:")
+        compare_reads(results, scratch, args.reads)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+# benchmarks/search_latency.py
+"""
+Query latency of the strategy search index at scale.
+
+Fills a scratch database with N synthetic strategies (FTS rows plus random
+unit-length embeddings, so no model is needed to build it), then times
+keyword (FTS5) queries and nearest-neighbour lookups over the embedding
+matrix. With --encode the sentence-transformers query encoding time is
+measured as well.
+
+Usage:
+    python benchmarks/search_latency.py --docs 100000
+    python benchmarks/search_latency.py --docs 100000 --encode
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from backend.search_index import FTS_COLUMNS, StrategySearchIndex  # noqa: E402
+
+WORDS = ("api model dashboard realtime react fastapi postgres redis streamlit demo judge pitch market "
+         "competitor latency mobile offline sensor vision speech chatbot recommendation analytics privacy "
+         "payment map voice ocr blockchain notification schedule volunteer clinic farmer student").split()
+KEYWORDS = ["Whisper", "Supabase", "LangChain", "Twilio", "Mapbox"]
+# Rare tool names, mixed and common terms
+QUERIES = ["whisper", "supabase", "twilio notification", "realtime dashboard", "api"]
+EMBEDDING_DIM = 384  # all-MiniLM-L6-v2
+VOCABULARY_SIZE = 5000
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def make_vocabulary(rng: random.Random) -> List[str]:
+    """Domain words first, then pronounceable filler words; sampled with Zipf weights like real text"""
+    syllables = ["ka", "lo", "mi", "ter", "sun", "da", "vel", "ro", "pin", "ex", "qua", "zo", "ni", "bra"]
+    filler = {"".join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+              for _ in range(VOCABULARY_SIZE * 2)}
+    return WORDS + sorted(filler)[:VOCABULARY_SIZE - len(WORDS)]
+
+
+def fake_text(rng: random.Random, vocabulary: List[str], weights: List[float], words: int) -> str:
+    text = rng.choices(vocabulary, cum_weights=weights, k=words)
+    if rng.random() < 0.05:
+        text.insert(rng.randrange(len(text)), rng.choice(KEYWORDS))
+    return " ".join(text)
+
+
+def build(index: StrategySearchIndex, docs: int, seed: int = 7) -> None:
+    import numpy as np
+
+    rng = random.Random(seed)
+    np_rng = np.random.default_rng(seed)
+    vocabulary = make_vocabulary(rng)
+    weights = list(np.cumsum(1.0 / np.arange(1, len(vocabulary) + 1)))
+    rng.shuffle(vocabulary)
+    text = lambda words: fake_text(rng, vocabulary, weights, words)  # noqa: E731
+    conn = index._connect()
+    conn.execute("BEGIN")
+    for start in range(0, docs, 5000):
+        count = min(5000, docs - start)
+        conn.executemany(
+            f"INSERT INTO strategies_fts (strategy_id, {', '.join(FTS_COLUMNS)}) "
+            f"VALUES (?, {', '.join('?' for _ in FTS_COLUMNS)})",
+            [[f"doc{start + i}", text(2), text(12), text(150), text(120), text(200), text(120)]
+             for i in range(count)]
+        )
+        vectors = np_rng.standard_normal((count, EMBEDDING_DIM)).astype("float32")
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        conn.executemany(
+            "INSERT INTO strategy_embeddings (strategy_id, model, vector) VALUES (?, ?, ?)",
+            [(f"doc{start + i}", index.embedding_model, vectors[i].tobytes()) for i in range(count)]
+        )
+    conn.execute("COMMIT")
+
+
+def time_ms(fn, repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(label: str, samples: List[float]) -> None:
+    print(f"   {label:22s} p50 {statistics.median(samples):7.2f} ms   p95 {percentile(samples, 0.95):7.2f} ms")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import numpy as np
+
+    parser = argparse.ArgumentParser(description="Strategy search latency benchmark")
+    parser.add_argument("--docs", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--encode", action="store_true", help="Also time query encoding with the real model")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="search_bench_") as scratch:
+        index = StrategySearchIndex(os.path.join(scratch, "strategies.db"))
+        start = time.time()
+        build(index, args.docs)
+        print(f"🏗️ Built index with {args.docs} strategies in {time.time() - start:.1f}s "
+              f"({os.path.getsize(index.db_path) / 1e6:.0f} MB)")
+
+        start = time.time()
+        index._refresh_matrix()
+        print(f"📥 Loaded embedding matrix in {(time.time() - start) * 1000:.0f} ms")
+
+        print(f"⏱️ {args.repeat} queries each, top {args.limit}:")
+        for query in QUERIES:
+            hits = len(index.keyword_search(query, args.limit))
+            report(f"keyword '{query}'", time_ms(lambda: index.keyword_search(query, args.limit), args.repeat))
+            print(f"   {'':22s} {hits} hits")
+
+        rng = np.random.default_rng(0)
+        probe = rng.standard_normal(EMBEDDING_DIM).astype("float32")
+        probe /= np.linalg.norm(probe)
+        report("semantic (matrix top-k)", time_ms(lambda: index.nearest(probe, args.limit), args.repeat))
+
+        if args.encode:
+            if not index.semantic_enabled:
+                print("❌ sentence-transformers not available")
+                return 1
+            index.encode(["warm up"])
+            report("query encoding", time_ms(lambda: index.encode([QUERIES[0]]), args.repeat))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
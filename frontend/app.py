@@ -1,10 +1,22 @@
 import streamlit as st
 import requests
+import hashlib
 import json
 import time
+from datetime import datetime
 
-# FIXED: Updated endpoint to match your FastAPI backend
-FASTAPI_URL = "http://127.0.0.1:8000/generate-strategy"
+from components.api_client import (API_URL, APIError, get_job, get_strategy, list_strategies, refine_strategy,
+                                   regenerate_stage, submit_job)
+
+STAGES = ["research", "critical_analysis", "mvp_plan", "pitch"]
+AGENTS = {
+    "research": ("🔍 Research Agent", "📊 Market Research"),
+    "critical_analysis": ("🎯 Critical Agent", "⚠️ Risk Analysis"),
+    "mvp_plan": ("🏗️ Solution Architect", "🏗️ MVP Plan"),
+    "pitch": ("📢 Pitch Agent", "🎯 Pitch Deck"),
+}
+POLL_SECONDS = 2.0
+HISTORY_PAGE_SIZE = 10
 
 st.set_page_config(
     page_title="The AI Strategist",
@@ -117,6 +129,54 @@ with col2:
 # Debug toggle (optional - can be removed in production)
 show_debug = st.sidebar.checkbox("Show Debug Info", value=True)  # Default to True for troubleshooting
 
+# Job state survives reruns; the script never waits on the workflow itself.
+# `results` holds every finished strategy of this session keyed by input hash.
+for key, default in {"job_id": None, "job_inputs": None, "job_status": None,
+                     "stages": {}, "result": None, "job_error": None,
+                     "results": {}, "history_pages": 1}.items():
+    st.session_state.setdefault(key, default)
+
+def input_key(payload):
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+def show_strategy(strategy_id, inputs, stages, result):
+    """Display a finished strategy without contacting the backend; failed runs show their error"""
+    failed = not result.get("success")
+    st.session_state.update(job_id=strategy_id, job_inputs=inputs, job_status="failed" if failed else "completed",
+                            stages=dict(stages), result=result,
+                            job_error=(result.get("error") or "Unknown error") if failed else None)
+
+# Stored strategies never change, so they're cached for the life of the server process
+@st.cache_data(show_spinner=False, max_entries=100)
+def load_strategy(strategy_id):
+    return get_strategy(strategy_id)
+
+@st.cache_data(show_spinner=False, ttl=30)
+def load_history(page):
+    return list_strategies(limit=HISTORY_PAGE_SIZE, offset=page * HISTORY_PAGE_SIZE)
+
+reuse_results = st.sidebar.checkbox("Reuse results for identical inputs", value=True)
+
+# History is only fetched once the user opens it
+st.sidebar.markdown("---")
+if st.sidebar.toggle("🕘 Strategy History"):
+    try:
+        pages = [load_history(page) for page in range(st.session_state.history_pages)]
+        for item in [item for page in pages for item in page["items"]]:
+            created = datetime.fromtimestamp(item["created_at"]).strftime("%b %d %H:%M")
+            label = f"{'✅' if item['success'] else '❌'} {item['theme']} · {item['team_strength']} · {created}"
+            if st.sidebar.button(label, key=f"history_{item['strategy_id']}", help=item["idea"]):
+                record = load_strategy(item["strategy_id"])
+                inputs = {key: record[key] for key in ("theme", "idea", "team_strength", "hackathon_duration")}
+                result = record["result"]
+                show_strategy(record["strategy_id"], inputs,
+                              {stage: result[stage] for stage in STAGES if result.get(stage) is not None}, result)
+        if pages[-1].get("next_offset") is not None and st.sidebar.button("Load more"):
+            st.session_state.history_pages += 1
+            st.rerun()
+    except (APIError, requests.exceptions.RequestException) as e:
+        st.sidebar.warning(f"History unavailable: {e}")
+
 # Generate Strategy Button
 if st.button("🎯 Generate Personalized Strategy", type="primary"):
     # MODIFICATION: Updated payload structure to include hackathon_duration
@@ -126,148 +186,72 @@ if st.button("🎯 Generate Personalized Strategy", type="primary"):
         "team_strength": team_strength,
         "hackathon_duration": hackathon_duration # <-- NEW FIELD
     }
+    cached = st.session_state.results.get(input_key(payload)) if reuse_results else None
+    if cached:
+        show_strategy(cached["strategy_id"], payload, cached["stages"], cached["result"])
+        st.toast("♻️ Same inputs as an earlier run, showing its result")
+    else:
+        try:
+            job = submit_job(payload)
+            st.session_state.update(job_id=job["job_id"], job_inputs=payload, job_status=job["status"],
+                                    stages={}, result=None, job_error=None)
+            if job.get("estimated_wait_seconds"):
+                st.toast(f"⏳ Queued, estimated wait {job['estimated_wait_seconds']:.0f}s")
+        except APIError as e:
+            if e.status_code == 429:
+                st.warning(f"🚦 The strategist is busy: {e.detail}. Please try again shortly.")
+            else:
+                st.error(f"❌ Backend error (Status {e.status_code}): {e.detail}")
+        except requests.exceptions.ConnectionError:
+            st.error("❌ Connection failed. Please start your FastAPI server:")
+            st.code("python backend/api.py", language="bash")
 
-    st.markdown("---")
-    
-    # Progress tracking
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    
-    # Agent workflow visualization
-    agents = [
-        ("🔍 Research Agent", "Analyzing market and competitors..."),
-        ("🎯 Critical Agent", "Identifying risks and challenges..."),
-        ("🏗️ Solution Architect", f"Designing MVP for {team_strength} team..."),
-        ("📢 Pitch Agent", "Creating compelling presentation...")
-    ]
-    
-    agent_containers = []
-    for i, (agent_name, description) in enumerate(agents):
-        container = st.empty()
-        agent_containers.append(container)
-    
-    try:
-        # Show workflow progress
-        for i, (agent_name, description) in enumerate(agents):
-            progress_bar.progress((i) / len(agents))
-            status_text.text(f"Step {i+1}/4: {description}")
-            
-            agent_containers[i].markdown(f"""
-                <div class="agent-step">
-                    <strong>{agent_name}</strong><br>
-                    <em>{description}</em>
-                </div>
-            """, unsafe_allow_html=True)
-            
-            time.sleep(0.5)  # Visual delay
-        
-        progress_bar.progress(1.0)
-        status_text.text("🚀 Sending request to AI Strategist...")
-        
-        # Send request to FastAPI backend
-        response = requests.post(FASTAPI_URL, json=payload, timeout=600)
-        
-        if response.status_code == 200:
-            data = response.json()
-            
-            # Debug info display
-            if show_debug:
-                st.markdown('<div class="debug-info">', unsafe_allow_html=True)
-                st.subheader("🔍 Debug Information")
-                st.write("**Response Keys:**", list(data.keys()) if isinstance(data, dict) else "Not a dict")
-                st.write("**Success Status:**", data.get("success", "Key not found"))
-                
-                # Check what pitch-related keys exist
-                pitch_keys = [key for key in data.keys() if 'pitch' in key.lower()]
-                st.write("**Pitch-related Keys:**", pitch_keys)
-                
-                # Show lengths of all text outputs
-                text_outputs = {}
-                for key in ['research', 'critical_analysis', 'mvp_plan', 'pitch', 'pitch_strategy']:
-                    if key in data:
-                        text_outputs[key] = len(str(data[key])) if data[key] else 0
-                st.write("**Output Lengths:**", text_outputs)
-                st.markdown('</div>', unsafe_allow_html=True)
-            
-            if data.get("success"):
-                progress_bar.progress(1.0)
-                status_text.text("✅ Strategy generated successfully!")
-                
-                # Display results in organized sections
-                st.markdown("---")
-                st.markdown('<div class="success-box"><h2>🎉 Your Personalized Strategy is Ready!</h2></div>', unsafe_allow_html=True)
-                
-                # FIXED: Check for both possible pitch keys and use the correct one
-                pitch_content = data.get("pitch_strategy") or data.get("pitch") or "No pitch content available"
-                
-                # Create tabs for different outputs
-                tab1, tab2, tab3, tab4 = st.tabs(["📊 Market Research", "⚠️ Risk Analysis", "🏗️ MVP Plan", "🎯 Pitch Deck"])
-                
-                with tab1:
-                    st.subheader("Market Research")
-                    research_content = data.get("research", "No research data available")
-                    if research_content and len(research_content.strip()) > 10:
-                        st.markdown(research_content)
-                    else:
-                        st.warning("Research content appears to be empty or very short.")
-                        if show_debug:
-                            st.code(f"Raw content: {repr(research_content)}")
-                
-                with tab2:
-                    st.subheader("Critical Risk Analysis")
-                    critical_content = data.get("critical_analysis", "No critical analysis available")
-                    if critical_content and len(critical_content.strip()) > 10:
-                        st.markdown(critical_content)
-                    else:
-                        st.warning("Critical analysis content appears to be empty or very short.")
-                        if show_debug:
-                            st.code(f"Raw content: {repr(critical_content)}")
-                
-                with tab3:
-                    st.subheader(f"MVP Plan (Optimized for {team_strength} Team)")
-                    mvp_content = data.get("mvp_plan", "No MVP plan available")
-                    if mvp_content and len(mvp_content.strip()) > 10:
-                        st.markdown(mvp_content)
-                    else:
-                        st.warning("MVP plan content appears to be empty or very short.")
-                        if show_debug:
-                            st.code(f"Raw content: {repr(mvp_content)}")
-                
-                with tab4:
-                    st.subheader("Pitch Presentation")
-                    # FIXED: Use the correct pitch content
-                    if pitch_content and len(str(pitch_content).strip()) > 10:
-                        st.markdown(str(pitch_content))
-                    else:
-                        st.error("⚠️ Pitch agent produced empty content. This is a backend extraction issue.")
-                        
-                        # Provide a fallback pitch template based on available data
-                        st.info("📝 **Generating Fallback Pitch Strategy:**")
-                        
-                        fallback_pitch = f"""
-## 🎯 Pitch Strategy for {team_strength} Team
+# Same setup, edited idea: offer to adapt the strategy on screen instead of starting over
+shown = st.session_state.job_inputs if st.session_state.job_status == "completed" else None
+if (shown and raw_idea.strip() != shown["idea"].strip()
+        and (hackathon_theme, team_strength, hackathon_duration) == (shown["theme"], shown["team_strength"], shown["hackathon_duration"])):
+    if st.button("✏️ Refine Current Strategy with the Edited Idea",
+                 help="Each agent edits its previous output for what changed instead of starting from scratch"):
+        try:
+            job = refine_strategy(st.session_state.job_id, raw_idea)
+            st.session_state.update(job_id=job["job_id"], job_inputs={**shown, "idea": raw_idea},
+                                    job_status=job["status"], stages={}, result=None, job_error=None)
+            delta = job.get("idea_delta") or {}
+            st.toast(f"✏️ Idea similarity {delta.get('similarity', 0):.0%}: "
+                     f"{len(delta.get('added', []))} added, {len(delta.get('reworded', []))} reworded, "
+                     f"{len(delta.get('removed', []))} dropped")
+        except APIError as e:
+            st.error(f"❌ Could not refine: {e.detail}")
+        except requests.exceptions.RequestException:
+            st.error(f"❌ Connection to {API_URL} failed")
+
+def fallback_pitch(inputs):
+    """Template pitch shown when the pitch agent returned nothing usable"""
+    strength = inputs["team_strength"]
+    return f"""
+## 🎯 Pitch Strategy for {strength} Team
 
 ### The Problem
-Based on the theme "{hackathon_theme}", there's a clear need for innovative solutions.
+Based on the theme "{inputs['theme']}", there's a clear need for innovative solutions.
 
 ### Our Solution
-**{raw_idea}**
+**{inputs['idea']}**
 
-### Why Our {team_strength} Team Will Win
+### Why Our {strength} Team Will Win
 
-**Team Advantage:** {strength_info[team_strength]}
+**Team Advantage:** {strength_info[strength]}
 
 ### 3-Minute Demo Structure
 1. **Hook (30s):** Start with the core problem demonstration
-2. **Solution (90s):** Live demo of key features showcasing {team_strength.lower()} expertise  
+2. **Solution (90s):** Live demo of key features showcasing {strength.lower()} expertise  
 3. **Impact (45s):** Market potential and next steps
 4. **Q&A (15s):** Handle technical questions
 
 ### Key Talking Points
-- Emphasize technical execution quality (your {team_strength.lower()} strength)
+- Emphasize technical execution quality (your {strength.lower()} strength)
 - Show measurable impact/metrics if possible
 - Demonstrate scalability and market fit
-- Address feasibility within {hackathon_duration} hours
+- Address feasibility within {inputs['hackathon_duration']} hours
 
 ### Presentation Tips
 - Start with a compelling story/problem statement
@@ -276,109 +260,167 @@ Based on the theme "{hackathon_theme}", there's a clear need for innovative solu
 - Prepare for technical deep-dive questions
 - End with clear next steps and vision
 
-*Note: This is a fallback strategy. The AI pitch agent needs debugging in the backend.*
+*Note: This is a fallback strategy. The AI pitch agent returned empty content.*
 """
-                        
-                        st.markdown(fallback_pitch)
-                        
-                        if show_debug:
-                            st.markdown("---")
-                            st.subheader("🔧 Debug Information")
-                            st.code(f"Raw pitch content: {repr(pitch_content)}")
-                            st.code(f"Available keys: {list(data.keys())}")
-                            # Show all keys containing 'pitch'
-                            pitch_debug = {k: v for k, v in data.items() if 'pitch' in k.lower()}
-                            st.json(pitch_debug)
-                            
-                            st.warning("""
-                            **Backend Issue Identified:**
-                            - Pitch agent runs successfully (no errors)
-                            - But `extract_clean_output()` returns empty string for pitch agent
-                            - Likely issue: Pitch agent result structure differs from other agents
-                            - Check orchestrator logs for pitch agent extraction methods
-                            """)
-                        
-                        # Update pitch_content for download to use fallback
-                        pitch_content = fallback_pitch
-                
-                # Show execution summary
-                if data.get("summary"):
-                    st.markdown("---")
-                    st.subheader("📈 Execution Summary")
-                    summary = data["summary"]
-                    
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Feasibility", summary.get("feasibility", "Unknown"))
-                    with col2:
-                        st.metric("Execution Time", summary.get("execution_time", "Unknown"))
-                    with col3:
-                        st.metric("LLM Used", "Groq + Ollama" if summary.get("groq_used") else "Ollama Only")
-                    
-                    st.info(f"**Competitive Edge:** {summary.get('competitive_edge', 'Unknown')}")
-                
-                # Download option
-                if st.button("📥 Download Complete Strategy"):
-                    strategy_text = f"""
+
+def poll_job():
+    """One short GET /jobs/{id}, asking only for stage outputs not yet received"""
+    state = st.session_state
+    missing = [stage for stage in STAGES if stage not in state.stages]
+    # fields= can't ask for "none"; with every stage in hand the last one is the cheapest repeat
+    job = get_job(state.job_id, fields=missing or STAGES[-1:])
+    state.stages.update(job.get("stages") or {})
+    state.job_status = job["status"]
+    if job["status"] == "completed":
+        state.result = job["result"] or {}
+        state.stages.update({stage: state.result[stage] for stage in STAGES if state.result.get(stage)})
+        if state.result.get("success"):
+            state.results[input_key(state.job_inputs)] = {
+                "strategy_id": state.job_id, "stages": dict(state.stages), "result": state.result
+            }
+    elif job["status"] == "failed":
+        state.job_error = job.get("error") or (job.get("result") or {}).get("error") or "Unknown error"
+
+def render_stage(stage, content):
+    inputs = st.session_state.job_inputs
+    titles = {
+        "research": "Market Research",
+        "critical_analysis": "Critical Risk Analysis",
+        "mvp_plan": f"MVP Plan (Optimized for {inputs['team_strength']} Team)",
+        "pitch": "Pitch Presentation",
+    }
+    st.subheader(titles[stage])
+    if content is None:
+        agent, _ = AGENTS[stage]
+        st.info(f"⏳ {agent} is working..." if st.session_state.job_status == "running" else "⏳ Queued...")
+    elif len(content.strip()) > 10:
+        st.markdown(content)
+    elif stage == "pitch":
+        st.error("⚠️ Pitch agent produced empty content.")
+        st.markdown(fallback_pitch(inputs))
+    else:
+        st.warning(f"{titles[stage]} content appears to be empty or very short.")
+        if show_debug:
+            st.code(f"Raw content: {repr(content)}")
+
+def start_regeneration(stage):
+    """Queue a rerun of `stage` and its dependents; upstream tabs keep their content meanwhile"""
+    state = st.session_state
+    try:
+        job = regenerate_stage(state.job_id, stage)
+    except APIError as e:
+        st.error(f"❌ Could not regenerate: {e.detail}")
+        return
+    except requests.exceptions.RequestException:
+        st.error(f"❌ Connection to {API_URL} failed")
+        return
+    kept = {name: state.stages[name] for name in STAGES[:STAGES.index(stage)] if name in state.stages}
+    state.update(job_id=job["job_id"], job_status=job["status"], stages=kept, result=None, job_error=None)
+    st.rerun()
+
+def strategy_markdown(inputs, stages, result):
+    summary = result.get("summary", {})
+    pitch = stages.get("pitch") or ""
+    return f"""
 # AI Strategist Output
 
-**Theme:** {hackathon_theme}
-**Idea:** {raw_idea}
-**Team Strength:** {team_strength}
-**Hackathon Duration:** {hackathon_duration} hours
+**Theme:** {inputs["theme"]}
+**Idea:** {inputs["idea"]}
+**Team Strength:** {inputs["team_strength"]}
+**Hackathon Duration:** {inputs["hackathon_duration"]} hours
 
 ## Market Research
-{data.get("research", "N/A")}
+{stages.get("research", "N/A")}
 
 ## Risk Analysis  
-{data.get("critical_analysis", "N/A")}
+{stages.get("critical_analysis", "N/A")}
 
 ## MVP Plan
-{data.get("mvp_plan", "N/A")}
+{stages.get("mvp_plan", "N/A")}
 
 ## Pitch Strategy
-{pitch_content}
+{pitch if len(pitch.strip()) > 10 else fallback_pitch(inputs)}
 
 ## Execution Summary
-- **Feasibility:** {data.get("summary", {}).get("feasibility", "Unknown")}
-- **Competitive Edge:** {data.get("summary", {}).get("competitive_edge", "Unknown")}
-- **Execution Time:** {data.get("summary", {}).get("execution_time", "Unknown")}
-- **LLM Configuration:** {data.get("llm_config", {})}
+- **Feasibility:** {summary.get("feasibility", "Unknown")}
+- **Competitive Edge:** {summary.get("competitive_edge", "Unknown")}
+- **Execution Time:** {summary.get("execution_time", "Unknown")}
+- **LLM Configuration:** {result.get("llm_config", {})}
 """
-                    st.download_button(
-                        label="Download Strategy.md",
-                        data=strategy_text,
-                        file_name=f"ai_strategist_{team_strength}_{int(time.time())}.md",
-                        mime="text/markdown"
-                    )
-                    
-            else:
-                st.error(f"❌ Strategy generation failed: {data.get('error', 'Unknown error')}")
-                if show_debug:
-                    st.code(str(data))
-                    
-        else:
-            st.error(f"❌ Backend error (Status {response.status_code})")
-            if show_debug:
-                try:
-                    error_data = response.json()
-                    st.code(str(error_data))
-                except:
-                    st.code(response.text)
-            st.error("Make sure FastAPI server is running on http://127.0.0.1:8000")
-
-    except requests.exceptions.ConnectionError:
-        st.error("❌ Connection failed. Please start your FastAPI server:")
-        st.code("python backend/api.py", language="bash")
-        
-    except requests.exceptions.Timeout:
-        st.error("⏱️ Request timed out. The AI agents might be taking too long.")
-        st.info("Try with a simpler idea or check your Ollama server.")
-        
-    except Exception as e:
-        st.error(f"❌ Unexpected error: {str(e)}")
-        if show_debug:
-            st.exception(e)
+
+polling = st.session_state.job_id is not None and st.session_state.job_status not in ("completed", "failed")
+
+@st.fragment(run_every=POLL_SECONDS if polling else None)
+def job_view():
+    """Re-runs on its own every POLL_SECONDS while the job is in flight; each run is one quick poll"""
+    state = st.session_state
+    if state.job_id is None:
+        return
+    if state.job_status not in ("completed", "failed"):
+        try:
+            poll_job()
+        except APIError as e:
+            st.error(f"❌ Backend error (Status {e.status_code}): {e.detail}")
+            return
+        except requests.exceptions.RequestException:
+            st.warning(f"⚠️ Lost contact with {API_URL}, retrying...")
+            return
+        if state.job_status in ("completed", "failed"):
+            # Full rerun so the fragment stops polling
+            st.rerun()
+
+    st.markdown("---")
+    done = len(state.stages)
+    st.progress(done / len(STAGES))
+    if state.job_status == "failed":
+        st.error(f"❌ Strategy generation failed: {state.job_error}")
+    elif state.job_status == "completed":
+        st.markdown('<div class="success-box"><h2>🎉 Your Personalized Strategy is Ready!</h2></div>', unsafe_allow_html=True)
+    else:
+        current = next((stage for stage in STAGES if stage not in state.stages), STAGES[-1])
+        st.text(f"Step {min(done + 1, len(STAGES))}/{len(STAGES)}: {AGENTS[current][0]} ({state.job_status})")
+
+    tabs = st.tabs([f"{'✅ ' if stage in state.stages else ''}{AGENTS[stage][1]}" for stage in STAGES])
+    for tab, stage in zip(tabs, STAGES):
+        with tab:
+            render_stage(stage, state.stages.get(stage))
+            if state.job_status == "completed":
+                later = len(STAGES) - STAGES.index(stage) - 1
+                hint = f" (and the {later} stage{'s' if later > 1 else ''} after it)" if later else ""
+                if st.button("🔄 Regenerate", key=f"regenerate_{stage}",
+                             help=f"Rerun only this stage{hint}, reusing the ones before it"):
+                    start_regeneration(stage)
+
+    if show_debug:
+        with st.expander("🔍 Debug Information"):
+            st.write("**Job:**", state.job_id, state.job_status)
+            st.write("**Output Lengths:**", {stage: len(content) for stage, content in state.stages.items()})
+            if state.result:
+                st.write("**Response Keys:**", list(state.result.keys()))
+
+    if state.job_status == "completed":
+        result = state.result
+        summary = result.get("summary")
+        if summary:
+            st.markdown("---")
+            st.subheader("📈 Execution Summary")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Feasibility", summary.get("feasibility", "Unknown"))
+            with col2:
+                st.metric("Execution Time", summary.get("execution_time", "Unknown"))
+            with col3:
+                st.metric("LLM Used", "Groq + Ollama" if summary.get("groq_used") else "Ollama Only")
+            st.info(f"**Competitive Edge:** {summary.get('competitive_edge', 'Unknown')}")
+
+        st.download_button(
+            label="📥 Download Complete Strategy",
+            data=strategy_markdown(state.job_inputs, state.stages, result),
+            file_name=f"ai_strategist_{state.job_inputs['team_strength']}_{int(time.time())}.md",
+            mime="text/markdown"
+        )
+
+job_view()
 
 # Footer
 st.markdown("---")
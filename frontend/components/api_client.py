@@ -0,0 +1,66 @@
+# frontend/components/api_client.py
+import os
+from typing import Any, Dict, List, Optional
+
+import requests
+
+API_URL = os.getenv("STRATEGIST_API_URL", "http://127.0.0.1:8000")
+# Every call is short: the workflow runs on the backend's workers, the UI only polls
+REQUEST_TIMEOUT = 15
+
+
+class APIError(Exception):
+    """Backend answered with an error status"""
+
+    def __init__(self, status_code: int, detail: Any):
+        super().__init__(f"{status_code}: {detail}")
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _check(response: requests.Response) -> Dict[str, Any]:
+    if response.status_code >= 400:
+        try:
+            detail = response.json().get("detail", response.text)
+        except ValueError:
+            detail = response.text
+        raise APIError(response.status_code, detail)
+    return response.json()
+
+
+def submit_job(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Queue a workflow; returns the job (id, status, estimated wait) right away"""
+    return _check(requests.post(f"{API_URL}/jobs", json=payload, timeout=REQUEST_TIMEOUT))
+
+
+def get_job(job_id: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """One poll of a job; `fields` limits which stage outputs come back"""
+    params = {"fields": ",".join(fields)} if fields else None
+    return _check(requests.get(f"{API_URL}/jobs/{job_id}", params=params, timeout=REQUEST_TIMEOUT))
+
+
+def list_strategies(limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+    """A page of stored strategy summaries, newest first"""
+    params = {"limit": limit, "offset": offset}
+    return _check(requests.get(f"{API_URL}/strategies", params=params, timeout=REQUEST_TIMEOUT))
+
+
+def get_strategy(strategy_id: str) -> Dict[str, Any]:
+    """A stored strategy with all of its stage outputs"""
+    return _check(requests.get(f"{API_URL}/strategies/{strategy_id}", timeout=REQUEST_TIMEOUT))
+
+
+def regenerate_stage(strategy_id: str, stage: str) -> Dict[str, Any]:
+    """Queue a rerun of `stage` and everything after it; returns the new job"""
+    return _check(requests.post(f"{API_URL}/strategies/{strategy_id}/regenerate",
+                                params={"stage": stage}, timeout=REQUEST_TIMEOUT))
+
+
+def refine_strategy(strategy_id: str, idea: str) -> Dict[str, Any]:
+    """Queue an edit of a stored strategy for a revised idea; returns the new job and the idea delta"""
+    return _check(requests.post(f"{API_URL}/strategies/{strategy_id}/refine",
+                                json={"idea": idea}, timeout=REQUEST_TIMEOUT))
+
+
+__all__ = ['API_URL', 'APIError', 'submit_job', 'get_job', 'list_strategies', 'get_strategy', 'regenerate_stage',
+           'refine_strategy']
@@ -0,0 +1,221 @@
+# main.py - Batch Strategy Runner
+"""
+Pre-compute strategies for a list of ideas without running the API or Streamlit.
+
+Usage:
+    python main.py ideas.csv
+    python main.py ideas.jsonl --workers 4 --executor process --output-dir outputs
+
+Input rows need `theme`, `idea`, `team_strength` and `hackathon_duration`
+(an optional `id` column keeps output names stable). Every finished item is
+appended to `<output-dir>/strategies.jsonl`, which doubles as the checkpoint:
+re-running the same command skips items that already succeeded. Results are
+also saved to the strategy history (GET /strategies) as `batch-<id>`.
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Dict, List, Set
+
+REQUIRED_FIELDS = ["theme", "idea", "team_strength", "hackathon_duration"]
+RESULTS_FILENAME = "strategies.jsonl"
+
+# One orchestrator per worker thread/process; they are not shared across workers
+_worker_state = threading.local()
+
+
+def _get_orchestrator():
+    """Build the orchestrator lazily, once per worker"""
+    if not hasattr(_worker_state, "orchestrator"):
+        from backend.orchestrator import AIStrategistOrchestrator
+        _worker_state.orchestrator = AIStrategistOrchestrator()
+    return _worker_state.orchestrator
+
+
+def item_id(item: Dict[str, Any]) -> str:
+    """Stable id for an input row: explicit `id` column or a hash of its inputs"""
+    if item.get("id"):
+        return str(item["id"])
+    key = json.dumps({field: item[field] for field in REQUIRED_FIELDS}, sort_keys=True)
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+
+def load_ideas(path: str) -> List[Dict[str, Any]]:
+    """Read ideas from a .csv or .jsonl file"""
+    if path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+    elif path.lower().endswith((".jsonl", ".ndjson")):
+        rows = []
+        with open(path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"⚠️ Skipping line {line_no}: not valid JSON")
+                    continue
+                if not isinstance(row, dict):
+                    print(f"⚠️ Skipping line {line_no}: expected a JSON object, got {type(row).__name__}")
+                    continue
+                rows.append(row)
+    else:
+        raise ValueError(f"Unsupported input format: {path} (expected .csv or .jsonl)")
+
+    ideas = []
+    for line_no, row in enumerate(rows, start=1):
+        missing = [field for field in REQUIRED_FIELDS if not str(row.get(field, "")).strip()]
+        if missing:
+            print(f"⚠️ Skipping row {line_no}: missing {missing}")
+            continue
+        try:
+            row["hackathon_duration"] = int(row["hackathon_duration"])
+        except (TypeError, ValueError):
+            print(f"⚠️ Skipping row {line_no}: hackathon_duration {row['hackathon_duration']!r} is not a whole number")
+            continue
+        row["id"] = item_id(row)
+        ideas.append(row)
+    return ideas
+
+
+def load_checkpoint(results_path: str) -> Set[str]:
+    """Ids of items that already completed successfully"""
+    done = set()
+    if not os.path.exists(results_path):
+        return done
+    with open(results_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A crash can leave a partial last line; that item simply reruns
+                continue
+            if record.get("success"):
+                done.add(record["id"])
+            else:
+                done.discard(record.get("id"))
+    return done
+
+
+def run_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one idea through the full workflow (executes inside a worker)"""
+    result = _get_orchestrator().run_strategy_workflow(
+        theme=item["theme"],
+        idea=item["idea"],
+        team_strength=item["team_strength"],
+        hackathon_duration=item["hackathon_duration"]
+    )
+    result["id"] = item["id"]
+    return result
+
+
+def format_strategy_markdown(result: Dict[str, Any]) -> str:
+    """Render a result in the same layout as the Streamlit download"""
+    summary = result.get("summary", {})
+    return f"""# AI Strategist Output
+
+**Theme:** {result.get("theme", "N/A")}
+**Idea:** {result.get("original_idea", "N/A")}
+**Team Strength:** {result.get("team_strength", "N/A")}
+**Hackathon Duration:** {result.get("hackathon_duration", "N/A")} hours
+
+## Market Research
+{result.get("research", "N/A")}
+
+## Risk Analysis
+{result.get("critical_analysis", "N/A")}
+
+## MVP Plan
+{result.get("mvp_plan", "N/A")}
+
+## Pitch Strategy
+{result.get("pitch", "N/A")}
+
+## Execution Summary
+- **Feasibility:** {summary.get("feasibility", "Unknown")}
+- **Competitive Edge:** {summary.get("competitive_edge", "Unknown")}
+- **Execution Time:** {summary.get("execution_time", "Unknown")}
+- **LLM Configuration:** {result.get("llm_config", {})}
+"""
+
+
+def write_result(result: Dict[str, Any], output_dir: str, results_file) -> None:
+    """Write the markdown report and append the checkpoint line"""
+    if result.get("success"):
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        report_path = os.path.join(output_dir, f"strategy_report_{timestamp}_{result['id']}.md")
+        with open(report_path, "w", encoding="utf-8") as f:
+            f.write(format_strategy_markdown(result))
+
+    results_file.write(json.dumps(result, default=str) + "\n")
+    results_file.flush()
+    os.fsync(results_file.fileno())
+
+
+def run_batch(input_path: str, output_dir: str, workers: int, executor: str) -> int:
+    """Process every pending idea; returns the number of failed items"""
+    os.makedirs(output_dir, exist_ok=True)
+    results_path = os.path.join(output_dir, RESULTS_FILENAME)
+
+    ideas = load_ideas(input_path)
+    done = load_checkpoint(results_path)
+    pending = [item for item in ideas if item["id"] not in done]
+    print(f"📋 {len(ideas)} ideas loaded, {len(ideas) - len(pending)} already done, {len(pending)} pending")
+    if not pending:
+        return 0
+
+    from backend.result_store import create_result_store
+
+    history = create_result_store()
+    pool_cls = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    failures = 0
+    batch_start = time.time()
+
+    with open(results_path, "a", encoding="utf-8") as results_file, pool_cls(max_workers=workers) as pool:
+        futures = {pool.submit(run_item, item): item for item in pending}
+        for completed, future in enumerate(as_completed(futures), start=1):
+            item = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"success": False, "error": str(e), "error_type": type(e).__name__}
+            result.setdefault("id", item["id"])
+
+            write_result(result, output_dir, results_file)
+            history.save(f"batch-{item['id']}", item, result)
+            status = "✅" if result.get("success") else "❌"
+            if not result.get("success"):
+                failures += 1
+            print(f"{status} [{completed}/{len(pending)}] {item['id']} ({item['team_strength']}, {item['hackathon_duration']}h)")
+
+    print(f"🏁 Batch finished in {time.time() - batch_start:.1f}s with {failures} failure(s)")
+    return failures
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the AI Strategist workflow over a batch of ideas")
+    parser.add_argument("input", help="CSV or JSONL file of ideas")
+    parser.add_argument("--output-dir", default="outputs", help="Directory for markdown reports and strategies.jsonl")
+    parser.add_argument("--workers", type=int, default=2, help="Number of concurrent workflows")
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread",
+                        help="Run workflows in threads (LLM-bound) or processes (CPU-bound post-processing)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    failures = run_batch(args.input, args.output_dir, args.workers, args.executor)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""Offline checks for backend.sections and backend.quality_gate: section splitting, early stop and grading"""
+from backend.quality_gate import grade_stage, repair_context, required_sections
+from backend.sections import SectionStreamMonitor, check_sections, template_sections
+
+
+def bold_output(stage: str = "research") -> str:
+    """A complete answer to a bold-style template that writes its fields as "**Field:**" lines"""
+    lines = []
+    for section in required_sections(stage, "AI/ML", 24):
+        lines.append(section.heading)
+        for label in section.fields:
+            lines += [f"**{label}:**", "- " + "specific detail " * 8]
+    return "\n".join(lines) + "\n"
+
+
+def feed_lines(monitor: SectionStreamMonitor, text: str) -> None:
+    for line in text.splitlines(True):
+        monitor.feed(line)
+
+
+def test_bold_fields_are_not_sections():
+    document = bold_output()
+    required = required_sections("research", "AI/ML", 24)
+    assert all(check.ok for check in check_sections(document, required))
+
+    monitor = SectionStreamMonitor(required)
+    feed_lines(monitor, document)
+    assert not monitor.done, "stopped inside the last section"
+    feed_lines(monitor, "## Next Steps\nGood luck!\n")
+    assert monitor.done and monitor.text == document.rstrip()
+
+
+def test_open_markdown_section_is_not_cut():
+    required = template_sections("**OUTPUT TEMPLATE:**\n## A\n**F**: x\n## B\n**G**: y\n")
+    document = ("## A\n**F**: " + "word " * 30 + "\n## B\n**G**: " + "word " * 30 + "\n"
+                + "".join(f"- bullet {i}\n" for i in range(10)))
+    monitor = SectionStreamMonitor(required)
+    feed_lines(monitor, document)
+    assert not monitor.done and monitor.text.count("bullet") == 10
+
+
+def test_complete_bold_outputs_pass_the_gate():
+    for stage in ("research", "critical_analysis"):
+        grade = grade_stage(stage, bold_output(stage), "AI/ML", 24)
+        assert grade.score == 1.0 and not grade.weak_sections, grade
+
+
+def test_repair_context_quotes_stage_inputs():
+    outputs = {"research": "R-TEXT", "critical_analysis": "C-TEXT", "mvp_plan": "M-TEXT"}
+    context = repair_context("mvp_plan", "Health", "Triage app", "AI/ML", 24, outputs)
+    assert "R-TEXT" in context and "C-TEXT" in context and "M-TEXT" not in context
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_"):
+            check()
+            print(f"✅ {name}")